@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Display pipeline benchmark for the Image Label Tool.
+
+Generates synthetic camera-sized JPEGs and reports:
+
+decode suite - per-image latency of the fitted-mode display path:
+  - full:    full-resolution decode + copy + LANCZOS thumbnail (previous behaviour)
+  - reduced: DCT-scaled decode (decode_image_file with fit_size) + LANCZOS thumbnail
+
+resample suite - ms per displayed frame for every resampling backend
+(RESAMPLERS) at fitted size and at several zoom levels of the viewport
+
+photo suite - Tk cost per navigation of putting a fitted frame on the canvas:
+  - new:    a new ImageTk.PhotoImage per image (previous behaviour)
+  - reused: PhotoSlot pasting into the persistent photo
+  Needs a display; skipped when Tk cannot start. Use --canvas 1920x1080 for a
+  full-HD canvas.
+
+Usage:
+    python benchmark_display.py [--suite decode|resample|photo|all] [--runs N] [--canvas WIDTHxHEIGHT]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (decode_image_file, fit_display_size, resample_image, PhotoSlot, RESAMPLERS,
+                              DISPLAY_RESAMPLERS)
+
+# Zoom levels measured by the resample suite ("fit" = fitted to the canvas)
+ZOOM_LEVELS = ("fit", 0.25, 0.5, 1.0, 2.0)
+
+# Typical sensor sizes of the line cameras
+SAMPLE_SIZES = {
+    "5 MP": (2592, 1944),
+    "20 MP": (5472, 3648),
+}
+
+
+def make_sample_jpeg(folder, name, size):
+    """Write a textured JPEG so decode cost is comparable to real parcel images"""
+    width, height = size
+    rng = np.random.default_rng(42)
+    # Smooth gradient plus noise - compresses like a real scene rather than a flat fill
+    gradient = np.linspace(0, 200, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    noise = rng.normal(0, 6, (height, width)).astype(np.float32)
+    gray = np.clip(gradient + noise, 0, 255).astype(np.uint8)
+    rgb = np.stack([gray, np.roll(gray, 7, axis=1), np.roll(gray, 13, axis=0)], axis=2)
+    path = os.path.join(folder, f"{name}.jpg")
+    Image.fromarray(rgb).save(path, quality=90)
+    return path
+
+
+def time_call(func, runs):
+    """Return the median wall time of func() in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings)
+
+
+def fit_full_decode(path, canvas_size):
+    """Previous fitted-mode path: decode everything, then shrink"""
+    img = Image.open(path)
+    img.load()
+    display_img = img.copy()
+    display_img.thumbnail(canvas_size, Image.Resampling.LANCZOS)
+    return display_img
+
+
+def fit_reduced_decode(path, canvas_size):
+    """Reduced-resolution path: let libjpeg skip the resolution we do not show"""
+    img, _, _ = decode_image_file(path, fit_size=canvas_size)
+    display_img = img.copy()
+    display_img.thumbnail(canvas_size, Image.Resampling.LANCZOS)
+    return display_img
+
+
+def run_decode_benchmark(folder, canvas_size, runs):
+    """Compare full vs reduced fitted-mode decode for every sample size"""
+    print(f"Fitted display decode, canvas {canvas_size[0]}x{canvas_size[1]}, median of {runs} runs")
+    print(f"{'sample':<8} {'full (ms)':>10} {'reduced (ms)':>13} {'speedup':>8}")
+    for label, size in SAMPLE_SIZES.items():
+        path = make_sample_jpeg(folder, label.replace(" ", ""), size)
+        full_ms = time_call(lambda: fit_full_decode(path, canvas_size), runs)
+        reduced_ms = time_call(lambda: fit_reduced_decode(path, canvas_size), runs)
+        print(f"{label:<8} {full_ms:>10.1f} {reduced_ms:>13.1f} {full_ms / reduced_ms:>7.1f}x")
+
+
+def viewport_box(source_size, canvas_size, zoom):
+    """Source region shown by a canvas-sized viewport centred on the image at zoom"""
+    width = min(source_size[0], canvas_size[0] / zoom)
+    height = min(source_size[1], canvas_size[1] / zoom)
+    left = (source_size[0] - width) / 2
+    top = (source_size[1] - height) / 2
+    return (left, top, left + width, top + height)
+
+
+def run_resample_benchmark(folder, canvas_size, runs):
+    """Report ms per frame of every resampling backend for each sample size and zoom level"""
+    print(f"Resampling per frame, canvas {canvas_size[0]}x{canvas_size[1]}, median of {runs} runs")
+    modes = ", ".join(f"{mode}={shrink} (shrink) / {enlarge} (enlarge)"
+                      for mode, (shrink, enlarge) in DISPLAY_RESAMPLERS.items())
+    print(f"Display modes: {modes}")
+    header = f"{'sample':<8} {'zoom':>5} " + " ".join(f"{name:>20}" for name in RESAMPLERS)
+    print(header)
+    for label, size in SAMPLE_SIZES.items():
+        path = make_sample_jpeg(folder, label.replace(" ", ""), size)
+        img = Image.open(path)
+        img.load()
+        for zoom in ZOOM_LEVELS:
+            if zoom == "fit":
+                frame_size, box = fit_display_size(img.size, canvas_size), None
+            else:
+                box = viewport_box(img.size, canvas_size, zoom)
+                frame_size = (max(1, round((box[2] - box[0]) * zoom)), max(1, round((box[3] - box[1]) * zoom)))
+            timings = [time_call(lambda: resample_image(img, frame_size, box=box, mode=name), runs)
+                       for name in RESAMPLERS]
+            print(f"{label:<8} {str(zoom):>5} " + " ".join(f"{ms:>17.1f} ms" for ms in timings))
+
+
+def run_photo_benchmark(folder, canvas_size, runs):
+    """Compare a new PhotoImage per navigation with repainting a persistent one"""
+    import tkinter as tk
+    from PIL import ImageTk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Photo suite skipped, Tk cannot start: {e}")
+        return
+    root.withdraw()
+    canvas = tk.Canvas(root, width=canvas_size[0], height=canvas_size[1])
+    canvas.pack()
+    navigations = 20  # Images stepped through per timed run
+    print(f"Tk photo per navigation, canvas {canvas_size[0]}x{canvas_size[1]}, "
+          f"median of {runs} runs x {navigations} images")
+    print(f"{'sample':<8} {'mode':>4} {'new (ms)':>9} {'reused (ms)':>12} {'speedup':>8}")
+    try:
+        for label, size in SAMPLE_SIZES.items():
+            path = make_sample_jpeg(folder, label.replace(" ", ""), size)
+            img = Image.open(path)
+            img.load()
+            fitted = resample_image(img, fit_display_size(img.size, canvas_size))
+            for mode in ("RGB", "L"):
+                # Two alternating frames, like consecutive images of one camera
+                frames = [fitted.convert(mode), fitted.transpose(Image.Transpose.FLIP_LEFT_RIGHT).convert(mode)]
+                holder = {}
+
+                def show(photo):
+                    holder['photo'] = photo  # Keep it alive like ImageLabelTool.tk_img
+                    canvas.delete("all")
+                    canvas.create_image(canvas_size[0] // 2, canvas_size[1] // 2, anchor="center", image=photo)
+                    root.update_idletasks()
+
+                def navigate_new():
+                    for i in range(navigations):
+                        show(ImageTk.PhotoImage(frames[i % 2]))
+
+                slot = PhotoSlot()
+
+                def navigate_reused():
+                    for i in range(navigations):
+                        show(slot.show(frames[i % 2]))
+
+                new_ms = time_call(navigate_new, runs) / navigations
+                reused_ms = time_call(navigate_reused, runs) / navigations
+                print(f"{label:<8} {mode:>4} {new_ms:>9.2f} {reused_ms:>12.2f} {new_ms / reused_ms:>7.1f}x")
+    finally:
+        root.destroy()
+
+
+def parse_canvas(value):
+    width, height = value.lower().split("x")
+    return (int(width), int(height))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the image display pipeline")
+    parser.add_argument("--suite", choices=("decode", "resample", "photo", "all"), default="all",
+                        help="which measurements to run")
+    parser.add_argument("--runs", type=int, default=5, help="timed runs per measurement")
+    parser.add_argument("--canvas", type=parse_canvas, default=(900, 700),
+                        help="canvas size used for fitted display, e.g. 900x700")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        if args.suite in ("decode", "all"):
+            run_decode_benchmark(folder, args.canvas, args.runs)
+        if args.suite == "all":
+            print()
+        if args.suite in ("resample", "all"):
+            run_resample_benchmark(folder, args.canvas, args.runs)
+        if args.suite == "all":
+            print()
+        if args.suite in ("photo", "all"):
+            run_photo_benchmark(folder, args.canvas, args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 import os
 import csv
+import io
+import json
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageTk
@@ -11,7 +13,24 @@ import time
 import cv2
 import numpy as np
 import logging
+import math
+import bisect
+import functools
+import heapq
+import hashlib
+import shutil
+import struct
+import sys
+import tarfile
+import zipfile
+import zlib
 import multiprocessing
+import concurrent.futures
+import ctypes
+import ctypes.util
+import queue
+import select
+from collections import OrderedDict
 
 # Application version
 VERSION = "3.0.0"
@@ -35,6 +54,2830 @@ except ImportError:
 
 LABELS = ["(Unclassified)", "no label", "read failure", "incomplete", "unreadable"]
 
+# Decoded image cache settings
+IMAGE_CACHE_BUDGET_MB = 512  # Memory budget for decoded images kept in RAM
+PREFETCH_RADIUS = 3  # Number of images decoded ahead of and behind the current image
+
+
+def get_file_stamp(path):
+    """Return a (mtime_ns, size) stamp used to detect on-disk changes, or None if unavailable.
+
+    Paths inside a zip/tar archive get the stamp of the member from the archive index.
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        member = split_archive_member(path)
+        if member is None:
+            return None
+        try:
+            return get_archive_source(member[0]).member_stamp(member[1])
+        except (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile):
+            return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+# Reduction factors supported by libjpeg DCT scaling (Image.draft)
+DECODE_REDUCTIONS = (8, 4, 2, 1)
+
+
+def choose_decode_reduction(source_size, fit_size):
+    """Pick the largest power-of-two reduction that still covers the fitted display size.
+
+    fit_size is the (width, height) box the image is shrunk into; None means the
+    caller needs full resolution (1:1 / zoom mode).
+    """
+    if not fit_size:
+        return 1
+    source_width, source_height = source_size
+    if source_width <= 0 or source_height <= 0:
+        return 1
+    scale = min(fit_size[0] / source_width, fit_size[1] / source_height)
+    for reduction in DECODE_REDUCTIONS:
+        if scale * reduction <= 1.0:
+            return reduction
+    return 1
+
+
+def normalize_monochrome(img):
+    """Return img as a single-channel mode L image when the source itself is single-channel.
+
+    Monochrome camera frames often arrive as grayscale-palette BMP/GIF; keeping them
+    as L cuts memory and per-pixel work by 3x. RGB images stay RGB even when they
+    look gray: small colored marks must never be thrown away by a guess.
+    """
+    if img.mode == "P" and "transparency" not in img.info:
+        palette = img.getpalette() or []
+        if palette and all(palette[i] == palette[i + 1] == palette[i + 2] for i in range(0, len(palette) - 2, 3)):
+            return img.convert("L")
+    return img
+
+
+# Supported image files (lower-case extensions)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".pgm")
+HIGH_BIT_DEPTH_EXTENSIONS = (".tif", ".tiff", ".pgm")  # Files the display window (window/level) applies to
+HIGH_BIT_DEPTH_MODES = ("I;16", "I;16L", "I;16B", "I;16N", "I", "F")
+_RAW_UINT16_DTYPES = {"I;16": "<u2", "I;16L": "<u2", "I;16B": ">u2", "I;16N": "=u2"}
+AUTO_WINDOW_PERCENTILES = (0.5, 99.5)  # Auto window/level clips this share of the darkest/brightest pixels
+
+
+def is_image_file(filename):
+    return filename.lower().endswith(IMAGE_EXTENSIONS)
+
+
+# Zip/tar archives opened like image folders
+ARCHIVE_EXTENSIONS = (".zip", ".tar")  # Compressed tarballs have no random access and are not supported
+ARCHIVE_SIDECAR_SUFFIX = "_labeltool"  # Directory next to an archive for its index, CSVs and exports
+ARCHIVE_INDEX_NAME = "archive_index.json"
+_TAR_MEMBER = -1  # Member "compression" of tar entries: the offset points straight at the data
+
+
+def archive_sidecar_folder(archive_path):
+    """Writable directory next to an archive that stands in for the image folder on disk"""
+    return os.path.splitext(archive_path)[0] + ARCHIVE_SIDECAR_SUFFIX
+
+
+def is_archive_file(path):
+    return path.lower().endswith(ARCHIVE_EXTENSIONS) and os.path.isfile(path)
+
+
+class ArchiveSource:
+    """Random-access reader for the members of a zip or uncompressed tar archive.
+
+    The member table (name -> offset, stored size, compression, size, mtime) is read
+    from the archive once and cached as ARCHIVE_INDEX_NAME in the sidecar folder,
+    keyed by the archive's stamp, so reopening a large archive only reads that file.
+    Members are read with a seek and a read (plus inflate for deflated zip entries);
+    nothing is extracted to disk.
+    """
+
+    INDEX_VERSION = 1
+
+    def __init__(self, archive_path):
+        self.path = os.path.normpath(archive_path)
+        self.stamp = get_file_stamp(self.path)
+        self.index_path = os.path.join(archive_sidecar_folder(self.path), ARCHIVE_INDEX_NAME)
+        self.members = {}  # name -> [offset, stored_size, compression, size, mtime_ns]
+        self._lock = threading.Lock()
+        self._file = None
+        self._zip = None  # zipfile.ZipFile, only for compression methods read through zipfile
+        if not self._load_index():
+            self._build_index()
+            self._save_index()
+
+    def names(self):
+        return list(self.members)
+
+    def member_stamp(self, name):
+        """(mtime_ns, size) of a member, like get_file_stamp for plain files"""
+        entry = self.members[name]
+        return (entry[4], entry[3])
+
+    def read(self, name):
+        """Return the uncompressed bytes of a member"""
+        offset, stored_size, compression, size, _ = self.members[name]
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "rb")
+            if compression == _TAR_MEMBER:
+                self._file.seek(offset)
+                return self._file.read(size)
+            if compression not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                if self._zip is None:
+                    self._zip = zipfile.ZipFile(self.path)
+                return self._zip.read(name)
+            # offset is the local file header; its name/extra lengths give the data start
+            self._file.seek(offset)
+            header = self._file.read(30)
+            if header[:4] != b"PK\x03\x04":
+                raise OSError(f"Bad local header for {name} in {self.path}")
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            self._file.seek(offset + 30 + name_length + extra_length)
+            data = self._file.read(stored_size)
+        if compression == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -15)
+        return data
+
+    def close(self):
+        with self._lock:
+            for handle in (self._file, self._zip):
+                if handle is not None:
+                    handle.close()
+            self._file = None
+            self._zip = None
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != self.INDEX_VERSION or tuple(data.get("archive_stamp") or ()) != self.stamp:
+            return False
+        self.members = data.get("members", {})
+        return True
+
+    def _build_index(self):
+        members = {}
+        if zipfile.is_zipfile(self.path):
+            with zipfile.ZipFile(self.path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir() or info.flag_bits & 0x1:
+                        continue  # Directories and encrypted members
+                    mtime_ns = int(time.mktime(info.date_time + (0, 0, -1)) * 1e9)
+                    members[info.filename] = [info.header_offset, info.compress_size, info.compress_type,
+                                              info.file_size, mtime_ns]
+        else:
+            # "r:" refuses compressed tarballs, which cannot be read at random offsets
+            with tarfile.open(self.path, "r:") as archive:
+                for info in archive:
+                    if info.isfile():
+                        members[info.name] = [info.offset_data, info.size, _TAR_MEMBER, info.size,
+                                              int(info.mtime * 1e9)]
+        # Names that would leave the archive "folder" are not offered
+        self.members = {name: entry for name, entry in members.items()
+                        if not os.path.isabs(name) and ".." not in name.replace("\\", "/").split("/")}
+
+    def _save_index(self):
+        data = {"version": self.INDEX_VERSION, "archive_stamp": list(self.stamp or ()), "members": self.members}
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            temp_path = self.index_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            # Read-only location: the index is simply rebuilt next time
+            print(f"Could not cache archive index for {self.path}: {e}")
+
+
+_archive_sources = {}  # archive path -> ArchiveSource (per process)
+_archive_sources_lock = threading.Lock()
+
+
+def get_archive_source(archive_path):
+    """Return the (shared) ArchiveSource of archive_path, reopening it when the archive changed"""
+    archive_path = os.path.normpath(archive_path)
+    with _archive_sources_lock:
+        source = _archive_sources.get(archive_path)
+        if source is None or source.stamp != get_file_stamp(archive_path):
+            if source is not None:
+                source.close()
+            source = _archive_sources[archive_path] = ArchiveSource(archive_path)
+        return source
+
+
+def split_archive_member(path):
+    """Return (archive_path, member_name) when path points into a zip/tar archive, else None"""
+    lowered = path.lower()
+    for extension in ARCHIVE_EXTENSIONS:
+        start = 0
+        while True:
+            position = lowered.find(extension, start)
+            if position == -1:
+                break
+            end = position + len(extension)
+            if end < len(path) and path[end] in (os.sep, "/") and is_archive_file(path[:end]):
+                return path[:end], path[end + 1:].replace(os.sep, "/")
+            start = end
+    return None
+
+
+def read_file_bytes(path):
+    """Bytes of an image file or of an archive member"""
+    member = split_archive_member(path)
+    if member is not None:
+        return get_archive_source(member[0]).read(member[1])
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def open_image_file(path):
+    """Image.open for plain files and archive members alike"""
+    member = split_archive_member(path)
+    if member is not None:
+        return Image.open(io.BytesIO(get_archive_source(member[0]).read(member[1])))
+    return Image.open(path)
+
+
+def copy_image_file(source_path, destination_path):
+    """shutil.copy2 that also extracts a single archive member (keeping its time stamp)"""
+    member = split_archive_member(source_path)
+    if member is None:
+        shutil.copy2(source_path, destination_path)
+        return
+    source = get_archive_source(member[0])
+    with open(destination_path, "wb") as f:
+        f.write(source.read(member[1]))
+    mtime_ns = source.member_stamp(member[1])[0]
+    os.utime(destination_path, ns=(mtime_ns, mtime_ns))
+
+
+def list_image_paths(folder):
+    """Normalized paths of the image files in folder, which may also be a zip/tar archive (not persisted)"""
+    index = FolderIndex(folder)
+    index.refresh()
+    return index.paths()
+
+
+# Snapshot of a folder's image files, persisted in the sidecar cache next to the revision CSVs
+FOLDER_INDEX_NAME = "folder_index.json"  # Inside THUMBNAIL_CACHE_DIR, so saving it leaves the folder mtime alone
+FOLDER_INDEX_VERSION = 1
+FOLDER_MTIME_SLACK_NS = 2 * 10 ** 9  # Directory mtimes this recent may still change within the same tick
+
+
+class FolderIndex:
+    """Image files of one folder with their size and mtime, listed with os.scandir.
+
+    The snapshot (name -> [size, mtime_ns]) is persisted to index_path. refresh()
+    does not list the folder at all while the directory's own mtime is unchanged,
+    since adding, removing or renaming a file always changes it. Otherwise the
+    directory entries are diffed against the snapshot, and the size and mtime of
+    every listed file are taken from its DirEntry, so files overwritten in place
+    are picked up by the next listing. Zip/tar archives are served from their
+    ArchiveSource member table. A ContentFingerprinter extends entries with a
+    content digest and a decode validity flag, valid for the size and mtime
+    stored next to them; an entry whose file changed loses its fingerprint.
+    """
+
+    def __init__(self, folder, index_path=None):
+        self.folder = os.path.normpath(folder)
+        self.index_path = index_path
+        self.entries = {}  # name -> [size, mtime_ns] or [size, mtime_ns, digest, valid]
+        self.scans = 0  # Directory listings actually performed
+        self._folder_mtime = None  # Directory mtime the snapshot is known to match
+        self._lock = threading.Lock()  # Guards entries: the fingerprinter updates and saves from its own thread
+        self._save_lock = threading.Lock()  # One writer of index_path at a time
+        self._load()
+
+    def _load(self):
+        if self.index_path is None:
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != FOLDER_INDEX_VERSION or data.get("folder") != self.folder:
+            return
+        self.entries = data.get("entries", {})
+        self._folder_mtime = data.get("folder_mtime")
+
+    def save(self):
+        if self.index_path is None:
+            return
+        with self._lock:
+            # A snapshot: add() may insert entries while the file is being written
+            entries = {name: list(entry) for name, entry in self.entries.items()}
+            folder_mtime = self._folder_mtime
+        data = {"version": FOLDER_INDEX_VERSION, "folder": self.folder, "folder_mtime": folder_mtime,
+                "entries": entries}
+        temp_path = self.index_path + ".tmp"
+        try:
+            with self._save_lock:
+                os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"Could not save folder index {self.index_path}: {e}")
+
+    def path_of(self, name):
+        return os.path.normpath(os.path.join(self.folder, name))
+
+    def paths(self):
+        """Normalized paths of all indexed images (unsorted)"""
+        return [self.path_of(name) for name in self.entries]
+
+    def names(self):
+        return list(self.entries)
+
+    def _entry(self, path):
+        return self.entries.get(os.path.relpath(path, self.folder).replace(os.sep, "/"))
+
+    def stat(self, path):
+        """(mtime_ns, size) of path as last seen by the index, or None"""
+        entry = self._entry(path)
+        return None if entry is None else (entry[1], entry[0])
+
+    def fingerprint(self, path):
+        """((mtime_ns, size), digest, valid) recorded for path, or None if it was not fingerprinted yet"""
+        entry = self._entry(path)
+        if entry is None or len(entry) < 4:
+            return None
+        return (entry[1], entry[0]), entry[2], entry[3]
+
+    def set_fingerprint(self, path, stamp, digest, valid):
+        """Record the fingerprint of the file version identified by stamp; False if path is not indexed"""
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return False
+            # Updated in place: a concurrent refresh() carries the same list over to its new snapshot
+            # (unless the file changed, and then this fingerprint is stale anyway)
+            entry[:] = [stamp[1], stamp[0], digest, valid]
+        return True
+
+    def corrupted_paths(self):
+        """Paths whose last fingerprint found an image that does not decode"""
+        with self._lock:
+            names = [name for name, entry in self.entries.items() if len(entry) >= 4 and not entry[3]]
+        return [self.path_of(name) for name in names]
+
+    def add(self, paths):
+        """Record files reported by a FolderWatcher without listing the folder; return those now indexed.
+
+        The snapshot is not saved here: the directory mtime changed with the new
+        files, so the next refresh() lists the folder once and saves.
+        """
+        indexed = []
+        for path in paths:
+            name = os.path.relpath(path, self.folder)
+            if os.sep in name or name.startswith("..") or not is_image_file(name):
+                continue
+            if name not in self.entries:
+                try:
+                    stat_result = os.stat(path)
+                except OSError:
+                    continue
+                with self._lock:
+                    self.entries.setdefault(name, [stat_result.st_size, stat_result.st_mtime_ns])
+            indexed.append(self.path_of(name))
+        return indexed
+
+    def refresh(self):
+        """Bring the snapshot up to date with the folder; return (added, removed) paths"""
+        if is_archive_file(self.folder):
+            source = get_archive_source(self.folder)
+            if self._folder_mtime == list(source.stamp):
+                return [], []
+            entries = {}
+            for name in source.names():
+                if is_image_file(name):
+                    mtime_ns, size = source.member_stamp(name)
+                    entries[name] = [size, mtime_ns]
+            return self._apply(entries, list(source.stamp))
+
+        try:
+            folder_mtime = os.stat(self.folder).st_mtime_ns
+        except OSError:
+            return [], []
+        if folder_mtime == self._folder_mtime:
+            return [], []
+        entries = {}
+        modified = False
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                name = entry.name
+                if not is_image_file(name):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat_result = entry.stat()
+                except OSError:
+                    continue
+                known = self.entries.get(name)
+                if known is not None and known[:2] == [stat_result.st_size, stat_result.st_mtime_ns]:
+                    entries[name] = known  # Keeps its fingerprint
+                    continue
+                # New, or overwritten in place since the last listing
+                modified = modified or known is not None
+                entries[name] = [stat_result.st_size, stat_result.st_mtime_ns]
+        self.scans += 1
+        # A directory modified just now may change again within the same mtime tick
+        recent = time.time_ns() - folder_mtime < FOLDER_MTIME_SLACK_NS
+        return self._apply(entries, None if recent else folder_mtime, modified)
+
+    def _apply(self, entries, folder_mtime, modified=False):
+        added = [name for name in entries if name not in self.entries]
+        removed = [name for name in self.entries if name not in entries]
+        changed = added or removed or modified or folder_mtime != self._folder_mtime
+        with self._lock:
+            self.entries = entries
+            self._folder_mtime = folder_mtime
+        if changed:
+            self.save()
+        return [self.path_of(name) for name in added], [self.path_of(name) for name in removed]
+
+
+# Folder watching for monitoring mode
+WATCH_POLL_INTERVAL_S = 1.0  # Listing interval of the polling backend
+WATCH_SETTLE_S = 2.0  # Polled files must keep their size and mtime this long before they count as written
+WATCH_BATCH_MS = 100  # Files arriving this close together are handled as one batch on the Tk thread
+FOLDER_LOADING_RETRY_MS = 250  # Monitoring started while a folder loads begins once it is loaded
+WATCH_NETWORK_FILESYSTEMS = ("cifs", "smb3", "smbfs", "nfs", "nfs4", "fuse.sshfs", "9p")  # inotify misses remote writes
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (followed by the NUL-padded name)
+
+
+def filesystem_type(path):
+    """Type of the Linux filesystem path is on (e.g. "ext4", "cifs"), from /proc/mounts; None elsewhere"""
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return None
+    path = os.path.realpath(path)
+    best, fs_type = "", None
+    for mount_point, kind in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        inside = path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+        if inside and len(mount_point) > len(best):
+            best, fs_type = mount_point, kind
+    return fs_type
+
+
+class FolderWatcher:
+    """Reports image files that finished arriving in a folder, on the events queue.
+
+    On Linux the folder is watched with inotify (libc through ctypes) for
+    IN_CLOSE_WRITE and IN_MOVED_TO: a file is reported when its writer closes it or
+    when it is renamed into the folder, so a half-written image never shows up.
+    On network mounts (where inotify does not see writes made by other machines),
+    on other systems, or when no inotify watch can be added, the folder is polled
+    instead and a new file is only reported once its size and mtime stayed the
+    same for settle seconds.
+
+    Events are paths; None means events were lost and the folder should be listed
+    again. notify, if given, is called from the watcher thread after events were
+    queued. Files present when the watcher starts are not reported.
+    """
+
+    def __init__(self, folder, notify=None, backend=None, poll_interval=WATCH_POLL_INTERVAL_S,
+                 settle=WATCH_SETTLE_S):
+        self.folder = os.path.normpath(folder)
+        self.events = queue.Queue()
+        self.notify = notify
+        self.poll_interval = poll_interval
+        self.settle = settle
+        self._stop_event = threading.Event()
+        self._fd = None
+        self._wake = None
+        self._fd_lock = threading.Lock()  # stop() may run more than once, from different callers
+        if backend in (None, "inotify"):
+            self._fd = self._open_inotify()
+        if self._fd is not None:
+            self.backend = "inotify"
+            self._wake = os.pipe()
+            target = self._read_inotify
+        else:
+            self.backend = "polling"
+            self._known = self._list_names() or set()
+            target = self._poll
+        self._thread = threading.Thread(target=target, name="FolderWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        with self._fd_lock:
+            if self._wake is not None and self._thread.is_alive():
+                os.write(self._wake[1], b"x")
+        self._thread.join(timeout=2)
+        if not self._thread.is_alive():
+            self._close_fds()
+
+    def _close_fds(self):
+        """Close the inotify and wake pipe fds; only stop() does, once the reader thread is gone"""
+        with self._fd_lock:
+            for fd in (self._fd, *(self._wake or ())):
+                if fd is not None:
+                    os.close(fd)
+            self._fd = None
+            self._wake = None
+
+    def _path_of(self, name):
+        return os.path.normpath(os.path.join(self.folder, name))
+
+    def _emit(self, events):
+        if not events:
+            return
+        for event in events:
+            self.events.put(event)
+        if self.notify is not None:
+            self.notify()
+
+    def _open_inotify(self):
+        if not sys.platform.startswith("linux") or filesystem_type(self.folder) in WATCH_NETWORK_FILESYSTEMS:
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(self.folder), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            # e.g. fs.inotify.max_user_watches reached
+            print(f"Cannot watch {self.folder} with inotify ({os.strerror(ctypes.get_errno())}), polling instead")
+            os.close(fd)
+            return None
+        return fd
+
+    def _read_inotify(self):
+        try:
+            while not self._stop_event.is_set():
+                ready, _, _ = select.select([self._fd, self._wake[0]], [], [])
+                if self._fd not in ready:
+                    continue
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                events = []
+                offset = 0
+                while offset + _INOTIFY_EVENT.size <= len(data):
+                    _, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += _INOTIFY_EVENT.size
+                    name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                    offset += length
+                    if mask & _IN_Q_OVERFLOW:
+                        events.append(None)
+                    elif mask & _IN_IGNORED:
+                        # The folder itself was removed or unmounted
+                        self._stop_event.set()
+                    elif name and not mask & _IN_ISDIR and is_image_file(name):
+                        events.append(self._path_of(name))
+                self._emit(events)
+        except OSError as e:
+            print(f"Watching {self.folder} failed: {e}")
+            self._emit([None])
+
+    def _list_names(self):
+        try:
+            with os.scandir(self.folder) as it:
+                return {entry.name for entry in it if is_image_file(entry.name) and entry.is_file()}
+        except OSError:
+            return None
+
+    def _poll(self):
+        folder_mtime = None
+        pending = {}  # name -> ((size, mtime_ns), monotonic time it was first seen with that stat)
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                mtime = os.stat(self.folder).st_mtime_ns
+            except OSError:
+                continue
+            if mtime != folder_mtime:
+                names = self._list_names()
+                if names is None:
+                    continue
+                self._known &= names
+                for name in names - self._known:
+                    pending.setdefault(name, None)
+                for name in [name for name in pending if name not in names]:
+                    del pending[name]
+                # A directory modified just now may change again within the same mtime tick
+                folder_mtime = None if time.time_ns() - mtime < FOLDER_MTIME_SLACK_NS else mtime
+
+            # Only the new files are stat'ed, until they stop changing
+            events = []
+            now = time.monotonic()
+            for name, seen in list(pending.items()):
+                try:
+                    stat_result = os.stat(self._path_of(name))
+                except OSError:
+                    del pending[name]
+                    continue
+                stamp = (stat_result.st_size, stat_result.st_mtime_ns)
+                if seen is None or seen[0] != stamp:
+                    pending[name] = (stamp, now)
+                elif stat_result.st_size and now - seen[1] >= self.settle:
+                    del pending[name]
+                    self._known.add(name)
+                    events.append(self._path_of(name))
+            self._emit(events)
+
+
+# Workspaces: a tree of day/line image folders opened as one image set
+WORKSPACE_MAX_DEPTH = 4  # Folder levels below the workspace root searched for images
+WORKSPACE_BATCH_MS = 200  # Folders indexed this close together are merged into the view as one batch
+
+
+def find_latest_revision_csv(folder):
+    """Most recent revision_YYYYMMDD_HHMMSS.csv in folder, or None"""
+    most_recent_file = None
+    most_recent_time = None
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return None
+    for csv_file in names:
+        if not (csv_file.startswith("revision_") and csv_file.endswith(".csv")):
+            continue
+        try:
+            # Extract timestamp from filename: revision_YYYYMMDD_HHMMSS.csv
+            timestamp = datetime.strptime(csv_file[9:-4], "%Y%m%d_%H%M%S")
+        except ValueError:
+            # Skip files that don't match the expected format
+            continue
+        if most_recent_time is None or timestamp > most_recent_time:
+            most_recent_time = timestamp
+            most_recent_file = csv_file
+    return os.path.join(folder, most_recent_file) if most_recent_file else None
+
+
+def relative_image_path(path, base_folder):
+    """Image path as stored in revision CSVs and label journals: relative to base_folder"""
+    if not base_folder:
+        return os.path.basename(path)
+    try:
+        # Normalize both paths before calculating relative path
+        normalized_path = os.path.normpath(path)
+        normalized_folder = os.path.normpath(base_folder)
+        relative_path = os.path.relpath(normalized_path, normalized_folder)
+        if is_archive_file(normalized_folder):
+            # Archive images are keyed by their member name
+            relative_path = relative_path.replace(os.sep, "/")
+        return relative_path
+    except ValueError:
+        # If relpath fails (e.g., different drives), use just the filename
+        return os.path.basename(path)
+
+
+def resolve_image_path(stored_path, base_folder):
+    """Image path of a stored (relative) path, the inverse of relative_image_path"""
+    if not base_folder:
+        # No folder_path available, use as-is
+        return stored_path
+    if os.path.isabs(stored_path):
+        # Already absolute path (backward compatibility)
+        return stored_path
+    # Relative path - convert to absolute and normalize it to handle any inconsistencies
+    return os.path.normpath(os.path.join(base_folder, stored_path))
+
+
+def read_revision_csv(filepath, base_folder=None):
+    """Read a revision CSV into (labels, ocr_readable, false_noread, comments) dicts keyed by image path.
+
+    Relative image paths are resolved against base_folder.
+    """
+    labels, ocr_readable_by_path, false_noread_by_path, comments = {}, {}, {}, {}
+    with open(filepath, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip the header
+        
+        for row in reader:
+            if len(row) >= 2:  # At minimum need image_path and image_label
+                stored_path = row[0]  # This might be relative or absolute
+                image_label = row[1]
+                
+                # Read OCR Readable status if available (3rd column, index 2)
+                ocr_readable = False
+                if len(row) >= 3:
+                    try:
+                        # Handle both boolean and string representations
+                        ocr_value = row[2]
+                        if isinstance(ocr_value, str):
+                            ocr_readable = ocr_value.lower() in ('true', 't', '1', 'yes')
+                        else:
+                            ocr_readable = bool(ocr_value)
+                    except (ValueError, TypeError):
+                        ocr_readable = False  # Default to False if parsing fails
+                
+                # Read False NoRead status if available (4th column, index 3)
+                false_noread = False
+                if len(row) >= 4:
+                    try:
+                        # Handle both boolean and string representations
+                        false_noread_value = row[3]
+                        if isinstance(false_noread_value, str):
+                            false_noread = false_noread_value.lower() in ('true', 't', '1', 'yes')
+                        else:
+                            false_noread = bool(false_noread_value)
+                    except (ValueError, TypeError):
+                        false_noread = False  # Default to False if parsing fails
+                
+                # Read Comment if available (5th column, index 4)
+                comment = ""
+                if len(row) >= 5:
+                    comment = row[4].strip()
+                
+                image_path = resolve_image_path(stored_path, base_folder)
+                labels[image_path] = image_label
+                ocr_readable_by_path[image_path] = ocr_readable
+                false_noread_by_path[image_path] = false_noread
+                comments[image_path] = comment
+    return labels, ocr_readable_by_path, false_noread_by_path, comments
+
+
+# Label edits are appended to a journal and compacted into the revision CSV now and then
+LABEL_JOURNAL_NAME = "labels_journal.jsonl"  # Next to the revision CSVs of a folder
+LABEL_JOURNAL_SYNC_S = 1.0  # Appended edits are fsync'ed together, at most this long after they were written
+LABEL_JOURNAL_COMPACT_MS = 30000  # Time after an edit until the revision CSV and stats CSV are rewritten
+LABEL_JOURNAL_COMPACT_EDITS = 500  # Journaled edits that trigger the rewrite right away
+
+
+class LabelJournal:
+    """Append-only journal of the label edits of one folder since its revision CSV was last written.
+
+    Each edit appends one JSON line with the complete label state of an image
+    (label, OCR readable, False NoRead, comment), so replaying keeps the last line
+    per image and replaying twice does no harm. Lines are handed to the OS at
+    once and fsync'ed in batches, at most sync_interval after they were written.
+    Once the revision CSV holds the edits, reset() empties the journal.
+    """
+
+    def __init__(self, path, base_folder, sync_interval=LABEL_JOURNAL_SYNC_S):
+        self.path = path
+        self.base_folder = base_folder
+        self.sync_interval = sync_interval
+        self.edits = 0  # Edits appended since the last reset
+        self._file = None  # Opened on the first edit
+        self._sync_timer = None
+        self._lock = threading.Lock()
+
+    def append(self, image_path, label, ocr_readable, false_noread, comment):
+        """Record the label state of image_path (label None: the image has no label)"""
+        record = {"path": relative_image_path(image_path, self.base_folder), "label": label,
+                  "ocr_readable": bool(ocr_readable), "false_noread": bool(false_noread), "comment": comment}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self.edits += 1
+            if self._sync_timer is None:
+                self._sync_timer = threading.Timer(self.sync_interval, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def sync(self):
+        """fsync the edits appended so far"""
+        with self._lock:
+            self._sync_timer = None
+            if self._file is None:
+                return
+            try:
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                print(f"Could not sync label journal {self.path}: {e}")
+
+    def _cancel_sync_locked(self):
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+
+    def reset(self):
+        """Empty the journal once its edits are in the revision CSV"""
+        with self._lock:
+            self._cancel_sync_locked()
+            # Truncated rather than removed, so the folder's mtime (and FolderIndex snapshot) stays as it is
+            if self._file is not None:
+                self._file.truncate(0)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            elif os.path.exists(self.path):
+                open(self.path, "w").close()
+            self.edits = 0
+
+    def close(self):
+        with self._lock:
+            self._cancel_sync_locked()
+            if self._file is not None:
+                try:
+                    os.fsync(self._file.fileno())
+                finally:
+                    self._file.close()
+                    self._file = None
+
+
+def replay_label_journal(filepath, base_folder, labels, ocr_readable, false_noread, comments):
+    """Apply the edits of a label journal to the label dicts; return the number of edits applied.
+
+    A line torn by a crash in the middle of an append is skipped.
+    """
+    try:
+        f = open(filepath, encoding="utf-8")
+    except FileNotFoundError:
+        return 0
+    applied = 0
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                image_path = resolve_image_path(record["path"], base_folder)
+            except (ValueError, KeyError, TypeError):
+                continue
+            if record.get("label") is None:
+                labels.pop(image_path, None)
+            else:
+                labels[image_path] = record["label"]
+            ocr_readable[image_path] = bool(record.get("ocr_readable", False))
+            false_noread[image_path] = bool(record.get("false_noread", False))
+            if record.get("comment"):
+                comments[image_path] = record["comment"]
+            else:
+                comments.pop(image_path, None)
+            applied += 1
+    return applied
+
+
+def iter_image_folders(root, max_depth=WORKSPACE_MAX_DEPTH, stop_event=None):
+    """Yield the folders under root (root included) that directly contain images, in sorted depth-first order.
+
+    Hidden folders (such as the sidecar caches) are skipped and symlinked folders are not followed.
+    """
+    pending = [(os.path.normpath(root), 0)]
+    while pending:
+        if stop_event is not None and stop_event.is_set():
+            return
+        folder, depth = pending.pop()
+        subfolders = []
+        has_images = False
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth < max_depth and not entry.name.startswith("."):
+                                subfolders.append(entry.path)
+                        elif not has_images and is_image_file(entry.name) and entry.is_file():
+                            has_images = True
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        if has_images:
+            yield folder
+        pending.extend((subfolder, depth + 1) for subfolder in sorted(subfolders, reverse=True))
+
+
+class Workspace:
+    """A directory tree of image folders (e.g. day/line subfolders) opened as one image set.
+
+    start() walks the tree in a background thread and refreshes each image folder's
+    own FolderIndex (persisted in its sidecar cache, so a revisited tree is not listed
+    again). The same thread reads the folder's latest revision CSV and label journal,
+    queues (folder, index, labels, replayed) on delivered and calls notify(), so the
+    first folders can be viewed while the rest is still being found. The tool drains
+    the queue in batches on the Tk thread, registers the folders with add() and shows
+    them merged, in tree order. Labels stay in one revision CSV per folder - the same
+    file the folder uses when it is opened on its own.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.normpath(root)
+        self.folders = []  # Folders added so far, in tree order
+        self.indexes = {}  # folder -> FolderIndex
+        self.csv_files = {}  # folder -> revision CSV written by this session
+        self.saved = {}  # folder -> signature of the rows last written to its CSV
+        self.complete = False
+        self.delivered = queue.Queue()  # (folder, index, labels, replayed) not merged into the view yet
+        self._ranks = {}
+        self._stop_event = threading.Event()
+
+    def start(self, notify, on_done):
+        def walk():
+            for folder in iter_image_folders(self.root, stop_event=self._stop_event):
+                index = FolderIndex(folder, os.path.join(folder, THUMBNAIL_CACHE_DIR, FOLDER_INDEX_NAME))
+                try:
+                    index.refresh()
+                except OSError as e:
+                    print(f"Cannot index {folder}: {e}")
+                    continue
+                if self._stop_event.is_set():
+                    return
+                if index.entries:
+                    labels, replayed = self.read_labels(folder)
+                    self.delivered.put((folder, index, labels, replayed))
+                    notify()
+            if not self._stop_event.is_set():
+                on_done()
+
+        threading.Thread(target=walk, name="WorkspaceIndexer", daemon=True).start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    @staticmethod
+    def read_labels(folder):
+        """Labels of folder's latest revision CSV with its journal replayed: ((labels, ...), edits replayed)"""
+        loaded = ({}, {}, {}, {})
+        latest_csv = find_latest_revision_csv(folder)
+        try:
+            if latest_csv:
+                loaded = read_revision_csv(latest_csv, folder)
+            return loaded, replay_label_journal(os.path.join(folder, LABEL_JOURNAL_NAME), folder, *loaded)
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"Cannot read the labels of {folder}: {e}")
+            return loaded, 0
+
+    def add(self, folder, index, csv_filename):
+        self._ranks[folder] = len(self.folders)
+        self.folders.append(folder)
+        self.indexes[folder] = index
+        self.csv_files[folder] = csv_filename
+
+    def rank(self, path):
+        """Tree-order position of the folder of path (folders not added yet sort last)"""
+        return self._ranks.get(os.path.dirname(path), len(self._ranks))
+
+    def paths(self, refresh=False):
+        """Image paths of all added folders, folder by folder (each folder's files unsorted)"""
+        if refresh:
+            for index in self.indexes.values():
+                index.refresh()
+        return [path for folder in self.folders for path in self.indexes[folder].paths()]
+
+    def image_count(self):
+        return sum(len(index.entries) for index in self.indexes.values())
+
+
+# Pre-parsed image filenames (XXXXXXXXXX_XXXX_XXX_timestamp.jpg)
+_DATE_NOT_PARSED = object()
+
+
+def split_session_key(value):
+    """Split a session identifier into (base, suffix), without leading zeros on a numeric base"""
+    if '_' in value:
+        base, suffix = value.split('_', 1)
+    else:
+        base, suffix = value, ""
+    if base.isdigit():
+        base = str(int(base))
+    return base, suffix
+
+
+def parse_filename_date(filename):
+    """Date in a filename as "day-month-year", or None"""
+    try:
+        # Method 1: Extract timestamp from filename parts
+        parts = filename.split('_')
+        if len(parts) >= 4:
+            timestamp_part = parts[-1].split('.')[0]  # Remove extension
+            
+            # Case 1: YYYYMMDD format (exactly 8 digits)
+            if len(timestamp_part) == 8 and timestamp_part.isdigit():
+                year = timestamp_part[:4]
+                month = timestamp_part[4:6]
+                day = timestamp_part[6:8]
+                return f"{day}-{month}-{year}"
+            
+            # Case 2: YYYYMMDD_HHMMSS or YYYYMMDDHHMMSS format
+            if len(timestamp_part) >= 8:
+                date_part = timestamp_part[:8]
+                if date_part.isdigit() and len(date_part) == 8:
+                    year = date_part[:4]
+                    month = date_part[4:6]
+                    day = date_part[6:8]
+                    return f"{day}-{month}-{year}"
+                    
+            # Case 3: Check other parts for date
+            for part in parts:
+                if len(part) >= 8 and part[:8].isdigit():
+                    date_part = part[:8]
+                    year = date_part[:4]
+                    month = date_part[4:6]
+                    day = date_part[6:8]
+                    # Validate date ranges
+                    if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+                        return f"{day}-{month}-{year}"
+        
+        # Method 2: Find YYYYMMDD pattern anywhere in filename using regex
+        date_pattern = re.search(r'(20\d{2})(\d{2})(\d{2})', filename)
+        if date_pattern:
+            year = date_pattern.group(1)
+            month = date_pattern.group(2)
+            day = date_pattern.group(3)
+            # Validate date ranges
+            if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+                return f"{day}-{month}-{year}"
+        
+        # Method 3: Look for different date patterns
+        other_patterns = [
+            r'(\d{2})-(\d{2})-(\d{4})',  # DD-MM-YYYY
+            r'(\d{2})/(\d{2})/(\d{4})',  # DD/MM/YYYY
+            r'(\d{4})-(\d{2})-(\d{2})',  # YYYY-MM-DD
+        ]
+        
+        for pattern in other_patterns:
+            match = re.search(pattern, filename)
+            if match:
+                if pattern.startswith(r'(\d{4})'):  # YYYY-MM-DD format
+                    year, month, day = match.groups()
+                else:  # DD-MM-YYYY or DD/MM/YYYY format
+                    day, month, year = match.groups()
+                
+                # Validate date ranges
+                if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+                    return f"{day}-{month}-{year}"
+                    
+    except Exception as e:
+        print(f"DEBUG: Error extracting date from filename {filename}: {e}")
+        
+    return None
+
+
+def filename_sort_key(name):
+    """(trigger_id, sub_image_count) sort key of an image file name; 0 where a part is not a number"""
+    # The name is split with its extension: "0001_002.jpg" has no numeric sub-image part
+    parts = name.split('_', 2)
+    if len(parts) < 2:
+        return (0, 0)
+    return (int(parts[0]) if parts[0].isdigit() else 0, int(parts[1]) if parts[1].isdigit() else 0)
+
+
+def first_image_in_folder(folder):
+    """Path of the image that sorts first in folder, from a single listing without stat calls (None if none)"""
+    try:
+        with os.scandir(folder) as it:
+            names = [entry.name for entry in it if is_image_file(entry.name)]
+    except OSError:
+        return None
+    if not names:
+        return None
+    return os.path.normpath(os.path.join(folder, min(names, key=filename_sort_key)))
+
+
+class FilenameInfo:
+    """Everything the tool reads from one image filename, parsed once.
+
+    trigger_id, sub_image: numeric sort key (0 where a part is not a number)
+    trigger: trigger ID without leading zeros, as typed in "Jump to Trigger ID"
+    trigger_number: first part as an int, or None
+    session: ID + timestamp group key; session_base/session_suffix: the same split for the Session # filter
+    session_prefix: session ID of the sessions CSV, or None
+    date: "day-month-year", parsed on first access
+    """
+
+    __slots__ = ("name", "trigger_id", "sub_image", "trigger", "trigger_number", "session", "session_base",
+                 "session_suffix", "session_prefix", "_date")
+
+    def __init__(self, name):
+        self.name = name
+        self.trigger_id, self.sub_image = filename_sort_key(name)
+
+        parts = os.path.splitext(name)[0].split('_')
+        first = parts[0]
+        self.trigger = str(int(first)) if first.isdigit() else first
+        try:
+            self.trigger_number = int(first)
+        except ValueError:
+            self.trigger_number = None
+        # Images of one session share the ID (first part) and timestamp (last part)
+        self.session = f"{first}_{parts[-1]}" if len(parts) >= 2 else first
+        self.session_base, self.session_suffix = split_session_key(self.session)
+
+        if len(parts) >= 2 and first and first.isalnum():
+            self.session_prefix = first
+        elif name.upper().startswith('IMG_') and len(parts) >= 3:
+            self.session_prefix = parts[1]  # IMG_sessionID_triggerID.jpg
+        elif first and first.isalnum():
+            self.session_prefix = first
+        else:
+            self.session_prefix = None
+        self._date = _DATE_NOT_PARSED
+
+    @property
+    def sort_key(self):
+        return (self.trigger_id, self.sub_image)
+
+    @property
+    def date(self):
+        if self._date is _DATE_NOT_PARSED:
+            self._date = parse_filename_date(self.name)
+        return self._date
+
+
+class FilenameCatalog:
+    """FilenameInfo of the images of the open folder, keyed by file name.
+
+    Built once when a folder is opened; names seen later (new arrivals, log
+    entries) are parsed on first use and kept.
+    """
+
+    def __init__(self, paths=()):
+        self._entries = {}
+        for path in paths:
+            self.get(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path):
+        """FilenameInfo of a path or bare file name"""
+        name = os.path.basename(path)
+        info = self._entries.get(name)
+        if info is None:
+            info = self._entries[name] = FilenameInfo(name)
+        return info
+
+
+def insert_sorted(items, new_items, key):
+    """Insert new_items into the key-sorted list items in place, each after the items with an equal key.
+
+    A few arrivals are placed by bisection (O(log N) key calls each); a large
+    batch is merged with the list in one linear pass instead.
+    """
+    new_items = sorted(new_items, key=key)
+    if len(new_items) * 32 > len(items):
+        items[:] = list(heapq.merge(items, new_items, key=key))
+        return
+    lo = 0
+    for item in new_items:
+        item_key = key(item)
+        hi = len(items)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if item_key < key(items[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        items.insert(lo, item)
+        lo += 1  # The next (larger or equal) item goes after this one
+
+
+def read_uint16_pixels(img, reduction=1):
+    """Return the pixels of an opened 12/16-bit image as a 2-D uint16 array, area-reduced by reduction.
+
+    Uncompressed single-strip files (raw PGM, most camera TIFFs) are memory-mapped
+    instead of decoded by Pillow, which would also widen PGM samples to 32 bits.
+    """
+    pixels = None
+    if img.filename and len(img.tile) == 1:
+        codec, extents, offset, args = img.tile[0][:4]
+        rawmode = args if isinstance(args, str) else args[0]
+        packed = isinstance(args, str) or (args[1] in (0, img.width * 2) and args[2] == 1)
+        if codec == "raw" and rawmode in _RAW_UINT16_DTYPES and packed and tuple(extents) == (0, 0, *img.size):
+            pixels = np.memmap(img.filename, dtype=_RAW_UINT16_DTYPES[rawmode], mode="r",
+                               offset=offset, shape=(img.height, img.width))
+    if pixels is None:
+        img.load()
+        pixels = np.asarray(img)
+        if pixels.dtype != np.uint16:
+            pixels = np.clip(pixels, 0, 65535).astype(np.uint16)
+    if reduction > 1:
+        size = (-(-img.width // reduction), -(-img.height // reduction))
+        return cv2.resize(np.ascontiguousarray(pixels, dtype=np.uint16), size, interpolation=cv2.INTER_AREA)
+    # Copy out of the mapping so the file is not held open while the frame is cached
+    return np.array(pixels, dtype=np.uint16)
+
+
+def auto_window(pixels):
+    """(low, high) window covering the bulk of the pixel values (see AUTO_WINDOW_PERCENTILES)"""
+    step = max(1, int(math.sqrt(pixels.size / 65536)))  # ~64k samples are plenty for percentiles
+    low, high = np.percentile(pixels[::step, ::step], AUTO_WINDOW_PERCENTILES)
+    return int(low), max(int(low) + 1, int(math.ceil(high)))
+
+
+@functools.lru_cache(maxsize=16)
+def window_lut(low, high):
+    """Lookup table mapping every 16-bit value to 8 bits for the window [low, high]"""
+    values = np.arange(65536, dtype=np.float32)
+    return np.clip((values - low) * (255.0 / max(1, high - low)) + 0.5, 0, 255).astype(np.uint8)
+
+
+def apply_display_window(pixels, window=None):
+    """Map uint16 pixels to a mode L image through the window LUT (None = auto window).
+
+    A window change is a single table lookup over the array - nothing is decoded again.
+    """
+    low, high = window if window is not None else auto_window(pixels)
+    return Image.fromarray(window_lut(int(low), int(high))[pixels])
+
+
+def decode_high_bit_depth(path, fit_size=None, page=0):
+    """Return (uint16 pixels, reduction, source_size) for a 12/16-bit image, or None for 8-bit images.
+
+    Only the requested page of a multi-page TIFF is read.
+    """
+    img = open_image_file(path)
+    if page:
+        img.seek(page)
+    if img.mode not in HIGH_BIT_DEPTH_MODES:
+        return None
+    source_size = img.size
+    reduction = choose_decode_reduction(source_size, fit_size)
+    return read_uint16_pixels(img, reduction), reduction, source_size
+
+
+def decode_image_file(path, fit_size=None, page=0):
+    """Decode an image, asking the decoder for a reduced size when only fit_size is needed.
+
+    JPEGs use DCT scaling so the skipped resolution is never decoded. Other formats
+    are decoded in full and box-reduced so the cached copy stays small. Monochrome
+    sources come back as mode L (see normalize_monochrome); 12/16-bit sources are
+    mapped to mode L with their auto window. page selects one page of a multi-page TIFF.
+    Returns (image, reduction, source_size).
+    """
+    img = open_image_file(path)
+    if page:
+        img.seek(page)
+    source_size = img.size
+    reduction = choose_decode_reduction(source_size, fit_size)
+    if img.mode in HIGH_BIT_DEPTH_MODES:
+        return apply_display_window(read_uint16_pixels(img, reduction)), reduction, source_size
+    if reduction > 1 and img.format == "JPEG":
+        requested = (-(-source_size[0] // reduction), -(-source_size[1] // reduction))
+        img.draft(img.mode, requested)
+        img.load()
+    else:
+        img.load()
+        if img.mode == "P":
+            # Resolve the palette first (reduce() cannot average palette indices)
+            img = normalize_monochrome(img)
+            if img.mode == "P" and reduction > 1:
+                img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+        if reduction > 1:
+            img = img.reduce(reduction)
+    return normalize_monochrome(img), reduction, source_size
+
+
+def _page_cache_path(path, page):
+    """Cache identity of one page of path (page 0 is cached under the plain path)"""
+    return (path, page) if page else path
+
+
+def load_display_image(cache, path, fit_size=None, thumbnails=None, page=0):
+    """Return (image, source_size) for path, from cache when possible, decoding otherwise.
+
+    Decodes are cached per (path, reduction), so fit mode and 1:1 mode can keep
+    their own copies of the same file. In fit mode a stored thumbnail from the
+    optional ThumbnailStore is used instead of decoding when it covers the display.
+    Later pages of multi-page TIFFs are cached under (path, page).
+    """
+    stamp = get_file_stamp(path)
+    cache_path = _page_cache_path(path, page)
+    source_size = cache.get_source_size(cache_path, stamp)
+    if source_size is not None:
+        reduction = choose_decode_reduction(source_size, fit_size)
+        img = cache.get((cache_path, reduction), stamp)
+        if img is not None:
+            return img, source_size
+
+    if fit_size and thumbnails is not None and not page:
+        info = thumbnails.info(path, "fit", stamp)
+        if info is not None:
+            (thumb_width, thumb_height), source_size = info
+            # Same size the fitted display will have (thumbnail() never enlarges)
+            scale = min(fit_size[0] / source_size[0], fit_size[1] / source_size[1], 1.0)
+            if thumb_width >= int(source_size[0] * scale) and thumb_height >= int(source_size[1] * scale):
+                found = thumbnails.get(path, "fit", stamp)
+                if found is not None:
+                    img, source_size = found
+                    # Stands in for the reduced decode: it has at least the resolution shown
+                    cache.put((path, choose_decode_reduction(source_size, fit_size)), img, stamp)
+                    cache.set_source_size(path, stamp, source_size)
+                    return img, source_size
+
+    img, reduction, source_size = decode_image_file(path, fit_size, page)
+    cache.put((cache_path, reduction), img, stamp)
+    cache.set_source_size(cache_path, stamp, source_size)
+    return img, source_size
+
+
+def load_windowed_image(cache, path, fit_size=None, window=None, page=0, thumbnails=None):
+    """Like load_display_image, but 12/16-bit images are mapped through a window (None = auto window).
+
+    The 16-bit pixels are cached (under ("uint16", path or (path, page))) from the
+    first display on, so moving the window only re-applies the lookup table.
+    8-bit images ignore the window and are loaded like load_display_image.
+    """
+    stamp = get_file_stamp(path)
+    if cache.get_source_size(_page_cache_path(path, page), stamp) is not None:
+        # Known 8-bit file - no need to open it to check the bit depth again
+        return load_display_image(cache, path, fit_size, thumbnails, page)
+    cache_path = ("uint16", _page_cache_path(path, page))
+    source_size = cache.get_source_size(cache_path, stamp)
+    raw = None
+    if source_size is not None:
+        raw = cache.get((cache_path, choose_decode_reduction(source_size, fit_size)), stamp)
+    if raw is None:
+        decoded = decode_high_bit_depth(path, fit_size, page)
+        if decoded is None:
+            return load_display_image(cache, path, fit_size, thumbnails, page)
+        pixels, reduction, source_size = decoded
+        raw = Image.fromarray(pixels)  # Mode I;16 - accounted at 2 bytes per pixel
+        cache.put((cache_path, reduction), raw, stamp)
+        cache.set_source_size(cache_path, stamp, source_size)
+    return apply_display_window(np.asarray(raw), window), source_size
+
+
+class DecodedImageCache:
+    """Thread-safe LRU cache of decoded PIL images bounded by a memory budget.
+
+    Entries are keyed by an arbitrary hashable key (typically the image path) and
+    carry the file stamp they were decoded from, so a lookup with a newer stamp
+    is treated as a miss and the stale entry is dropped.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> (stamp, image, nbytes)
+        self._source_sizes = {}  # path -> (stamp, full resolution size)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def image_nbytes(img):
+        """Approximate the memory held by a decoded PIL image"""
+        bytes_per_pixel = {"1": 1, "L": 1, "P": 1, "LA": 2, "I;16": 2, "RGB": 3}.get(img.mode, 4)
+        return img.width * img.height * bytes_per_pixel
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def get(self, key, stamp=None):
+        """Return the cached image for key, or None on a miss or stale stamp"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if stamp is not None and entry[0] != stamp:
+                # File changed on disk since it was decoded
+                self._remove_locked(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, img, stamp=None):
+        """Store a decoded image, evicting least recently used entries to stay in budget"""
+        nbytes = self.image_nbytes(img)
+        if nbytes > self.budget_bytes:
+            # Never cache a single image larger than the whole budget
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = (stamp, img, nbytes)
+            self._total_bytes += nbytes
+            while self._total_bytes > self.budget_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove_locked(oldest_key)
+
+    def get_source_size(self, path, stamp=None):
+        """Return the full-resolution size recorded for path, or None if unknown or stale"""
+        with self._lock:
+            entry = self._source_sizes.get(path)
+        if entry is None or (stamp is not None and entry[0] != stamp):
+            return None
+        return entry[1]
+
+    def set_source_size(self, path, stamp, size):
+        """Remember the full-resolution size of path so reduced decodes can be looked up"""
+        with self._lock:
+            self._source_sizes[path] = (stamp, size)
+
+    def discard(self, key):
+        """Drop a single entry if present"""
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+
+    def discard_path(self, path):
+        """Drop every entry of path, whatever else its key holds (size, page, view variant...)"""
+        def key_path(key):
+            while isinstance(key, tuple) and key:
+                key = key[0]
+            return key
+
+        with self._lock:
+            for key in [key for key in self._entries if key_path(key) == path]:
+                self._remove_locked(key)
+            self._source_sizes.pop(path, None)
+
+    def clear(self):
+        """Drop every cached image"""
+        with self._lock:
+            self._entries.clear()
+            self._source_sizes.clear()
+            self._total_bytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _remove_locked(self, key):
+        _, _, nbytes = self._entries.pop(key)
+        self._total_bytes -= nbytes
+
+
+# Contrast enhancement (Hist EQ checkbox) settings
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_GRID = (8, 8)
+ENHANCED_CACHE_BUDGET_MB = 128  # Memory budget for memoized enhanced images
+
+
+class ContrastEnhancer:
+    """Single-pass CLAHE contrast enhancement with memoized results.
+
+    CLAHE runs once on the luminance plane (or directly on grayscale images)
+    instead of on every color channel. The CLAHE object is created once per
+    thread and reused, and results are kept in a bounded cache keyed by the
+    caller's key plus the enhancement parameters.
+    """
+
+    def __init__(self, clip_limit=CLAHE_CLIP_LIMIT, tile_grid=CLAHE_TILE_GRID,
+                 budget_bytes=ENHANCED_CACHE_BUDGET_MB * 1024 * 1024):
+        self.clip_limit = clip_limit
+        self.tile_grid = tuple(tile_grid)
+        self.cache = DecodedImageCache(budget_bytes)
+        self._local = threading.local()
+
+    @property
+    def params(self):
+        return (self.clip_limit, self.tile_grid)
+
+    def _clahe(self):
+        """Return this thread's CLAHE object (cv2 CLAHE objects are not shared across threads)"""
+        cached = getattr(self._local, 'clahe', None)
+        if cached is None or cached[0] != self.params:
+            # First use on this thread, or the parameters were changed
+            cached = (self.params, cv2.createCLAHE(clipLimit=self.clip_limit, tileGridSize=self.tile_grid))
+            self._local.clahe = cached
+        return cached[1]
+
+    def lookup(self, cache_key, stamp=None):
+        """Return the memoized result for cache_key without computing it, or None"""
+        return self.cache.get((cache_key, self.params), stamp)
+
+    def enhance(self, img, cache_key=None, stamp=None):
+        """Return the enhanced image, reusing a memoized result for cache_key when available"""
+        if cache_key is not None:
+            key = (cache_key, self.params)
+            cached = self.cache.get(key, stamp)
+            if cached is not None:
+                return cached
+
+        enhanced = self._apply(img)
+        if cache_key is not None:
+            self.cache.put(key, enhanced, stamp)
+        return enhanced
+
+    def _apply(self, img):
+        clahe = self._clahe()
+        if img.mode == 'L':
+            # Grayscale: equalize the only plane there is
+            return Image.fromarray(clahe.apply(np.asarray(img)))
+
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # Color: equalize luminance only and keep the chroma untouched
+        ycrcb = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2YCrCb)
+        ycrcb[:, :, 0] = clahe.apply(ycrcb[:, :, 0])
+        return Image.fromarray(cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2RGB))
+
+    def clear(self):
+        """Forget all memoized results"""
+        self.cache.clear()
+
+
+# Display resampling backends
+RESAMPLE_SHARP = "sharp"  # Idle rendering: best quality
+RESAMPLE_FAST = "fast"  # Panning, zooming and resizing: lowest latency
+DISPLAY_RESAMPLERS = {  # (shrinking, enlarging) backend for each display mode (see RESAMPLERS)
+    RESAMPLE_SHARP: ("pil-lanczos", "pil-lanczos"),
+    RESAMPLE_FAST: ("pil-reduce-bilinear", "cv2-linear"),  # Fastest per direction in benchmark_display.py
+}
+
+
+def fit_display_size(source_size, box):
+    """Size of source_size shrunk to fit box keeping the aspect ratio (never enlarged, like thumbnail)"""
+    width, height = source_size
+    scale = min(box[0] / width, box[1] / height, 1.0)
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+def _resample_pil_lanczos(img, size, box=None):
+    return img.resize(size, Image.Resampling.LANCZOS, box=box)
+
+
+def _resample_pil_reduce_bilinear(img, size, box=None):
+    # reducing_gap lets Pillow box-reduce by an integer factor before the bilinear pass
+    return img.resize(size, Image.Resampling.BILINEAR, box=box, reducing_gap=2.0)
+
+
+def _cv2_resampler(interpolation):
+    """Build a resampler running cv2.resize on the (cropped) pixels of a PIL image"""
+    def resample(img, size, box=None):
+        if img.mode not in ("L", "RGB", "RGBA"):
+            # Modes OpenCV cannot take as-is go through Pillow
+            return _resample_pil_reduce_bilinear(img, size, box)
+        if box is None:
+            return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=interpolation))
+        
+        # Resize the whole-pixel region around box, then cut out the exact sub-pixel window
+        left, top, right, bottom = box
+        x0, y0 = int(left), int(top)
+        x1, y1 = min(int(math.ceil(right)), img.width), min(int(math.ceil(bottom)), img.height)
+        scale_x = size[0] / (right - left)
+        scale_y = size[1] / (bottom - top)
+        region_size = (max(size[0], round((x1 - x0) * scale_x)), max(size[1], round((y1 - y0) * scale_y)))
+        region = cv2.resize(np.asarray(img.crop((x0, y0, x1, y1))), region_size, interpolation=interpolation)
+        offset_x = min(round((left - x0) * scale_x), region_size[0] - size[0])
+        offset_y = min(round((top - y0) * scale_y), region_size[1] - size[1])
+        return Image.fromarray(np.ascontiguousarray(
+            region[offset_y:offset_y + size[1], offset_x:offset_x + size[0]]))
+    return resample
+
+
+RESAMPLERS = {
+    "pil-lanczos": _resample_pil_lanczos,
+    "pil-reduce-bilinear": _resample_pil_reduce_bilinear,
+    "cv2-area": _cv2_resampler(cv2.INTER_AREA),
+    "cv2-linear": _cv2_resampler(cv2.INTER_LINEAR),
+}
+
+
+def resample_image(img, size, box=None, mode=RESAMPLE_SHARP):
+    """Resample img (or the box region of it) to size with the backend chosen for mode.
+
+    mode is a display mode (RESAMPLE_SHARP / RESAMPLE_FAST) or a backend name from RESAMPLERS.
+    """
+    name = mode
+    if mode in DISPLAY_RESAMPLERS:
+        shrink_backend, enlarge_backend = DISPLAY_RESAMPLERS[mode]
+        source_width = (box[2] - box[0]) if box is not None else img.width
+        name = enlarge_backend if size[0] > source_width else shrink_backend
+    backend = RESAMPLERS.get(name, _resample_pil_lanczos)
+    return backend(img, tuple(size), box)
+
+
+# Tiled renderer settings for 1:1 / zoom mode
+TILE_SIZE = 256  # Tile edge in display pixels
+TILE_PREFETCH_MARGIN = 1  # Extra ring of tiles drawn around the viewport
+TILE_KEEP_MARGIN = 3  # Tiles further than this from the viewport are dropped
+
+
+def visible_tile_indices(view_box, display_size, tile_size=TILE_SIZE, margin=0):
+    """Return the (column, row) indices of the tiles intersecting view_box.
+
+    view_box is (left, top, right, bottom) in zoomed image coordinates and
+    display_size is the full zoomed image size; margin adds extra rings of tiles.
+    """
+    left, top, right, bottom = view_box
+    display_width, display_height = display_size
+    if display_width <= 0 or display_height <= 0:
+        return []
+    columns = -(-display_width // tile_size)
+    rows = -(-display_height // tile_size)
+    first_column = max(0, int(left // tile_size) - margin)
+    last_column = min(columns - 1, int((right - 1) // tile_size) + margin)
+    first_row = max(0, int(top // tile_size) - margin)
+    last_row = min(rows - 1, int((bottom - 1) // tile_size) + margin)
+    return [(column, row)
+            for row in range(first_row, last_row + 1)
+            for column in range(first_column, last_column + 1)]
+
+
+class ImagePyramid:
+    """Resolution pyramid of one image used by the tiled zoom renderer.
+
+    Level n is the base image reduced by 2**n. Levels are built on first use and
+    kept for the lifetime of the pyramid, so zooming out never resamples the
+    full-resolution frame again.
+    """
+
+    MAX_LEVEL = 4
+
+    def __init__(self, base_image):
+        self.levels = [base_image]
+        self.size = base_image.size
+
+    def level_for_zoom(self, zoom):
+        """Return (level_image, factor) for the smallest level that still has at least zoom resolution"""
+        level = 0
+        factor = 1
+        while level < self.MAX_LEVEL and zoom * factor * 2 <= 1.0:
+            level += 1
+            factor *= 2
+        while len(self.levels) <= level:
+            self.levels.append(self.levels[-1].reduce(2))
+        return self.levels[level], factor
+
+    def display_size(self, zoom):
+        """Size of the whole image at zoom (matches the 1:1 mode scroll region)"""
+        return (int(self.size[0] * zoom), int(self.size[1] * zoom))
+
+    def render_tile(self, zoom, column, row, tile_size=TILE_SIZE, mode=RESAMPLE_SHARP):
+        """Resample only the source area behind one display tile, or return None if it is off-image"""
+        display_width, display_height = self.display_size(zoom)
+        left = column * tile_size
+        top = row * tile_size
+        width = min(tile_size, display_width - left)
+        height = min(tile_size, display_height - top)
+        if width <= 0 or height <= 0:
+            return None
+
+        level_img, factor = self.level_for_zoom(zoom)
+        scale = zoom * factor  # Display pixels per pixel of the chosen level
+        box = (left / scale,
+               top / scale,
+               min((left + width) / scale, level_img.width),
+               min((top + height) / scale, level_img.height))
+        return resample_image(level_img, (width, height), box=box, mode=mode)
+
+
+class ImagePrefetcher:
+    """Background worker that decodes upcoming images into a DecodedImageCache.
+
+    schedule() replaces the pending work list, so requests for a previous
+    position (or a previous filtered list) are dropped as soon as the user moves on.
+    """
+
+    def __init__(self, cache, load_func=load_display_image):
+        self.cache = cache
+        self.load_func = load_func
+        self._pending = []
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._busy = False
+        self._thread = threading.Thread(target=self._run, name="ImagePrefetcher")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def schedule(self, paths, fit_size=None):
+        """Replace the pending prefetch list with paths (highest priority first)"""
+        with self._condition:
+            self._pending = [(path, fit_size) for path in paths]
+            self._condition.notify()
+
+    def cancel(self):
+        """Forget all pending prefetch requests"""
+        with self._condition:
+            self._pending = []
+
+    def stop(self):
+        """Stop the worker thread"""
+        with self._condition:
+            self._stopped = True
+            self._pending = []
+            self._condition.notify()
+
+    def wait_idle(self, timeout=5.0):
+        """Block until the pending list is drained (used by tests and benchmarks)"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._condition:
+                if not self._pending and not self._busy:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._busy = False
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                path, fit_size = self._pending.pop(0)
+                self._busy = True
+
+            try:
+                # Served from cache when already decoded at this resolution
+                self.load_func(self.cache, path, fit_size)
+            except Exception:
+                # Unreadable files are reported when the user actually navigates to them
+                continue
+
+
+IMAGE_LOAD_WORKERS = 3  # Threads loading the image to show; a read hung on a slow share does not block the next
+
+
+class ImageLoader:
+    """Loads the image about to be shown on a small thread pool, tagged with request IDs.
+
+    Every request() gets a new ID and supersedes all earlier ones: a request that is
+    already stale when a worker picks it up is skipped, and a result that went stale
+    while loading is dropped instead of delivered. callback(request_id, result, error)
+    runs on the worker thread, so Tk users must marshal it with root.after.
+    """
+
+    def __init__(self, workers=IMAGE_LOAD_WORKERS):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers,
+                                                               thread_name_prefix="ImageLoader")
+        self._lock = threading.Lock()
+        self._latest_id = 0
+        self.dropped = 0  # Requests skipped or discarded because they went stale
+
+    def request(self, load, callback):
+        """Run load() in the background and pass its result to callback; returns the request ID"""
+        with self._lock:
+            self._latest_id += 1
+            request_id = self._latest_id
+        self._executor.submit(self._run, request_id, load, callback)
+        return request_id
+
+    def is_current(self, request_id):
+        return request_id == self._latest_id
+
+    def cancel(self):
+        """Make every outstanding request stale"""
+        with self._lock:
+            self._latest_id += 1
+
+    def stop(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, request_id, load, callback):
+        if not self.is_current(request_id):
+            self.dropped += 1
+            return
+        try:
+            result, error = load(), None
+        except Exception as e:
+            result, error = None, e
+        if not self.is_current(request_id):
+            self.dropped += 1
+            return
+        callback(request_id, result, error)
+
+
+# Persistent per-folder thumbnail store
+THUMBNAIL_CACHE_DIR = ".labeltool_cache"  # Hidden sidecar directory inside the image folder
+THUMBNAIL_FIT_SIZE = (1280, 1024)  # Bounding box of the stored fit-size thumbnail
+THUMBNAIL_SMALL_SIZE = (256, 256)  # Bounding box of the stored small thumbnail
+THUMBNAIL_JPEG_QUALITY = 85
+THUMBNAIL_INDEX_FLUSH_EVERY = 50  # Entries added between index writes
+THUMBNAIL_INDEXER_PAUSE_S = 0.02  # Pause between images so the indexer stays in the background
+
+
+class ThumbnailStore:
+    """Packed on-disk store of fit-size and small thumbnails for one image folder.
+
+    All thumbnails are JPEG blobs appended to a single pack file; a JSON index maps
+    (file name, kind) to the blob offset and length plus the source file stamp
+    (mtime_ns, size). A lookup with a different stamp is a miss and drops the
+    entry, so rewritten images are never served from a stale thumbnail. Space held
+    by dropped entries is reclaimed when the store is reopened.
+
+    With a root (the archive of a sidecar folder), entries are keyed by the path
+    relative to root, since archive members in different directories may share a name.
+    """
+
+    PACK_NAME = "thumbnails.pack"
+    INDEX_NAME = "thumbnails.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, folder, root=None):
+        self.folder = folder
+        self.root = root
+        self.cache_dir = os.path.join(folder, THUMBNAIL_CACHE_DIR)
+        self.pack_path = os.path.join(self.cache_dir, self.PACK_NAME)
+        self.index_path = os.path.join(self.cache_dir, self.INDEX_NAME)
+        self._entries = {}  # name -> {kind: [offset, length, mtime_ns, size, width, height, source_width, source_height]}
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self._pack = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _hide_path(self.cache_dir)
+            self._load_index()
+            self._pack = open(self.pack_path, "a+b")
+            self._compact_if_wasteful()
+        except OSError as e:
+            # Read-only or network folders simply work without the sidecar store
+            print(f"Thumbnail cache disabled for {folder}: {e}")
+            self._pack = None
+
+    @property
+    def enabled(self):
+        return self._pack is not None
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.FORMAT_VERSION:
+            return
+        try:
+            pack_size = os.path.getsize(self.pack_path)
+        except OSError:
+            return
+        for name, kinds in data.get("entries", {}).items():
+            # Drop entries pointing past the end of a truncated pack
+            valid = {kind: entry for kind, entry in kinds.items() if entry[0] + entry[1] <= pack_size}
+            if valid:
+                self._entries[name] = valid
+
+    def _compact_if_wasteful(self):
+        """Rewrite the pack without dropped blobs once they take up more than half of it.
+
+        The new offsets and pack handle replace the live ones only after the rewritten
+        pack has replaced the old file; if anything fails before that, the old pack
+        and index stay in use.
+        """
+        pack_size = os.path.getsize(self.pack_path)
+        live_size = sum(entry[1] for kinds in self._entries.values() for entry in kinds.values())
+        if pack_size < 1024 * 1024 or live_size * 2 > pack_size:
+            return
+        compact_path = self.pack_path + ".tmp"
+        offsets = {}  # (name, kind) -> offset in the rewritten pack
+        try:
+            with open(compact_path, "wb") as out:
+                for name, kinds in self._entries.items():
+                    for kind, entry in kinds.items():
+                        self._pack.seek(entry[0])
+                        blob = self._pack.read(entry[1])
+                        offsets[name, kind] = out.tell()
+                        out.write(blob)
+            try:
+                os.replace(compact_path, self.pack_path)
+            except PermissionError:
+                # Windows cannot replace a file that is still open: retry with the old pack closed
+                self._pack.close()
+                try:
+                    os.replace(compact_path, self.pack_path)
+                except OSError:
+                    self._pack = open(self.pack_path, "a+b")  # Still the old pack
+                    raise
+        except OSError as e:
+            print(f"Could not compact thumbnail pack {self.pack_path}: {e}")
+            try:
+                os.remove(compact_path)
+            except OSError:
+                pass
+            return
+        pack = open(self.pack_path, "a+b")
+        for (name, kind), offset in offsets.items():
+            self._entries[name][kind][0] = offset
+        if not self._pack.closed:
+            self._pack.close()
+        self._pack = pack
+        self._write_index()
+
+    def _entry_name(self, path):
+        if self.root:
+            return os.path.relpath(path, self.root).replace(os.sep, "/")
+        return os.path.basename(path)
+
+    def _lookup(self, path, kind, stamp):
+        """Return the index entry for path/kind if it matches stamp (caller holds the lock)"""
+        name = self._entry_name(path)
+        entry = self._entries.get(name, {}).get(kind)
+        if entry is None:
+            return None
+        if stamp is None or tuple(entry[2:4]) != tuple(stamp):
+            # Source changed (or vanished) since the thumbnail was made
+            del self._entries[name][kind]
+            if not self._entries[name]:
+                del self._entries[name]
+            self._unsaved += 1
+            return None
+        return entry
+
+    def info(self, path, kind, stamp):
+        """Return ((width, height), source_size) of a valid thumbnail without reading it, or None"""
+        with self._lock:
+            entry = self._lookup(path, kind, stamp) if self.enabled else None
+            if entry is None:
+                return None
+            return (entry[4], entry[5]), (entry[6], entry[7])
+
+    def get(self, path, kind, stamp):
+        """Return (thumbnail, source_size) for path if a valid one is stored, else None"""
+        with self._lock:
+            entry = self._lookup(path, kind, stamp) if self.enabled else None
+            if entry is None:
+                return None
+            self._pack.seek(entry[0])
+            blob = self._pack.read(entry[1])
+        try:
+            img = Image.open(io.BytesIO(blob))
+            img.load()
+        except Exception:
+            return None
+        return img, (entry[6], entry[7])
+
+    def put(self, path, kind, img, stamp, source_size):
+        """Store a thumbnail of path made from the file version identified by stamp"""
+        if not self.enabled or stamp is None:
+            return
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=THUMBNAIL_JPEG_QUALITY)
+        blob = buffer.getvalue()
+        with self._lock:
+            self._pack.seek(0, os.SEEK_END)
+            offset = self._pack.tell()
+            self._pack.write(blob)
+            self._entries.setdefault(self._entry_name(path), {})[kind] = [
+                offset, len(blob), stamp[0], stamp[1], img.width, img.height, source_size[0], source_size[1]]
+            self._unsaved += 1
+            if self._unsaved >= THUMBNAIL_INDEX_FLUSH_EVERY:
+                self._write_index()
+
+    def discard(self, path):
+        """Drop the thumbnails of path (its content changed without a new stamp)"""
+        with self._lock:
+            if self._entries.pop(self._entry_name(path), None) is not None:
+                self._unsaved += 1
+
+    def restamp(self, path, old_stamp, new_stamp):
+        """Keep the thumbnails of path made from old_stamp valid for new_stamp (same content, new mtime)"""
+        with self._lock:
+            for entry in self._entries.get(self._entry_name(path), {}).values():
+                if tuple(entry[2:4]) == tuple(old_stamp):
+                    entry[2:4] = list(new_stamp)
+                    self._unsaved += 1
+
+    def _write_index(self):
+        """Flush the pack and atomically replace the index (caller holds the lock)"""
+        self._pack.flush()
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.FORMAT_VERSION, "entries": self._entries}, f)
+        os.replace(temp_path, self.index_path)
+        self._unsaved = 0
+
+    def flush(self):
+        """Persist the index if entries were added or dropped since the last write"""
+        with self._lock:
+            if self.enabled and self._unsaved:
+                try:
+                    self._write_index()
+                except OSError as e:
+                    print(f"Could not save thumbnail index: {e}")
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._pack is not None:
+                self._pack.close()
+                self._pack = None
+
+
+def _hide_path(path):
+    """Set the hidden attribute on Windows (the leading dot already hides it elsewhere)"""
+    if os.name == "nt":
+        try:
+            import ctypes
+            ctypes.windll.kernel32.SetFileAttributesW(str(path), 0x02)  # FILE_ATTRIBUTE_HIDDEN
+        except Exception:
+            pass
+
+
+def create_thumbnails(store, path, stamp=None):
+    """Decode path once at reduced resolution and store its fit-size and small thumbnails"""
+    if stamp is None:
+        stamp = get_file_stamp(path)
+    img, _, source_size = decode_image_file(path, fit_size=THUMBNAIL_FIT_SIZE)
+    fit = img.copy()
+    fit.thumbnail(THUMBNAIL_FIT_SIZE, Image.Resampling.LANCZOS)
+    small = fit.copy()
+    small.thumbnail(THUMBNAIL_SMALL_SIZE, Image.Resampling.LANCZOS)
+    store.put(path, "fit", fit, stamp, source_size)
+    store.put(path, "small", small, stamp, source_size)
+
+
+class ThumbnailIndexer:
+    """Low-priority background thread that fills a ThumbnailStore for a list of images.
+
+    Images that already have valid thumbnails are skipped, and the thread pauses
+    between images so the prefetcher and the UI keep priority.
+    """
+
+    def __init__(self, store, paths, pause=THUMBNAIL_INDEXER_PAUSE_S):
+        self.store = store
+        self.paths = list(paths)
+        self.pause = pause
+        self.indexed = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ThumbnailIndexer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def wait(self, timeout=None):
+        """Wait for the indexer to finish; returns True if it did"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        for path in self.paths:
+            if self._stop_event.is_set():
+                break
+            stamp = get_file_stamp(path)
+            if stamp is None:
+                continue
+            if self.store.info(path, "fit", stamp) and self.store.info(path, "small", stamp):
+                continue
+            try:
+                create_thumbnails(self.store, path, stamp)
+                self.indexed += 1
+            except Exception:
+                # Unreadable files are reported when the user actually navigates to them
+                continue
+            self._stop_event.wait(self.pause)
+        self.store.flush()
+
+
+# Content fingerprints of the indexed images (change detection and corrupted-file screening)
+FINGERPRINT_WORKERS = 4  # Files read, hashed and test-decoded in parallel
+FINGERPRINT_READ_MB_PER_S = 64  # Read budget of the whole pass, so the folder share stays responsive
+FINGERPRINT_REPORT_EVERY = 200  # Fingerprints between index saves and progress reports
+
+
+def image_data_is_valid(data):
+    """True if the encoded image decodes completely (truncated writes fail at the missing data).
+
+    JPEGs are decoded at 1/8 scale: DCT scaling still walks all of the entropy-coded data.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.format == "JPEG":
+                img.draft(img.mode, (max(1, img.width // 8), max(1, img.height // 8)))
+            img.load()
+    except Exception:
+        return False
+    return True
+
+
+def fingerprint_image(path):
+    """Return (stamp, digest, valid) of path from one read, or None while the file is still changing"""
+    stamp = get_file_stamp(path)
+    if stamp is None:
+        return None
+    data = read_file_bytes(path)
+    if get_file_stamp(path) != stamp:
+        return None
+    return stamp, hashlib.blake2b(data, digest_size=16).hexdigest(), image_data_is_valid(data)
+
+
+class ContentFingerprinter:
+    """Background pass recording a content digest and decode validity for images of FolderIndexes.
+
+    Work items are (index, path) pairs. Files whose stamp still matches their recorded
+    fingerprint are skipped; the rest are read once by a small thread pool under a
+    shared read budget, hashed and test-decoded. Every FINGERPRINT_REPORT_EVERY files
+    and whenever the queue runs empty the touched indexes are saved and on_report is
+    called with (changed, restamped, corrupted) paths:
+
+    - changed: the content differs from the previous fingerprint
+    - restamped: [(path, old_stamp, new_stamp)] - new mtime/size stamp, same content
+    - corrupted: images that do not decode
+    More work can be queued with add() while the pass runs.
+    """
+
+    def __init__(self, jobs=(), on_report=None, workers=FINGERPRINT_WORKERS,
+                 read_rate=FINGERPRINT_READ_MB_PER_S * 1024 * 1024):
+        self.on_report = on_report
+        self.workers = workers
+        self.read_rate = read_rate
+        self.fingerprinted = 0
+        self.indexes = set()  # Every FolderIndex work was queued for
+        self._jobs = queue.Queue()
+        self._stop_event = threading.Event()
+        self._rate_lock = threading.Lock()
+        self._read_deadline = time.monotonic()  # When the reads granted so far fit the budget
+        self._changed, self._restamped, self._corrupted = [], [], []
+        self._dirty = set()  # Indexes with unsaved fingerprints
+        self._unreported = 0
+        self._idle = threading.Event()
+        self._idle.set()  # Nothing queued yet
+        self._idle_lock = threading.Lock()  # Queuing and going idle must not interleave
+        for index, paths in jobs:
+            self.add(index, paths)
+        self._thread = threading.Thread(target=self._run, name="ContentFingerprinter")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def add(self, index, paths):
+        """Queue paths of index for fingerprinting"""
+        self.indexes.add(index)
+        with self._idle_lock:
+            for path in paths:
+                self._jobs.put((index, path))
+            self._idle.clear()
+
+    def stop(self):
+        self._stop_event.set()
+        self._jobs.put(None)
+
+    def wait(self, timeout=None):
+        """Wait until the queued work is done; returns True if it is"""
+        return self._idle.wait(timeout)
+
+    def _throttle(self, nbytes):
+        """Sleep so the reads of all workers stay within read_rate bytes per second"""
+        if not self.read_rate:
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            self._read_deadline = max(self._read_deadline, now) + nbytes / self.read_rate
+            delay = self._read_deadline - now - 1.0  # Up to a second of reads may run ahead of the budget
+        if delay > 0:
+            self._stop_event.wait(delay)
+
+    def _fingerprint(self, index, path):
+        known = index.fingerprint(path)
+        stamp = get_file_stamp(path)
+        if stamp is None or (known is not None and known[0] == stamp):
+            return None
+        self._throttle(stamp[1])
+        if self._stop_event.is_set():
+            return None
+        return known, fingerprint_image(path)
+
+    def _collect(self, index, path, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            # The file vanished or the share failed; a later pass tries again
+            print(f"Could not fingerprint {path}: {e}")
+            return
+        if result is None or result[1] is None:
+            return
+        known, (stamp, digest, valid) = result
+        if not index.set_fingerprint(path, stamp, digest, valid):
+            return
+        self.fingerprinted += 1
+        self._unreported += 1
+        self._dirty.add(index)
+        if known is not None:
+            if known[1] != digest:
+                self._changed.append(path)
+            elif known[0] != stamp:
+                self._restamped.append((path, known[0], stamp))
+        if not valid:
+            self._corrupted.append(path)
+
+    def _report(self):
+        for index in self._dirty:
+            index.save()
+        self._dirty.clear()
+        changed, restamped, corrupted = self._changed, self._restamped, self._corrupted
+        self._changed, self._restamped, self._corrupted = [], [], []
+        self._unreported = 0
+        if self.on_report is not None and (changed or restamped or corrupted):
+            self.on_report(changed, restamped, corrupted)
+
+    def _run(self):
+        pending = {}  # future -> (index, path)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                   thread_name_prefix="Fingerprint") as pool:
+            while not self._stop_event.is_set():
+                try:
+                    job = self._jobs.get(timeout=None if not pending and not self._unreported else 0.05)
+                except queue.Empty:
+                    job = False
+                if job is None:
+                    break
+                if job:
+                    # At most two files per worker in flight, so memory stays bounded
+                    pending[pool.submit(self._fingerprint, *job)] = job
+                    if len(pending) < 2 * self.workers:
+                        continue
+                if pending:
+                    done, _ = concurrent.futures.wait(pending, timeout=0.05,
+                                                      return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        self._collect(*pending.pop(future), future)
+                if self._unreported >= FINGERPRINT_REPORT_EVERY or (not pending and self._jobs.empty()):
+                    self._report()
+                    with self._idle_lock:
+                        if not pending and self._jobs.empty():
+                            self._idle.set()
+            for future in pending:
+                future.cancel()
+        self._report()
+        self._idle.set()
+
+
+# Session contact sheet (grid view) settings
+GRID_MAX_CELLS = 16  # Largest session shown as one grid
+GRID_PAGE_SIZE = 12  # Images per page when the current session has a single image
+GRID_LABEL_HEIGHT = 18  # Caption height under each thumbnail
+GRID_CELL_PADDING = 4
+GRID_CACHE_BUDGET_MB = 64  # Memory budget for grid thumbnails kept in RAM
+CONTACT_SHEET_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))  # Worker processes for grid thumbnails
+GRID_LABEL_COLORS = {
+    "(Unclassified)": "#9E9E9E",
+    "no label": "#FB8C00",
+    "read failure": "#E91E63",
+    "incomplete": "#1E88E5",
+    "unreadable": "#7CB342",
+}
+
+
+def contact_sheet_layout(count, canvas_size, aspect=4 / 3, label_height=GRID_LABEL_HEIGHT):
+    """Return (columns, rows) giving the largest thumbnails for count images on the canvas"""
+    if count <= 0:
+        return (0, 0)
+    canvas_width, canvas_height = canvas_size
+    best = (1, count)
+    best_scale = -1.0
+    for columns in range(1, count + 1):
+        rows = -(-count // columns)
+        cell_width = canvas_width / columns
+        cell_height = canvas_height / rows - label_height
+        scale = min(cell_width / aspect, cell_height)
+        if scale > best_scale:
+            best, best_scale = (columns, rows), scale
+    return best
+
+
+def make_contact_sheet_thumbnail(path, box):
+    """Worker-process entry point: decode path at reduced resolution and shrink it into box.
+
+    Returns (path, thumbnail, source_size); thumbnail is None for unreadable files.
+    """
+    try:
+        img, _, source_size = decode_image_file(path, fit_size=box)
+        img.thumbnail(box, Image.Resampling.LANCZOS)
+        return path, img, source_size
+    except Exception:
+        return path, None, None
+
+
+class ContactSheetLoader:
+    """Background loader producing grid thumbnails in batches.
+
+    Each request() is one batch: thumbnails already in the cache or in the folder's
+    ThumbnailStore are used directly, the rest are decoded in one pass over a pool of
+    worker processes. A new display request replaces a pending one; prefetch requests
+    (the next session) only run when no display request is waiting.
+    """
+
+    def __init__(self, cache, workers=CONTACT_SHEET_WORKERS):
+        self.cache = cache
+        self.workers = workers
+        self.decoded_count = 0  # Thumbnails produced by the worker pool (for tests/diagnostics)
+        self._executor = None
+        self._pending = None  # (request_id, paths, box, thumbnails, callback)
+        self._pending_prefetch = None
+        self._next_id = 0
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="ContactSheetLoader")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def request(self, paths, box, callback=None, thumbnails=None, prefetch=False):
+        """Queue a batch of thumbnails; callback(request_id, {path: thumbnail}) runs on the loader thread"""
+        with self._condition:
+            self._next_id += 1
+            batch = (self._next_id, list(paths), tuple(box), thumbnails, callback)
+            if prefetch:
+                self._pending_prefetch = batch
+            else:
+                self._pending = batch
+            self._condition.notify()
+            return self._next_id
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._pending = None
+            self._pending_prefetch = None
+            self._condition.notify()
+
+    def _run(self):
+        try:
+            while True:
+                with self._condition:
+                    while self._pending is None and self._pending_prefetch is None and not self._stopped:
+                        self._condition.wait()
+                    if self._stopped:
+                        return
+                    if self._pending is not None:
+                        batch, self._pending = self._pending, None
+                    else:
+                        batch, self._pending_prefetch = self._pending_prefetch, None
+                request_id, paths, box, thumbnails, callback = batch
+                results = self.load_batch(paths, box, thumbnails)
+                if callback is not None:
+                    callback(request_id, results)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def load_batch(self, paths, box, thumbnails=None):
+        """Return {path: thumbnail} for paths, decoding the missing ones in worker processes"""
+        results = {}
+        missing = []
+        for path in paths:
+            stamp = get_file_stamp(path)
+            img = self.cache.get((path, box), stamp)
+            if img is None and thumbnails is not None:
+                img = self._from_store(thumbnails, path, box, stamp)
+            if img is not None:
+                results[path] = img
+            else:
+                missing.append(path)
+
+        for path, img, _ in self._decode(missing, box):
+            if img is not None:
+                self.cache.put((path, box), img, get_file_stamp(path))
+                results[path] = img
+        return results
+
+    def _from_store(self, thumbnails, path, box, stamp):
+        """Shrink a stored thumbnail into box, preferring the small one when it is large enough"""
+        for kind in ("small", "fit"):
+            info = thumbnails.info(path, kind, stamp)
+            if info is None:
+                continue
+            (width, height), source_size = info
+            needed = min(box[0] / source_size[0], box[1] / source_size[1], 1.0)
+            if width >= int(source_size[0] * needed) and height >= int(source_size[1] * needed):
+                found = thumbnails.get(path, kind, stamp)
+                if found is not None:
+                    img = found[0]
+                    img.thumbnail(box, Image.Resampling.LANCZOS)
+                    self.cache.put((path, box), img, stamp)
+                    return img
+        return None
+
+    def _decode(self, paths, box):
+        """Decode paths into box-sized thumbnails, in parallel when the process pool is available"""
+        if not paths:
+            return []
+        if self._executor is None and self.workers > 1:
+            try:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+            except (OSError, NotImplementedError, ValueError):
+                self.workers = 1
+        if self._executor is not None:
+            try:
+                decoded = list(self._executor.map(make_contact_sheet_thumbnail, paths, [box] * len(paths)))
+                self.decoded_count += len(decoded)
+                return decoded
+            except Exception as e:
+                # A broken pool (e.g. a worker was killed) falls back to decoding in this thread
+                print(f"Contact sheet worker pool failed, decoding in-process: {e}")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                self.workers = 1
+        decoded = [make_contact_sheet_thumbnail(path, box) for path in paths]
+        self.decoded_count += len(decoded)
+        return decoded
+
+
+# Re-render scheduling for resize / zoom bursts
+RENDER_FRAME_MS = 16  # At most one preview render per frame (~60 Hz)
+RENDER_SETTLE_MS = 150  # Idle time before the high-quality render replaces the preview
+NAVIGATION_REPEAT_MS = 150  # Steps closer together than this (key auto-repeat) defer the full render
+NAVIGATION_PREVIEW_MS = 33  # Cached thumbnails of skipped images are drawn at most ~30 times a second
+
+
+class RenderScheduler:
+    """Coalesce bursts of re-render requests into one fast frame plus one final render.
+
+    Every request() marks the view dirty. A dirty view is drawn with fast_render at
+    most once per frame_ms, and full_render runs once no request has arrived for
+    settle_ms. after/after_cancel are the Tk timer functions (root.after and
+    root.after_cancel), so all callbacks run on the Tk thread.
+    """
+
+    def __init__(self, after, after_cancel, fast_render, full_render,
+                 frame_ms=RENDER_FRAME_MS, settle_ms=RENDER_SETTLE_MS):
+        self._after = after
+        self._after_cancel = after_cancel
+        self.fast_render = fast_render
+        self.full_render = full_render
+        self.frame_ms = frame_ms
+        self.settle_ms = settle_ms
+        self._dirty = False
+        self._frame_job = None
+        self._settle_job = None
+
+    @property
+    def pending(self):
+        return self._frame_job is not None or self._settle_job is not None
+
+    def request(self):
+        """Ask for a re-render; cheap enough to call from every Configure / wheel event"""
+        self._dirty = True
+        if self._frame_job is None:
+            self._frame_job = self._after(self.frame_ms, self._on_frame)
+        # Every request pushes the high-quality render back until input goes idle
+        if self._settle_job is not None:
+            self._after_cancel(self._settle_job)
+        self._settle_job = self._after(self.settle_ms, self._on_settled)
+
+    def cancel(self):
+        """Drop pending renders (e.g. a direct full render already happened)"""
+        for job in (self._frame_job, self._settle_job):
+            if job is not None:
+                self._after_cancel(job)
+        self._frame_job = None
+        self._settle_job = None
+        self._dirty = False
+
+    def _on_frame(self):
+        self._frame_job = None
+        if self._dirty:
+            self._dirty = False
+            self.fast_render()
+
+    def _on_settled(self):
+        self._settle_job = None
+        if self._frame_job is not None:
+            # The final render supersedes a preview that has not been drawn yet
+            self._after_cancel(self._frame_job)
+            self._frame_job = None
+        self._dirty = False
+        self.full_render()
+
+
+def viewport_source_box(view_box, display_size, source_size):
+    """Map the visible part of a zoomed image back to source pixels.
+
+    view_box is (left, top, right, bottom) in zoomed display coordinates and may
+    extend past the image. Returns (display_box, source_box) clipped to the image,
+    or None when nothing of the image is visible.
+    """
+    display_width, display_height = display_size
+    if display_width <= 0 or display_height <= 0:
+        return None
+    left = max(0, int(view_box[0]))
+    top = max(0, int(view_box[1]))
+    right = min(display_width, int(math.ceil(view_box[2])))
+    bottom = min(display_height, int(math.ceil(view_box[3])))
+    if right <= left or bottom <= top:
+        return None
+    scale_x = source_size[0] / display_width
+    scale_y = source_size[1] / display_height
+    source_box = (left * scale_x, top * scale_y,
+                  min(right * scale_x, source_size[0]), min(bottom * scale_y, source_size[1]))
+    return (left, top, right, bottom), source_box
+
+
+# Reusable Tk photo buffers
+TILE_PHOTO_POOL_SIZE = 48  # Spare tile photos kept for reuse (about 9 MB of RGB at 256x256)
+
+
+def _photo_key(img):
+    """Size and mode a Tk photo must have for img to be pasted into it unchanged"""
+    return img.size, img.mode
+
+
+class PhotoSlot:
+    """Persistent Tk photo for one place on the canvas (the fitted image, a preview).
+
+    show() pastes new pixels into the existing photo in place and only allocates a
+    new PhotoImage when the frame size or mode changes, so stepping through images
+    of the same camera does not create and destroy a Tcl photo per navigation.
+    photo_factory defaults to ImageTk.PhotoImage.
+    """
+
+    def __init__(self, photo_factory=None):
+        self._photo_factory = photo_factory or ImageTk.PhotoImage
+        self.photo = None
+        self._key = None
+        self.allocations = 0  # PhotoImages created so far (for measurements)
+
+    def show(self, img):
+        """Return a photo holding img, reusing the current one when it has the same size and mode"""
+        key = _photo_key(img)
+        if self.photo is not None and key == self._key:
+            self.photo.paste(img)
+        else:
+            # paste() would convert L <-> RGB, so a mode change needs a new photo as well
+            self.photo = self._photo_factory(img)
+            self._key = key
+            self.allocations += 1
+        return self.photo
+
+    def release(self):
+        """Drop the photo (e.g. when the canvas is cleared for another view)"""
+        self.photo = None
+        self._key = None
+
+
+class PhotoPool:
+    """Free list of released Tk photos, reused for new images of the same size and mode.
+
+    The tiled 1:1 view creates and drops fixed-size tiles while panning; recycling
+    their photos avoids a Tcl photo allocation per exposed tile.
+    """
+
+    def __init__(self, photo_factory=None, limit=TILE_PHOTO_POOL_SIZE):
+        self._photo_factory = photo_factory or ImageTk.PhotoImage
+        self.limit = limit
+        self._free = {}  # (size, mode) -> list of spare photos
+        self._keys = {}  # id(photo) -> (size, mode) for photos handed out
+        self._spare = 0
+        self.allocations = 0
+
+    def acquire(self, img):
+        """Return a photo holding img, recycled from the free list when possible"""
+        key = _photo_key(img)
+        spares = self._free.get(key)
+        if spares:
+            photo = spares.pop()
+            self._spare -= 1
+            photo.paste(img)
+        else:
+            photo = self._photo_factory(img)
+            self.allocations += 1
+        self._keys[id(photo)] = key
+        return photo
+
+    def fits(self, photo, img):
+        """True when img can be pasted into photo (a photo of this pool with the same size and mode)"""
+        return self._keys.get(id(photo)) == _photo_key(img)
+
+    def release(self, photo):
+        """Give a photo back once no canvas item shows it anymore"""
+        key = self._keys.pop(id(photo), None)
+        if key is None or self._spare >= self.limit:
+            return
+        self._free.setdefault(key, []).append(photo)
+        self._spare += 1
+
+    def clear(self):
+        self._free.clear()
+        self._keys.clear()
+        self._spare = 0
+
+
+# Overview minimap of the zoomed view
+MINIMAP_SIZE = (200, 160)  # Bounding box of the minimap in screen pixels
+MINIMAP_MARGIN = 10  # Distance of the minimap from the top-right corner of the canvas
+MINIMAP_CACHE_DIR = "minimaps"  # Inside THUMBNAIL_CACHE_DIR
+MINIMAP_MEMORY_ENTRIES = 64  # Minimaps kept mapped in memory
+
+
+def make_minimap(img, box=MINIMAP_SIZE):
+    """Return the minimap pixels of img (a uint8 array fitted into box)"""
+    small = resample_image(img, fit_display_size(img.size, box), mode=RESAMPLE_SHARP)
+    return np.ascontiguousarray(np.asarray(small))
+
+
+def minimap_viewport_rect(view_box, display_size, minimap_size):
+    """Map the visible part of the zoomed image (view_box in display pixels) to a minimap rectangle.
+
+    Returns (left, top, right, bottom) in minimap pixels, clipped to the minimap.
+    """
+    scale_x = minimap_size[0] / max(1, display_size[0])
+    scale_y = minimap_size[1] / max(1, display_size[1])
+    left, top, right, bottom = view_box
+    return (max(0, left * scale_x), max(0, top * scale_y),
+            min(minimap_size[0], right * scale_x), min(minimap_size[1], bottom * scale_y))
+
+
+def minimap_point_to_source(x, y, minimap_size, source_size):
+    """Source image coordinates of a point on the minimap (clamped to the image)"""
+    x = max(0, min(x, minimap_size[0]))
+    y = max(0, min(y, minimap_size[1]))
+    return x * source_size[0] / minimap_size[0], y * source_size[1] / minimap_size[1]
+
+
+class MinimapCache:
+    """Low-resolution overview copies of images, stored as .npy files and memory-mapped back.
+
+    A minimap is made once per image version from pixels that are already decoded
+    (the zoom pyramid), never from the full-resolution file. Files are named after
+    the image path, its stamp and the view variant, so a changed image simply gets a
+    new minimap. Without a writable cache_dir the minimaps live in memory only.
+    """
+
+    def __init__(self, cache_dir=None, limit=MINIMAP_MEMORY_ENTRIES):
+        self.cache_dir = cache_dir
+        self.limit = limit
+        self._mapped = OrderedDict()  # key -> array (a read-only memmap when stored on disk)
+        self.builds = 0
+        if cache_dir is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Minimap cache disabled for {cache_dir}: {e}")
+                self.cache_dir = None
+
+    def _file_path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npy")
+
+    def get(self, path, stamp, variant=None):
+        """Return the stored minimap array of this image version, or None"""
+        if stamp is None:
+            return None
+        key = (path, tuple(stamp), variant)
+        pixels = self._mapped.get(key)
+        if pixels is not None:
+            self._mapped.move_to_end(key)
+            return pixels
+        if self.cache_dir is None:
+            return None
+        try:
+            pixels = np.load(self._file_path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        self._remember(key, pixels)
+        return pixels
+
+    def get_or_build(self, path, stamp, source, variant=None):
+        """Return the minimap of path, making it from source (an image or a callable returning one) if needed"""
+        pixels = self.get(path, stamp, variant)
+        if pixels is not None or stamp is None:
+            return pixels
+        img = source() if callable(source) else source
+        if img is None:
+            return None
+        pixels = make_minimap(img)
+        self.builds += 1
+        key = (path, tuple(stamp), variant)
+        if self.cache_dir is not None:
+            file_path = self._file_path(key)
+            try:
+                temp_path = file_path + ".tmp"
+                with open(temp_path, "wb") as f:
+                    np.save(f, pixels)
+                os.replace(temp_path, file_path)
+                pixels = np.load(file_path, mmap_mode="r")
+            except OSError as e:
+                print(f"Could not store minimap: {e}")
+        self._remember(key, pixels)
+        return pixels
+
+    def _remember(self, key, pixels):
+        self._mapped[key] = pixels
+        self._mapped.move_to_end(key)
+        while len(self._mapped) > self.limit:
+            self._mapped.popitem(last=False)
+
+    def clear(self):
+        self._mapped.clear()
+
+
+# Session blink/compare mode
+COMPARE_BLINK_MS = 400  # Default time each image of the session is shown while blinking
+COMPARE_MIN_BLINK_MS = 50
+COMPARE_MAX_FRAMES = GRID_MAX_CELLS  # Images of one session decoded for comparison
+COMPARE_RENDER_CACHE_ENTRIES = 192  # Rendered fit views / zoom tiles kept so repeated flips only paste
+COMPARE_BUDGET_MB = 256  # Memory budget for the aligned frames (and current pyramid) of one compare run
+
+
+def align_compare_frames(images, size):
+    """Fit every image into size (enlarging if needed) and center it, so all frames share one geometry.
+
+    All frames get the same mode (RGB as soon as one image has color), so a
+    flip can be pasted into the same photo.
+    """
+    mode = "L" if all(img.mode == "L" for img in images) else "RGB"
+    frames = []
+    for img in images:
+        if img.mode != mode:
+            img = img.convert(mode)
+        if img.size != size:
+            scale = min(size[0] / img.width, size[1] / img.height)
+            fitted = (max(1, min(size[0], round(img.width * scale))), max(1, min(size[1], round(img.height * scale))))
+            frame = Image.new(mode, size)
+            frame.paste(resample_image(img, fitted, mode=RESAMPLE_SHARP),
+                        ((size[0] - fitted[0]) // 2, (size[1] - fitted[1]) // 2))
+            img = frame
+        frames.append(img)
+    return frames
+
+
+def compare_frames_nbytes(count, size, gray):
+    """Memory held by count aligned frames of size, plus the zoom pyramid of the current one"""
+    frame_bytes = size[0] * size[1] * (1 if gray else 3)
+    return count * frame_bytes + frame_bytes // 3
+
+
+def decode_compare_frames(paths, anchor_index, decode, budget_bytes=COMPARE_BUDGET_MB * 1024 * 1024):
+    """Decode the anchor and its nearest neighbours until the aligned frames would exceed budget_bytes.
+
+    Neighbours are taken alternately after and before the anchor, so the kept frames
+    stay one contiguous run of the session. The anchor and one neighbour are always
+    kept. Returns (paths, images, anchor_index) of the kept frames in folder order.
+    """
+    anchor = decode(paths[anchor_index])
+    kept = {anchor_index: anchor}
+    gray = anchor.mode == "L"
+    order = sorted(range(len(paths)), key=lambda i: (abs(i - anchor_index), i < anchor_index))
+    for i in order[1:]:
+        img = decode(paths[i])
+        member_gray = gray and img.mode == "L"
+        if len(kept) >= 2 and compare_frames_nbytes(len(kept) + 1, anchor.size, member_gray) > budget_bytes:
+            break
+        kept[i] = img
+        gray = member_gray
+    indices = sorted(kept)
+    return [paths[i] for i in indices], [kept[i] for i in indices], indices.index(anchor_index)
+
+
+class CompareFrames:
+    """The images of one session, decoded once and aligned to the shown image for blinking.
+
+    Frames share the size of the anchor image, so a zoom/pan viewport means the same
+    area in every frame. Fit-size renders and zoom tiles are memoized per frame:
+    going back and forth between frames at a fixed view is a paste, with no decoding
+    or file access at all. Only the current frame keeps a zoom pyramid.
+    """
+
+    def __init__(self, paths, images, anchor_index=0, full_resolution=True, source_size=None, session_size=None):
+        self.paths = list(paths)
+        self.size = images[anchor_index].size
+        self.frames = align_compare_frames(images, self.size)
+        self.index = anchor_index
+        self.anchor = self.paths[anchor_index]
+        self.full_resolution = full_resolution  # Frames have the anchor's source resolution (zoom views)
+        self.source_size = source_size or self.size
+        self.session_size = session_size or len(self.paths)  # Images of the session before the budget cut
+        self._pyramids = {}
+        self._rendered = OrderedDict()
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def path(self):
+        return self.paths[self.index]
+
+    def step(self, delta=1):
+        self.index = (self.index + delta) % len(self.frames)
+        return self.index
+
+    def _memoized(self, key, render):
+        img = self._rendered.get(key)
+        if img is None:
+            img = self._rendered[key] = render()
+            while len(self._rendered) > COMPARE_RENDER_CACHE_ENTRIES:
+                self._rendered.popitem(last=False)
+        else:
+            self._rendered.move_to_end(key)
+        return img
+
+    def fitted(self, display_size):
+        """Current frame resized to display_size (the fitted view)"""
+        index = self.index
+        return self._memoized((index, "fit", display_size),
+                              lambda: resample_image(self.frames[index], display_size, mode=RESAMPLE_SHARP))
+
+    def tile(self, zoom, column, row, mode=RESAMPLE_SHARP):
+        """Zoom tile of the current frame (see ImagePyramid.render_tile), or None off-image"""
+        index = self.index
+        pyramid = self._pyramids.get(index)
+        if pyramid is None:
+            # Reduced levels of the other frames are dropped; their memoized tiles stay
+            self._pyramids.clear()
+            pyramid = self._pyramids[index] = ImagePyramid(self.frames[index])
+        if mode != RESAMPLE_SHARP:
+            return pyramid.render_tile(zoom, column, row, TILE_SIZE, mode=mode)
+        return self._memoized((index, zoom, column, row),
+                              lambda: pyramid.render_tile(zoom, column, row, TILE_SIZE, mode=mode))
+
+
 class ImageLabelTool:
     def generate_sessions_tree(self):
         """Create a Sessions Tree export grouped by session class and session ID."""
@@ -61,7 +2904,7 @@ class ImageLabelTool:
 
         session_labels_map = self.calculate_session_labels()
 
-        tree_root = os.path.join(self.folder_path, "Sessions Tree")
+        tree_root = os.path.join(self.get_output_folder(), "Sessions Tree")
 
         try:
             if os.path.exists(tree_root):
@@ -115,14 +2958,14 @@ class ImageLabelTool:
                 session_counts_by_class[folder_label] += 1
 
                 for source_path in session_images:
-                    if not os.path.isfile(source_path):
+                    if get_file_stamp(source_path) is None:
                         continue
                     if self.false_noread.get(source_path, False):
                         # Skip False NoRead images entirely, regardless of session classification
                         continue
                     destination_path = os.path.join(session_folder, os.path.basename(source_path))
                     try:
-                        shutil.copy2(source_path, destination_path)
+                        copy_image_file(source_path, destination_path)
                         total_copied += 1
                     except Exception as exc:
                         errors.append((source_path, exc))
@@ -200,13 +3043,89 @@ class ImageLabelTool:
         self.false_noread = {}  # Track False NoRead status per image
         self.comments = {}  # Track comments for each image
         self.folder_path = None
+        self.folder_index = None  # FolderIndex of folder_path, shared by every folder listing
+        self.workspace = None  # Workspace when a folder tree is open instead of one folder
+        self._workspace_drain_job = None  # Pending merge of workspace folders (see drain_workspace_folders)
+        self._folder_load_token = 0  # Identifies the current background folder load (see open_image_folder)
+        self._folder_loading = False  # Revision CSV not merged yet: labels are kept but not saved
+        self._edited_while_loading = set()  # Images the user labeled before the revision CSV was merged
+        self.folder_path_text = "No folder selected"  # Folder path display without the loading status
         self.csv_filename = None
+        self.label_journals = {}  # folder -> LabelJournal of the edits not yet in its revision CSV
+        self._journal_compact_job = None  # Pending rewrite of the revision CSV(s) with the journaled edits
         self.scale_1to1 = False  # Track if we're in 1:1 scale mode
         self.current_scale_factor = 1.0  # Track current scale factor
         self.zoom_level = 1.0  # Track zoom level for manual zoom
         self.pan_start_x = 0  # For mouse panning
         self.pan_start_y = 0  # For mouse panning
         
+        # Decoded image cache with background prefetching of neighbouring images
+        self.image_cache = DecodedImageCache(IMAGE_CACHE_BUDGET_MB * 1024 * 1024)
+        self.prefetcher = ImagePrefetcher(self.image_cache, load_func=self._load_for_prefetch)
+        self.prefetch_radius = PREFETCH_RADIUS
+        self.thumbnail_store = None  # ThumbnailStore of the open folder
+        self.thumbnail_indexer = None  # Background thread filling thumbnail_store
+        self.content_fingerprinter = None  # Background digest/decode check of the folder's images
+        self.corrupted_files = set()  # Images whose fingerprint found them not decodable
+        self.filename_catalog = FilenameCatalog()  # Parsed filenames, rebuilt per folder
+        self._session_members = {}  # session_id -> list of image paths (built lazily)
+        self._session_members_source = None  # Identity of the list _session_members was built from
+        
+        # Memoized CLAHE enhancement for the Hist EQ view
+        self.contrast_enhancer = ContrastEnhancer()
+        
+        # Tiled rendering state for 1:1 / zoom mode
+        self._tile_pyramid = None  # ImagePyramid of the current image
+        self._tile_pyramid_key = None  # (path, stamp, histogram_eq) the pyramid was built for
+        self._tiled_view = None  # Zoom, display size and drawn tiles of the current 1:1 view
+        self.tile_photos = PhotoPool()  # Tile PhotoImages recycled while panning
+        self.display_photo = PhotoSlot()  # Fitted image / preview photo, repainted in place
+        self._tile_render_job = None  # Pending after_idle tile render
+        self._tile_refine_job = None  # Pending sharp redraw of tiles drawn while panning
+        self._pending_zoom_center = None  # Image point to center before the first tile render
+        
+        # Overview minimap drawn over the zoomed view (pixels cached per image, see MinimapCache)
+        self.minimap_cache = MinimapCache()
+        self.minimap_photo = PhotoSlot()
+        self._minimap_geometry = None  # (left, top, width, height) of the drawn minimap in window pixels
+        self._minimap_drag = False  # Button-1 went down on the minimap: drags jump instead of panning
+        
+        # Session blink/compare mode: sibling images decoded once, then flipped without I/O
+        self.compare_loader = ImageLoader(workers=1)
+        self.compare_frames = None  # CompareFrames being blinked
+        self._compare_key = None  # get_compare_key() of the frames shown or being decoded
+        self._compare_request = None  # Request ID of the frames being decoded
+        self._compare_job = None  # Pending blink flip
+        self._fit_item = None  # Canvas item of the fitted image (compare flips repaint its photo)
+        
+        # Resize / zoom bursts draw a cheap preview per frame and one full render once idle
+        self.render_scheduler = RenderScheduler(self.root.after, self.root.after_cancel,
+                                                self.render_fast_preview, self.render_settled_view)
+        self._rendered_view = None  # View signature of the last full render
+        
+        # Held O/P keys step current_index per event but only render where navigation stops
+        self.navigation_scheduler = RenderScheduler(self.root.after, self.root.after_cancel,
+                                                    self.render_navigation_preview, self.finish_navigation,
+                                                    frame_ms=NAVIGATION_PREVIEW_MS, settle_ms=NAVIGATION_REPEAT_MS)
+        self._last_navigation_time = 0.0  # time.monotonic() when the last navigation render finished
+        self._view_source = None  # Decoded/enhanced buffers of the shown image (see get_view_image)
+        
+        # The image to show is read and decoded off the Tk thread (slow network folders)
+        self.image_loader = ImageLoader()
+        
+        # 12/16-bit display window (None = auto per image) and the page shown of multi-page TIFFs
+        self.display_window = None
+        self._image_page = None  # (path, page) while a page other than the first is shown
+        self._page_counts = {}  # path -> (stamp, number of pages)
+        self._view_load = None  # (path, stamp, reduction, histogram_eq, request_id) being loaded
+        
+        # Session contact sheet (grid view) with batched, multi-process thumbnailing
+        self.grid_mode = False
+        self.grid_cache = DecodedImageCache(GRID_CACHE_BUDGET_MB * 1024 * 1024)
+        self.contact_sheet_loader = ContactSheetLoader(self.grid_cache)
+        self._grid_view = None  # Layout, thumbnails and PhotoImages of the drawn grid
+        self._grid_request_id = None  # Loader request the current grid is waiting for
+        
         # Track previously seen files for new file detection
         self.previously_seen_files = set()
         
@@ -289,6 +3208,18 @@ class ImageLabelTool:
                                   padx=15, pady=6, relief="flat")
         self.btn_select.pack(side=tk.LEFT)
         
+        # Zip/tar archives are opened in place, like a folder
+        self.btn_open_archive = tk.Button(top_frame, text="Open Archive", command=self.select_archive,
+                                          bg="#A5D6A7", fg="white", font=("Arial", 10, "bold"),
+                                          padx=15, pady=6, relief="flat")
+        self.btn_open_archive.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # A tree of day/line folders, indexed in the background and shown as one set
+        self.btn_open_workspace = tk.Button(top_frame, text="Open Workspace", command=self.select_workspace,
+                                            bg="#A5D6A7", fg="white", font=("Arial", 10, "bold"),
+                                            padx=15, pady=6, relief="flat")
+        self.btn_open_workspace.pack(side=tk.LEFT, padx=(5, 0))
+        
         # Folder path display
         self.folder_path_var = tk.StringVar(value="No folder selected")
         self.folder_path_label = tk.Label(top_frame, textvariable=self.folder_path_var, 
@@ -296,6 +3227,9 @@ class ImageLabelTool:
                                          wraplength=400, justify=tk.LEFT, anchor="w", width=50)
         self.folder_path_label.pack(side=tk.LEFT, padx=(10, 0))
         
+        # Busy indicator while a folder or workspace is still loading in the background
+        self.folder_progress = ttk.Progressbar(top_frame, mode="indeterminate", length=120)
+        
         # Total number of sessions input (right side)
         total_frame = tk.Frame(top_frame, bg="#FAFAFA")
         total_frame.pack(side=tk.RIGHT)
@@ -332,7 +3266,8 @@ class ImageLabelTool:
             "unreadable only",
             "OCR recovered only",
             "False NoRead only",
-            "Session #"
+            "Session #",
+            "Corrupted files only"
         ]
         self.filter_menu = tk.OptionMenu(filter_frame, self.filter_var, *filter_options, command=self.on_filter_changed)
         self.filter_menu.config(bg="#F5F5F5", font=("Arial", 10), relief="solid", bd=1)
@@ -371,6 +3306,22 @@ class ImageLabelTool:
                                 padx=8, pady=3, relief="flat")
         self.btn_1to1.pack(side=tk.LEFT, padx=(0, 10))
         
+        # Session grid (contact sheet) button
+        self.btn_grid = tk.Button(toolbar_frame, text="Grid View", command=self.toggle_grid_view,
+                                  bg="#80CBC4", fg="white", font=("Arial", 10, "bold"),
+                                  padx=8, pady=3, relief="flat")
+        self.btn_grid.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Session blink/compare button and blink interval
+        self.btn_compare = tk.Button(toolbar_frame, text="Compare", command=self.toggle_compare_mode,
+                                     bg="#80CBC4", fg="white", font=("Arial", 10, "bold"),
+                                     padx=8, pady=3, relief="flat")
+        self.btn_compare.pack(side=tk.LEFT, padx=(0, 3))
+        self.compare_interval_var = tk.StringVar(value=str(COMPARE_BLINK_MS))
+        tk.Entry(toolbar_frame, textvariable=self.compare_interval_var, width=5,
+                 font=("Arial", 9)).pack(side=tk.LEFT)
+        tk.Label(toolbar_frame, text="ms", bg="#E8E8E8", font=("Arial", 9)).pack(side=tk.LEFT, padx=(2, 10))
+        
         # Zoom controls
         tk.Label(toolbar_frame, text="Zoom:", bg="#E8E8E8", font=("Arial", 10)).pack(side=tk.LEFT, padx=(0, 5))
         
@@ -392,6 +3343,23 @@ class ImageLabelTool:
                                                    bg="#E8E8E8", font=("Arial", 9, "bold"),
                                                    selectcolor="white", padx=5, pady=2)
         self.histogram_eq_checkbox.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Overview minimap while zoomed in
+        self.minimap_enabled = tk.BooleanVar(value=True)
+        self.minimap_checkbox = tk.Checkbutton(toolbar_frame, text="🗺 Minimap",
+                                               variable=self.minimap_enabled,
+                                               command=self.update_minimap,
+                                               bg="#E8E8E8", font=("Arial", 9, "bold"),
+                                               selectcolor="white", padx=5, pady=2)
+        self.minimap_checkbox.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Window/level for 12/16-bit TIFF/PGM images ("auto" or "low-high")
+        tk.Label(toolbar_frame, text="Window:", bg="#E8E8E8", font=("Arial", 10)).pack(side=tk.LEFT, padx=(0, 3))
+        self.display_window_var = tk.StringVar(value="auto")
+        self.display_window_entry = tk.Entry(toolbar_frame, textvariable=self.display_window_var, width=11,
+                                             font=("Arial", 9))
+        self.display_window_entry.pack(side=tk.LEFT, padx=(0, 10))
+        self.display_window_entry.bind('<Return>', self.on_display_window_changed)
 
         # Export button for current filter
         self.btn_gen_filter_folder = tk.Button(toolbar_frame, text="Gen Filter Folder", 
@@ -451,7 +3419,8 @@ class ImageLabelTool:
         # Scrollbars
         self.h_scrollbar = tk.Scrollbar(image_frame, orient="horizontal", command=self.canvas.xview)
         self.v_scrollbar = tk.Scrollbar(image_frame, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(xscrollcommand=self.h_scrollbar.set, yscrollcommand=self.v_scrollbar.set)
+        self.canvas.configure(xscrollcommand=self._on_canvas_xview_changed,
+                              yscrollcommand=self._on_canvas_yview_changed)
         
         # Grid layout for canvas and scrollbars
         self.canvas.grid(row=0, column=0, sticky="nsew")
@@ -839,6 +3808,8 @@ class ImageLabelTool:
         self.last_auto_run = None
         self.countdown_job = None
         self.countdown_end_time = None
+        self.folder_watcher = None  # Reports new images within milliseconds while monitoring
+        self._watch_drain_job = None
 
         # Bind window resize event to update image display
         self.root.bind('<Configure>', self.on_window_resize)
@@ -863,6 +3834,10 @@ class ImageLabelTool:
         self.root.bind('<KeyPress-p>', self.next_image_shortcut)
         self.root.bind('<KeyPress-P>', self.next_image_shortcut)
         
+        # Bind Page Up/Down for the pages of multi-page TIFFs
+        self.root.bind('<Next>', self.next_page_shortcut)
+        self.root.bind('<Prior>', self.prev_page_shortcut)
+        
         # Bind Home key for go to first image
         self.root.bind('<Home>', self.go_to_first_image_shortcut)
         
@@ -878,6 +3853,14 @@ class ImageLabelTool:
         self.root.bind('<Shift-H>', self.histogram_eq_shortcut)
         self.root.bind('<Shift-h>', self.histogram_eq_shortcut)
         
+        # Bind Shift+G for the session grid view
+        self.root.bind('<Shift-G>', self.grid_view_shortcut)
+        self.root.bind('<Shift-g>', self.grid_view_shortcut)
+        
+        # Bind Shift+C for the session blink/compare mode
+        self.root.bind('<Shift-C>', self.compare_mode_shortcut)
+        self.root.bind('<Shift-c>', self.compare_mode_shortcut)
+        
         # Session diagnostic shortcut
         self.root.bind('<Control-d>', self.session_diagnostic_shortcut)
         self.root.bind('<Control-D>', self.session_diagnostic_shortcut)
@@ -959,6 +3942,29 @@ class ImageLabelTool:
 
     def on_closing(self):
         """Handle application cleanup before closing"""
+        # Write journaled label edits into the revision CSV
+        if hasattr(self, 'label_journals'):
+            self.close_label_journals()
+        
+        # Stop background image prefetching and loading
+        if hasattr(self, 'prefetcher'):
+            self.prefetcher.stop()
+        if hasattr(self, 'image_loader'):
+            self.image_loader.stop()
+        if hasattr(self, 'compare_loader'):
+            self.stop_compare()
+            self.compare_loader.stop()
+        
+        # Stop the grid thumbnail loader and its worker processes
+        if hasattr(self, 'contact_sheet_loader'):
+            self.contact_sheet_loader.stop()
+        
+        # Stop thumbnail indexing and persist the thumbnail index
+        if hasattr(self, 'thumbnail_store'):
+            self.close_thumbnail_store()
+        if hasattr(self, 'content_fingerprinter'):
+            self.stop_fingerprinter()
+        
         # Cancel any running timer jobs to prevent errors
         if hasattr(self, 'countdown_job') and self.countdown_job:
             self.root.after_cancel(self.countdown_job)
@@ -968,6 +3974,12 @@ class ImageLabelTool:
             self.root.after_cancel(self.auto_timer_job)
             self.auto_timer_job = None
         
+        if hasattr(self, 'folder_watcher'):
+            self.stop_folder_watcher()
+        
+        if hasattr(self, 'workspace'):
+            self.close_workspace()
+        
         # Close the application
         self.root.destroy()
 
@@ -975,73 +3987,260 @@ class ImageLabelTool:
         folder = filedialog.askdirectory()
         if not folder:
             return
+        self.open_image_folder(folder)
+
+    def select_archive(self):
+        """Open a zip/tar archive of images as if it were an extracted folder"""
+        archive = filedialog.askopenfilename(title="Open image archive",
+                                             filetypes=[("Image archives", "*.zip *.tar"), ("All files", "*.*")])
+        if not archive:
+            return
+        try:
+            # Builds (or loads) the member index once; members are then read in place
+            get_archive_source(archive)
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            messagebox.showerror("Open Archive", f"Cannot open {archive}:\n{e}\n\n"
+                                 "Only .zip and uncompressed .tar archives are supported.")
+            return
+        self.open_image_folder(archive)
+
+    def select_workspace(self):
+        """Open a directory tree of day/line image folders as one workspace"""
+        root = filedialog.askdirectory(title="Open workspace (folder tree)")
+        if not root:
+            return
+        self.open_workspace(root)
+
+    def get_output_folder(self):
+        """Folder for revision CSVs, reports and exports of the current image folder.
+
+        That is the image folder itself, or the sidecar folder next to an archive.
+        """
+        if self.folder_path and is_archive_file(self.folder_path):
+            output_folder = archive_sidecar_folder(self.folder_path)
+            os.makedirs(output_folder, exist_ok=True)
+            return output_folder
+        return self.folder_path
+
+    def get_folder_image_paths(self, refresh=True):
+        """Image paths of the open folder from its FolderIndex, brought up to date first if refresh"""
+        if self.workspace is not None:
+            return self.workspace.paths(refresh)
+        if self.folder_index is None or self.folder_index.folder != os.path.normpath(self.folder_path):
+            self.folder_index = FolderIndex(self.folder_path, self.get_folder_index_path(self.folder_path))
+            refresh = True
+        if refresh:
+            self.folder_index.refresh()
+        return self.folder_index.paths()
+
+    def get_folder_index_path(self, folder):
+        """Where the FolderIndex snapshot of folder is stored (None for archives, which cache their member table)"""
+        if is_archive_file(folder):
+            return None
+        return os.path.join(folder, THUMBNAIL_CACHE_DIR, FOLDER_INDEX_NAME)
+
+    def open_image_folder(self, folder):
+        """Open folder (a directory or a zip/tar archive) in stages.
+        
+        The first image is shown as soon as the folder is listed; the sorted index,
+        the latest revision CSV and the session groups are loaded by a background
+        thread and merged in as they become ready (see load_folder_in_background).
+        """
+        self.close_label_journals()
+        self.close_workspace()
         self.folder_path = folder
         
         # Update the folder path display
-        self.folder_path_var.set(f"Current folder: {folder}")
+        label = "archive" if is_archive_file(folder) else "folder"
+        self.folder_path_text = f"Current {label}: {folder}"
+        self.folder_path_var.set(self.folder_path_text)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.csv_filename = os.path.join(folder, f"revision_{timestamp}.csv")
-        
-        # Load all image files from the directory
-        all_files = [f for f in os.listdir(folder)
-                     if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))]
+        self.csv_filename = os.path.join(self.get_output_folder(), f"revision_{timestamp}.csv")
         
+        self.folder_index = None
         self.all_image_paths = []
-        for f in all_files:
-            # Normalize all image paths consistently
-            image_path = os.path.normpath(os.path.join(folder, f))
-            self.all_image_paths.append(image_path)
-
-        # Custom sort by trigger ID and sub-image count
-        self.all_image_paths.sort(key=self.get_image_sort_key)
+        self.image_paths = []
+        self.filename_catalog = FilenameCatalog()
         self.current_index = 0
         self.labels = {}  # Reset labels for new folder
         self.false_noread = {}  # Reset false_noread for new folder
         self.comments = {}  # Reset comments for new folder
+        self.parcel_indices = {}
+        self.next_parcel_index = 1
+        self.previously_seen_files = set()
         
-        # Initialize previously seen files with current files
-        self.previously_seen_files = set(self.all_image_paths)
-        
-        self.load_csv()  # Try to load existing CSV if any
-        self.auto_detect_total_groups()  # Auto-detect total number of sessions from filenames
-        self.apply_filter()  # Apply current filter to show appropriate images
+        # Decoded images from the previous folder are no longer useful
+        self.clear_folder_caches()
+        
+        # Thumbnails persisted next to the images make revisits cheap; index the rest in the background
+        self.open_thumbnail_store(folder)
+        self.minimap_cache = MinimapCache(os.path.join(self.get_output_folder(), THUMBNAIL_CACHE_DIR,
+                                                       MINIMAP_CACHE_DIR))
+        
+        # Labels made before the revision CSV is read are merged with it, then saved
+        self._folder_loading = True
+        self._edited_while_loading = set()
+        self._folder_load_token += 1
+        csv_path = self.csv_filename if os.path.exists(self.csv_filename) else None
+        if csv_path is None:
+            csv_path = find_latest_revision_csv(self.get_output_folder())
+        journal_path = os.path.join(self.get_output_folder(), LABEL_JOURNAL_NAME)
+        self.show_folder_progress("indexing...")
+        threading.Thread(target=self.load_folder_in_background,
+                         args=(self._folder_load_token, folder, self.get_folder_index_path(folder), csv_path,
+                               journal_path),
+                         name="FolderLoader", daemon=True).start()
         
-        # Update warning message and navigation buttons
         self.update_warning_message()
         self.update_navigation_buttons()
         self.update_log_file_button_state()  # Enable log file button when folder is selected
-        
-        # Set initial state for Jump to functionality after UI is fully initialized
+
+    def load_folder_in_background(self, token, folder, index_path, csv_path, journal_path=None):
+        """Worker of open_image_folder: index, sort, read labels and group sessions, handing each result to Tk"""
+        try:
+            # A names-only listing is enough to put the first image on screen
+            if not is_archive_file(folder):
+                first = first_image_in_folder(folder)
+                if first is not None:
+                    self.root.after(0, self._on_folder_first_image, token, first)
+            
+            # One scandir snapshot, diffed against the stored one, serves every later listing too
+            index = FolderIndex(folder, index_path)
+            index.refresh()
+            paths = index.paths()
+            # Every filename is split once; sorting, sessions and filters read the parsed parts
+            catalog = FilenameCatalog(paths)
+            
+            # Custom sort by trigger ID and sub-image count
+            paths.sort(key=lambda path: catalog.get(path).sort_key)
+            if paths:
+                self.root.after(0, self._on_folder_first_image, token, paths[0])  # Archives: first shown here
+            session_members = {}
+            for path in paths:
+                session_members.setdefault(catalog.get(path).session, []).append(path)
+            self.root.after(0, self._on_folder_indexed, token, index, catalog, paths, session_members)
+            
+            loaded = read_revision_csv(csv_path, folder) if csv_path else ({}, {}, {}, {})
+            # Edits made after the CSV was last written (the app was closed without compacting)
+            replayed = replay_label_journal(journal_path, folder, *loaded) if journal_path else 0
+            self.root.after(0, self._on_folder_labels, token, loaded, replayed)
+        except (OSError, ValueError, csv.Error, tarfile.TarError, zipfile.BadZipFile) as e:
+            self.root.after(0, self._on_folder_load_failed, token, folder, e)
+
+    def _on_folder_first_image(self, token, path):
+        """Stage 1: show the first image while the rest of the folder is still loading"""
+        if token != self._folder_load_token or self.all_image_paths:
+            return
+        self.filename_catalog.get(path)
+        self.all_image_paths = [path]
+        predicate = self.get_filter_predicate()
+        self.image_paths = [path] if predicate is None or predicate(path) else []
+        self.current_index = 0
+        self.show_image()
+
+    def _on_folder_indexed(self, token, index, catalog, paths, session_members):
+        """Stage 2: the sorted folder index - navigation, image counts and sessions become available"""
+        if token != self._folder_load_token:
+            return
+        self.folder_index = index
+        self.filename_catalog = catalog
+        self.all_image_paths = paths
+        self.previously_seen_files = set(paths)
+        self._session_members = session_members
+        self._session_members_source = (id(paths), len(paths))
+        self.auto_detect_total_groups()  # Auto-detect total number of sessions from filenames
+        self.refresh_filter_view()
+        self.start_thumbnail_indexer()
+        self.fingerprint_images(index, paths)
+        self.show_folder_progress(f"{len(paths)} images, loading labels...")
+
+    def _on_folder_labels(self, token, loaded, replayed=0):
+        """Stage 3: labels of the latest revision CSV and journal - label filters and stats become available"""
+        if token != self._folder_load_token:
+            return
+        labels, ocr_readable, false_noread, comments = loaded
+        edited = self._edited_while_loading
+        self._edited_while_loading = set()
+        for stored, current in ((labels, self.labels), (ocr_readable, self.ocr_readable),
+                                (false_noread, self.false_noread), (comments, self.comments)):
+            # Values nobody chose explicitly (bulk marks) only fill in images without a stored value
+            for path, value in current.items():
+                stored.setdefault(path, value)
+            # What the user labeled while the CSV was loading wins over the stored value
+            for path in edited:
+                if path in current:
+                    stored[path] = current[path]
+                else:
+                    stored.pop(path, None)
+        self.labels, self.ocr_readable, self.false_noread, self.comments = labels, ocr_readable, false_noread, comments
+        self._folder_loading = False
+        self.refresh_filter_view()
+        self.update_warning_message()
+        if replayed:
+            print(f"Restored {replayed} label edits from the journal of {self.folder_path}")
+            self._open_label_journal(self.get_output_folder(), self.folder_path)  # Emptied by the save below
+        if edited or replayed:
+            self.save_csv()
+        self.hide_folder_progress()
         self.root.after_idle(self.update_jump_button_state)
 
+    def _on_folder_load_failed(self, token, folder, error):
+        if token != self._folder_load_token:
+            return
+        self._folder_loading = False
+        self.hide_folder_progress()
+        print(f"Could not load {folder}: {error}")
+        messagebox.showerror("Open Folder", f"Could not load {folder}:\n{error}")
+
+    def show_folder_progress(self, text):
+        """Show the busy indicator next to the folder path while background loading runs"""
+        self.folder_path_var.set(f"{self.folder_path_text} ({text})")
+        if not self.folder_progress.winfo_manager():
+            self.folder_progress.pack(side=tk.LEFT, padx=(10, 0))
+            self.folder_progress.start(15)
+
+    def hide_folder_progress(self):
+        self.folder_path_var.set(self.folder_path_text)
+        self.folder_progress.stop()
+        self.folder_progress.pack_forget()
+
+    def refresh_filter_view(self):
+        """Recompute the filtered view like apply_filter, but stay on the current image if it is still in it"""
+        current = self.image_paths[self.current_index] if self.image_paths and \
+            self.current_index < len(self.image_paths) else None
+        predicate = self.get_filter_predicate()
+        if predicate is None:
+            self.image_paths = self.all_image_paths.copy()
+        else:
+            self.image_paths = [path for path in self.all_image_paths if predicate(path)]
+        try:
+            self.current_index = self.image_paths.index(current)
+        except ValueError:
+            self.current_index = 0
+            self.show_image()
+        self.update_counts()
+        self.update_session_stats()
+        self.update_total_stats()
+        self.update_progress_display()
+        self.update_navigation_buttons()
+
     def get_image_sort_key(self, image_path):
         """
         Extract sorting key from image filename for proper ordering.
         Expected format: XXXXXXXXXX_XXXX_XXX_timestamp.jpg
         Returns tuple (trigger_id, sub_image_count) for sorting.
         """
-        try:
-            filename = os.path.basename(image_path)
-            # Split by underscore to get parts
-            parts = filename.split('_')
-            
-            if len(parts) >= 2:
-                # First part: trigger ID (remove leading zeros for numeric comparison)
-                trigger_id_str = parts[0]
-                trigger_id = int(trigger_id_str) if trigger_id_str.isdigit() else 0
-                
-                # Second part: sub-image count
-                sub_image_str = parts[1]
-                sub_image_count = int(sub_image_str) if sub_image_str.isdigit() else 0
-                
-                return (trigger_id, sub_image_count)
-            else:
-                # Fallback to filename if parsing fails
-                return (0, 0)
-        except (ValueError, IndexError):
-            # Fallback to filename sorting if parsing fails
-            return (0, 0)
+        key = self.get_filename_info(image_path).sort_key
+        workspace = getattr(self, 'workspace', None)
+        if workspace is not None:
+            # Folder by folder, in tree order
+            return (workspace.rank(image_path),) + key
+        return key
+
+    def get_filename_info(self, image_path):
+        """Pre-parsed FilenameInfo of image_path from the folder's filename catalog"""
+        return self.filename_catalog.get(image_path)
 
     def update_log_file_button_state(self):
         """Enable/disable the log file selection and refresh buttons based on folder selection"""
@@ -1074,7 +4273,12 @@ class ImageLabelTool:
 
     def show_image(self):
         if not self.image_paths:
+            self.prefetcher.cancel()
+            self.image_loader.cancel()
+            self._view_load = None
             self.canvas.delete("all")
+            self._rendered_view = None
+            self._view_source = None
             self.status_var.set("No images loaded.")
             self.scale_info_var.set("")
             return
@@ -1088,77 +4292,76 @@ class ImageLabelTool:
             return
             
         path = self.image_paths[self.current_index]
-        img = Image.open(path)
-        original_width, original_height = img.size
+        
+        if self._compare_key is not None and (self.grid_mode or self._compare_key[0] != path):
+            self.stop_compare()  # Navigated away from the compared session image
+        
+        if self._rendered_view == self.get_view_signature(path):
+            # Same image, mode, zoom and canvas size (e.g. after relabeling) - the canvas
+            # already shows exactly this, so only the side panel is refreshed
+            if self._pending_zoom_center is not None:
+                self._center_image_point(*self._pending_zoom_center)
+                self._pending_zoom_center = None
+            self.update_image_details(path, self.get_current_source_size())
+            return
+        
+        if self.grid_mode:
+            # Contact sheet of the current session instead of the single image
+            self.render_contact_sheet()
+            self._rendered_view = self.get_view_signature(path)
+            self.update_image_details(path, self._cached_source_size(path, 0, get_file_stamp(path))[1])
+            return
+        
+        # Get canvas dimensions (reduced for ultra-compact layout)
+        canvas_width, canvas_height = self.get_fit_size()
+        
+        # Fitted mode only needs enough pixels to cover the canvas, so let the decoder
+        # skip the rest; 1:1/zoom mode needs the full resolution
+        fit_size = None if self.scale_1to1 else (canvas_width, canvas_height)
+        
+        # In 1:1 mode the pyramid of an already enhanced image can be reused as is
+        histogram_eq = hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get()
+        stamp = get_file_stamp(path)
+        pyramid_key = (path, stamp, histogram_eq, self.get_view_variant(path))
+        reuse_pyramid = (self.scale_1to1 and self._tile_pyramid is not None
+                         and self._tile_pyramid_key == pyramid_key)
+        
+        if reuse_pyramid:
+            # Zoom steps are resampled from the pyramid - nothing is decoded or enhanced again
+            img = self._tile_pyramid.levels[0]
+            original_width, original_height = self._tile_pyramid.size
+        elif not self.is_view_image_ready(path, stamp, fit_size, histogram_eq):
+            # Reading may block for seconds on network folders: load in the background,
+            # show a placeholder meanwhile and come back here when the pixels arrive
+            self.load_view_image(path, stamp, fit_size, histogram_eq)
+            return
+        else:
+            # Decoded (and, with Hist EQ, enhanced) buffer held for as long as this image is shown
+            img, (original_width, original_height) = self.get_view_image(path, fit_size, histogram_eq)
             # Debug: uncomment for troubleshooting
             # print(f"📂 LOAD DEBUG: Loaded image {os.path.basename(path)} size ({original_width}x{original_height})")
         
-        # Apply histogram equalization if enabled
-        if hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get():
-            img = self.apply_histogram_equalization(img)
-            # Debug: uncomment for troubleshooting
-            # new_width, new_height = img.size
-            # print(f"📂 LOAD DEBUG: After histogram equalization size ({new_width}x{new_height})")        # Clear any previous content and set normal background
+        # Clear any previous content and set normal background
         self.canvas.configure(bg="black")
         self.canvas.delete("all")
         
-        # Get canvas dimensions (reduced for ultra-compact layout)
-        canvas_width = max(350, self.canvas.winfo_width())  # Reduced from 400
-        canvas_height = max(250, self.canvas.winfo_height())  # Reduced from 300
-        if canvas_width <= 1 or canvas_height <= 1:
-            canvas_width, canvas_height = 350, 350  # Smaller default size
-        
         if self.scale_1to1:
             # Show image at 1:1 scale with current zoom level
             scale_factor = self.zoom_level
             new_width = int(original_width * scale_factor)
             new_height = int(original_height * scale_factor)
             
-            if scale_factor != 1.0:
-                display_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                # Debug: uncomment for troubleshooting
-                # print(f"🔧 RESIZE DEBUG: {original_width}x{original_height} * {scale_factor:.3f} = {new_width}x{new_height} -> actual {display_img.size}")
-            else:
-                display_img = img
-                # Debug: uncomment for troubleshooting  
-                # print(f"🔧 RESIZE DEBUG: No resize needed, keeping {display_img.size}")
+            # The zoomed image is never built as a whole; tiles are resampled from a
+            # resolution pyramid as they scroll into view (see render_visible_tiles)
+            if not reuse_pyramid:
+                self._tile_pyramid = ImagePyramid(img)
+                self._tile_pyramid_key = pyramid_key
             
             self.current_scale_factor = scale_factor
             scale_text = f"Scale: {scale_factor:.2f}\n({scale_factor*100:.1f}%)"
             
-            # Add padding around the image so any point can be centered
-            # Padding should be at least half the canvas size to allow full centering
-            padding_x = max(canvas_width // 2, 200)
-            padding_y = max(canvas_height // 2, 200)
-            
-            # Set scroll region with padding
-            scroll_width = new_width + 2 * padding_x
-            scroll_height = new_height + 2 * padding_y
-            self.canvas.configure(scrollregion=(0, 0, scroll_width, scroll_height))
-            
-            # Store expected dimensions for centering verification
-            self._expected_scroll_width = scroll_width
-            self._expected_scroll_height = scroll_height
-            
-            # Store padding for coordinate calculations
-            self.image_padding_x = padding_x
-            self.image_padding_y = padding_y
-            
-            # Debug: uncomment for troubleshooting
-            # print(f"📐 DISPLAY DEBUG: Image size ({new_width}x{new_height})")
-            # print(f"📐 DISPLAY DEBUG: Canvas size ({canvas_width}x{canvas_height})")
-            # print(f"📐 DISPLAY DEBUG: Padding ({padding_x}x{padding_y})")
-            # print(f"📐 DISPLAY DEBUG: Scroll region ({scroll_width}x{scroll_height})")
-            
-            if new_width > canvas_width or new_height > canvas_height:
+            if self._layout_zoomed_view(canvas_width, canvas_height, new_width, new_height):
                 scale_text += "\nUse mouse to pan"
-                # Show scrollbars
-                self.h_scrollbar.grid(row=1, column=0, sticky="ew")
-                self.v_scrollbar.grid(row=0, column=1, sticky="ns")
-            else:
-                # Hide scrollbars if not needed
-                self.h_scrollbar.grid_remove()
-                self.v_scrollbar.grid_remove()
         else:
             # Calculate scale factor needed to fit image (fitted mode)
             scale_x = canvas_width / original_width
@@ -1168,8 +4371,8 @@ class ImageLabelTool:
             self.zoom_level = scale_factor  # Sync zoom level with fitted scale
             
             # Resize image to fit available space while maintaining aspect ratio
-            display_img = img.copy()
-            display_img.thumbnail((canvas_width, canvas_height), Image.Resampling.LANCZOS)
+            display_img = resample_image(img, fit_display_size(img.size, (canvas_width, canvas_height)),
+                                         mode=RESAMPLE_SHARP)
             
             scale_text = f"Scale: {scale_factor:.2f}\n({scale_factor*100:.1f}%)\nFitted to window"
             
@@ -1180,23 +4383,58 @@ class ImageLabelTool:
             self.h_scrollbar.grid_remove()
             self.v_scrollbar.grid_remove()
         
-        self.tk_img = ImageTk.PhotoImage(display_img)
-        
-        # Center the image in the canvas
-        img_width, img_height = display_img.size
         if self.scale_1to1:
-            # For 1:1 mode, place image with padding offset for proper centering
+            # For 1:1 mode, tiles are placed from the padding offset for proper centering
             # Debug: uncomment for troubleshooting
             # print(f"🖼️  IMAGE DEBUG: Placing image at ({self.image_padding_x}, {self.image_padding_y})")
-            self.canvas.create_image(self.image_padding_x, self.image_padding_y, anchor="nw", image=self.tk_img)
+            self._release_tiled_view()
+            self._tiled_view = {
+                'zoom': scale_factor,
+                'display_size': (new_width, new_height),
+                'tiles': {},  # (column, row) -> (PhotoImage, canvas item, resample mode)
+            }
+            # Move to the requested zoom center first so only the final viewport is rendered
+            pending_center = self._pending_zoom_center
+            self._pending_zoom_center = None
+            if pending_center is not None:
+                self._center_image_point(*pending_center)
+            self.render_visible_tiles()
         else:
+            self._release_tiled_view()
+            # Same-sized frames (the usual case when stepping through one camera) are
+            # pasted into the existing photo instead of allocating a new one
+            self.tk_img = self.display_photo.show(display_img)
             # For fitted mode, center the image
             center_x = canvas_width // 2
             center_y = canvas_height // 2
-            self.canvas.create_image(center_x, center_y, anchor="center", image=self.tk_img)
+            self._fit_item = self.canvas.create_image(center_x, center_y, anchor="center", image=self.tk_img)
+        
+        if self._compare_key is not None:
+            # Keep blinking over the new view: same frames, or rebuilt for a new zoom/enhancement
+            self.refresh_compare()
         
         self.scale_info_var.set(scale_text)
+        # Remember what is on screen so resize events that change nothing (window moves) are ignored
+        self._rendered_view = self.get_view_signature(path)
+        
+        self.update_image_details(path, (original_width, original_height))
+        
+        # Decode the neighbours in the background so the next step is a cache hit
+        self.schedule_prefetch()
+
+    def update_image_details(self, path, source_size=None):
+        """Refresh the label, checkboxes, comment and status widgets for the image at path"""
+        self.update_image_fields(path, source_size)
+        
+        # Update progress and label status
+        self.update_progress_display()
+        self.update_current_label_status()
         
+        # Update navigation buttons
+        self.update_navigation_buttons()
+
+    def update_image_fields(self, path, source_size=None):
+        """Refresh the per-image widgets only (no folder-wide counts), cheap enough for every key repeat"""
         label = self.labels.get(path, LABELS[0])
         self.label_var.set(label)
         
@@ -1234,18 +4472,927 @@ class ImageLabelTool:
             filename = os.path.basename(path)
             self.current_image_filename_var.set(f"📄 {filename}")
         
-        self.status_var.set(f"{os.path.basename(path)} ({self.current_index+1}/{len(self.image_paths)}) - {original_width}x{original_height}px")
+        status_text = f"{os.path.basename(path)} ({self.current_index+1}/{len(self.image_paths)})"
+        if source_size is not None:
+            status_text += f" - {source_size[0]}x{source_size[1]}px"
+        page, _ = self.get_view_variant(path)
+        known_pages = self._page_counts.get(path)
+        if page or (known_pages and known_pages[1] > 1):
+            status_text += f" - page {page + 1}/{known_pages[1] if known_pages else '?'}"
+        self.status_var.set(status_text)
         
-        # Update progress and label status
-        self.update_progress_display()
         self.update_current_label_status()
-        
-        # Update navigation buttons
         self.update_navigation_buttons()
-        self.update_current_label_status()
+
+    def _layout_zoomed_view(self, canvas_width, canvas_height, new_width, new_height):
+        """Set up the padded scroll region and scrollbars for a 1:1/zoom view; return True if panning is possible"""
+        # Add padding around the image so any point can be centered
+        # Padding should be at least half the canvas size to allow full centering
+        padding_x = max(canvas_width // 2, 200)
+        padding_y = max(canvas_height // 2, 200)
         
-        # Update navigation buttons
-        self.update_navigation_buttons()
+        # Set scroll region with padding
+        scroll_width = new_width + 2 * padding_x
+        scroll_height = new_height + 2 * padding_y
+        self.canvas.configure(scrollregion=(0, 0, scroll_width, scroll_height))
+        
+        # Store expected dimensions for centering verification
+        self._expected_scroll_width = scroll_width
+        self._expected_scroll_height = scroll_height
+        
+        # Store padding for coordinate calculations
+        self.image_padding_x = padding_x
+        self.image_padding_y = padding_y
+        
+        # Debug: uncomment for troubleshooting
+        # print(f"📐 DISPLAY DEBUG: Image size ({new_width}x{new_height})")
+        # print(f"📐 DISPLAY DEBUG: Canvas size ({canvas_width}x{canvas_height})")
+        # print(f"📐 DISPLAY DEBUG: Padding ({padding_x}x{padding_y})")
+        # print(f"📐 DISPLAY DEBUG: Scroll region ({scroll_width}x{scroll_height})")
+        
+        if new_width > canvas_width or new_height > canvas_height:
+            # Show scrollbars
+            self.h_scrollbar.grid(row=1, column=0, sticky="ew")
+            self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+            return True
+        # Hide scrollbars if not needed
+        self.h_scrollbar.grid_remove()
+        self.v_scrollbar.grid_remove()
+        return False
+
+    def get_view_signature(self, path):
+        """Everything that determines the canvas content for path (used to skip redundant renders)"""
+        histogram_eq = hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get()
+        zoom = self.zoom_level if self.scale_1to1 else None  # Fitted zoom follows the canvas size
+        return (path, get_file_stamp(path), self.get_fit_size(), self.scale_1to1, zoom, histogram_eq,
+                self.grid_mode, self.get_view_variant(path))
+
+    def request_render(self):
+        """Ask for a coalesced re-render (window resize, wheel zoom) instead of rendering right away"""
+        if hasattr(self, 'image_paths') and self.image_paths:
+            self.render_scheduler.request()
+
+    def render_settled_view(self):
+        """High-quality render once resize/zoom input has been idle for a moment"""
+        if not self.image_paths:
+            return
+        if self._rendered_view == self.get_view_signature(self.image_paths[self.current_index]):
+            return  # Nothing changed since the last full render (e.g. the window was only moved)
+        self.show_image()
+
+    def get_preview_source(self, path, zoom):
+        """Return (image, source_size) from an already decoded copy of path, or None.
+        
+        Never touches the disk: uses the zoom pyramid of the current image or any
+        cached decode, preferring the coarsest one that still has zoom resolution.
+        """
+        stamp = get_file_stamp(path)
+        histogram_eq = hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get()
+        page, window = self.get_view_variant(path)
+        if self._tile_pyramid is not None and self._tile_pyramid_key == (path, stamp, histogram_eq, (page, window)):
+            level_img, _ = self._tile_pyramid.level_for_zoom(zoom)
+            return level_img, self._tile_pyramid.size
+        if page or window is not None:
+            return None  # Cached decodes are of the first page with the auto window
+        
+        source_size = self.image_cache.get_source_size(path, stamp)
+        if source_size is None:
+            return None
+        wanted = next((reduction for reduction in DECODE_REDUCTIONS if zoom * reduction <= 1.0), 1)
+        finer = [reduction for reduction in DECODE_REDUCTIONS if reduction <= wanted]
+        coarser = [reduction for reduction in reversed(DECODE_REDUCTIONS) if reduction > wanted]
+        for reduction in finer + coarser:
+            img = self.image_cache.get((path, reduction), stamp)
+            if img is not None and histogram_eq:
+                # Only an already enhanced copy is cheap enough for a preview
+                img = self.contrast_enhancer.lookup((path, img.size), stamp)
+            if img is not None:
+                return img, source_size
+        return None
+
+    def render_fast_preview(self):
+        """Redraw the current view from already decoded pixels with a cheap resampler.
+        
+        Runs at most once per frame while the window is resized or the wheel zooms;
+        render_settled_view replaces it with the full-quality render afterwards.
+        """
+        if not self.image_paths:
+            return
+        path = self.image_paths[self.current_index]
+        if self._rendered_view == self.get_view_signature(path):
+            return  # Window moved without resizing - the current rendering is still valid
+        if self.grid_mode:
+            return  # The grid is re-laid out by the settled render from cached thumbnails
+        
+        canvas_width, canvas_height = self.get_fit_size()
+        if self.scale_1to1:
+            zoom = self.zoom_level
+        else:
+            source_size = self._cached_source_size(path, 0, get_file_stamp(path))[1]
+            if source_size is None:
+                return
+            zoom = min(canvas_width / source_size[0], canvas_height / source_size[1])
+        source = self.get_preview_source(path, zoom)
+        if source is None:
+            return  # Nothing decoded yet - the settled render decodes it
+        img, (original_width, original_height) = source
+        
+        # Tiles of the previous zoom are meaningless now; the settled render rebuilds them
+        self._release_tiled_view()
+        self.canvas.delete("all")
+        
+        if self.scale_1to1:
+            new_width = int(original_width * zoom)
+            new_height = int(original_height * zoom)
+            scale_text = f"Scale: {zoom:.2f}\n({zoom*100:.1f}%)"
+            if self._layout_zoomed_view(canvas_width, canvas_height, new_width, new_height):
+                scale_text += "\nUse mouse to pan"
+            
+            # Only resample the part of the image that is actually visible
+            padding_x, padding_y = self.image_padding_x, self.image_padding_y
+            left = self.canvas.canvasx(0) - padding_x
+            top = self.canvas.canvasy(0) - padding_y
+            view_box = (left, top, left + self.canvas.winfo_width(), top + self.canvas.winfo_height())
+            visible = viewport_source_box(view_box, (new_width, new_height), img.size)
+            if visible is not None:
+                (view_left, view_top, view_right, view_bottom), box = visible
+                preview = resample_image(img, (view_right - view_left, view_bottom - view_top), box=box,
+                                         mode=RESAMPLE_FAST)
+                self.tk_img = self.display_photo.show(preview)
+                self.canvas.create_image(padding_x + view_left, padding_y + view_top, anchor="nw", image=self.tk_img)
+            self.current_scale_factor = zoom
+        else:
+            # Same geometry as the fitted render (thumbnail never enlarges the image)
+            display_scale = min(zoom, 1.0)
+            display_size = (max(1, int(original_width * display_scale)), max(1, int(original_height * display_scale)))
+            preview = resample_image(img, display_size, mode=RESAMPLE_FAST)
+            scale_text = f"Scale: {zoom:.2f}\n({zoom*100:.1f}%)\nFitted to window"
+            self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
+            self.h_scrollbar.grid_remove()
+            self.v_scrollbar.grid_remove()
+            self.tk_img = self.display_photo.show(preview)
+            self.canvas.create_image(canvas_width // 2, canvas_height // 2, anchor="center", image=self.tk_img)
+            self.current_scale_factor = zoom
+            self.zoom_level = zoom
+        
+        self.scale_info_var.set(scale_text)
+        # The preview is not the final rendering - make sure the settled render runs
+        self._rendered_view = None
+
+    def render_visible_tiles(self, mode=RESAMPLE_SHARP):
+        """Draw the zoomed-view tiles that intersect the visible canvas region and are not drawn yet.
+        
+        With mode=RESAMPLE_FAST (while dragging) tiles are drawn with the fast resampler;
+        a later sharp pass redraws exactly those tiles.
+        """
+        if mode == RESAMPLE_SHARP:
+            self._tile_render_job = None
+        view = self._tiled_view
+        if not view or not self.scale_1to1 or self._tile_pyramid is None:
+            return
+        
+        # Visible canvas region converted to zoomed image coordinates
+        padding_x = getattr(self, 'image_padding_x', 0)
+        padding_y = getattr(self, 'image_padding_y', 0)
+        left = self.canvas.canvasx(0) - padding_x
+        top = self.canvas.canvasy(0) - padding_y
+        view_box = (left, top, left + self.canvas.winfo_width(), top + self.canvas.winfo_height())
+        
+        tiles = view['tiles']
+        for index in visible_tile_indices(view_box, view['display_size'], TILE_SIZE, TILE_PREFETCH_MARGIN):
+            if index in tiles and (tiles[index][2] == RESAMPLE_SHARP or mode == RESAMPLE_FAST):
+                continue  # Already on screen - panning only fetches newly exposed tiles
+            tile = self._render_view_tile(view['zoom'], index, mode)
+            if tile is None:
+                continue
+            if index in tiles:
+                # Sharp pass over a tile drawn while dragging: repaint its photo in place
+                self._repaint_tile(index, tile, mode)
+            else:
+                photo = self.tile_photos.acquire(tile)
+                item = self.canvas.create_image(padding_x + index[0] * TILE_SIZE, padding_y + index[1] * TILE_SIZE,
+                                                anchor="nw", image=photo)
+                tiles[index] = (photo, item, mode)
+        
+        # Release tiles that scrolled far out of view to bound memory
+        keep = set(visible_tile_indices(view_box, view['display_size'], TILE_SIZE, TILE_KEEP_MARGIN))
+        for index in [index for index in tiles if index not in keep]:
+            photo, item, _ = tiles.pop(index)
+            self.canvas.delete(item)
+            self.tile_photos.release(photo)
+        
+        self.update_minimap()
+
+    def get_minimap(self, path):
+        """Minimap pixels of the current zoomed image, made from the zoom pyramid on first use"""
+        histogram_eq = hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get()
+        stamp = get_file_stamp(path)
+        variant = (histogram_eq, self.get_view_variant(path))
+        pyramid = self._tile_pyramid
+        if pyramid is None or self._tile_pyramid_key != (path, stamp, histogram_eq, variant[1]):
+            return self.minimap_cache.get(path, stamp, variant)
+        # The coarsest pyramid level that still covers the minimap - already in memory
+        zoom = min(MINIMAP_SIZE[0] / pyramid.size[0], MINIMAP_SIZE[1] / pyramid.size[1])
+        return self.minimap_cache.get_or_build(path, stamp, lambda: pyramid.level_for_zoom(zoom)[0], variant)
+
+    def update_minimap(self):
+        """Draw the overview minimap with the viewport rectangle in the top-right canvas corner.
+        
+        Shown only while the zoomed image is larger than the canvas; the items are
+        kept above the tiles and moved along with the scroll position.
+        """
+        self.canvas.delete("minimap")
+        self._minimap_geometry = None
+        view = self._tiled_view
+        if (not view or not self.scale_1to1 or self.grid_mode or not self.image_paths
+                or not self.minimap_enabled.get()):
+            return
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        display_width, display_height = view['display_size']
+        if display_width <= canvas_width and display_height <= canvas_height:
+            return  # The whole image is visible
+        pixels = self.get_minimap(self.image_paths[self.current_index])
+        if pixels is None:
+            return
+        
+        minimap = Image.fromarray(np.asarray(pixels))
+        width, height = minimap.size
+        left = canvas_width - width - MINIMAP_MARGIN
+        top = MINIMAP_MARGIN
+        origin_x = self.canvas.canvasx(0)
+        origin_y = self.canvas.canvasy(0)
+        photo = self.minimap_photo.show(minimap)
+        self.canvas.create_rectangle(origin_x + left - 1, origin_y + top - 1, origin_x + left + width,
+                                     origin_y + top + height, outline="white", fill="black", tags=("minimap",))
+        self.canvas.create_image(origin_x + left, origin_y + top, anchor="nw", image=photo,
+                                 tags=("minimap",))
+        
+        view_left = origin_x - self.image_padding_x
+        view_top = origin_y - self.image_padding_y
+        view_box = (view_left, view_top, view_left + canvas_width, view_top + canvas_height)
+        rect_left, rect_top, rect_right, rect_bottom = minimap_viewport_rect(view_box, view['display_size'],
+                                                                              (width, height))
+        self.canvas.create_rectangle(origin_x + left + rect_left, origin_y + top + rect_top,
+                                     origin_x + left + rect_right, origin_y + top + rect_bottom,
+                                     outline="#FF5252", width=2, tags=("minimap",))
+        self.canvas.tag_raise("minimap")
+        self._minimap_geometry = (left, top, width, height)
+
+    def minimap_jump(self, x, y, clamp=False):
+        """Center the zoomed view on the image point under window position (x, y) if it is on the minimap.
+        
+        With clamp, positions off the minimap (a drag that left it) jump to the nearest edge.
+        """
+        geometry = self._minimap_geometry
+        if geometry is None:
+            return False
+        left, top, width, height = geometry
+        if not clamp and not (left <= x <= left + width and top <= y <= top + height):
+            return False
+        source_x, source_y = minimap_point_to_source(x - left, y - top, (width, height),
+                                                     self.get_current_source_size())
+        self._center_image_point(source_x, source_y)
+        self.render_visible_tiles()
+        return True
+
+    def _render_view_tile(self, zoom, index, mode=RESAMPLE_SHARP):
+        """Resample one zoom tile of the shown image, or of the current compare frame while blinking"""
+        frames = self.compare_frames
+        if frames is not None and frames.full_resolution and frames.size == self._tile_pyramid.size:
+            return frames.tile(zoom, index[0], index[1], mode)
+        return self._tile_pyramid.render_tile(zoom, index[0], index[1], TILE_SIZE, mode=mode)
+
+    def _repaint_tile(self, index, tile, mode):
+        """Show tile in the already drawn tile at index, in place when its photo fits"""
+        photo, item, _ = self._tiled_view['tiles'][index]
+        if self.tile_photos.fits(photo, tile):
+            photo.paste(tile)
+        else:
+            self.tile_photos.release(photo)
+            photo = self.tile_photos.acquire(tile)
+            self.canvas.itemconfig(item, image=photo)
+        self._tiled_view['tiles'][index] = (photo, item, mode)
+
+    def _release_tiled_view(self):
+        """Forget the drawn tiles and return their photos to the pool for the next view"""
+        if self._tiled_view:
+            for photo, _, _ in self._tiled_view['tiles'].values():
+                self.tile_photos.release(photo)
+        self._tiled_view = None
+        self._minimap_geometry = None
+
+    def _schedule_tile_refine(self):
+        """Redraw fast-resampled tiles sharply once panning has paused for RENDER_SETTLE_MS"""
+        if self._tile_refine_job is not None:
+            self.root.after_cancel(self._tile_refine_job)
+        self._tile_refine_job = self.root.after(RENDER_SETTLE_MS, self._refine_tiles)
+
+    def _refine_tiles(self):
+        self._tile_refine_job = None
+        self.render_visible_tiles(RESAMPLE_SHARP)
+
+    def _schedule_tile_render(self):
+        """Coalesce view changes into a single tile render when Tk is idle"""
+        # While a drag is in progress do_pan draws tiles itself and the refine pass sharpens them
+        if self._tiled_view and self._tile_render_job is None and self._tile_refine_job is None:
+            self._tile_render_job = self.root.after_idle(self.render_visible_tiles)
+
+    def _on_canvas_xview_changed(self, first, last):
+        """Keep the horizontal scrollbar in sync and draw tiles exposed by scrolling"""
+        self.h_scrollbar.set(first, last)
+        self._schedule_tile_render()
+
+    def _on_canvas_yview_changed(self, first, last):
+        """Keep the vertical scrollbar in sync and draw tiles exposed by scrolling"""
+        self.v_scrollbar.set(first, last)
+        self._schedule_tile_render()
+
+    def get_decoded_image(self, path, fit_size=None, page=0, window=None):
+        """Return (image, full_size) for path, served from the prefetch cache when possible.
+        
+        With fit_size the image may come back at a reduced resolution that still covers
+        the fitted display; without it the full-resolution decode is returned. page selects
+        a page of a multi-page TIFF, and window maps 12/16-bit images through that window
+        (None = auto window). Their 16-bit pixels are cached either way.
+        """
+        if window is not None or path.lower().endswith(HIGH_BIT_DEPTH_EXTENSIONS):
+            return load_windowed_image(self.image_cache, path, fit_size, window, page, self.thumbnail_store)
+        return load_display_image(self.image_cache, path, fit_size, self.thumbnail_store, page)
+
+    def _cached_source_size(self, path, page, stamp):
+        """(cache path, full size) of path's cached decode, 16-bit pixels first; (None, None) if not cached"""
+        cache_path = _page_cache_path(path, page)
+        candidates = [cache_path]
+        if path.lower().endswith(HIGH_BIT_DEPTH_EXTENSIONS):
+            candidates.insert(0, ("uint16", cache_path))
+        for candidate in candidates:
+            source_size = self.image_cache.get_source_size(candidate, stamp)
+            if source_size is not None:
+                return candidate, source_size
+        return None, None
+
+    def is_view_image_ready(self, path, stamp, fit_size=None, histogram_eq=False):
+        """True when get_view_image can answer from memory without touching the file"""
+        page, window = self.get_view_variant(path)
+        held = self._view_source
+        if held is not None and (held['path'], held['stamp'], held['page']) == (path, stamp, page) \
+                and held['source_size']:
+            if (choose_decode_reduction(held['source_size'], fit_size), histogram_eq, window) in held['images']:
+                return True
+        cache_path, source_size = self._cached_source_size(path, page, stamp)
+        if source_size is None:
+            return False
+        img = self.image_cache.get((cache_path, choose_decode_reduction(source_size, fit_size)), stamp)
+        if img is None:
+            return False
+        if cache_path[0] == "uint16":
+            return True  # The window lookup (and enhancement) only costs CPU, no I/O
+        return (not histogram_eq
+                or self.contrast_enhancer.lookup(self._enhanced_key(path, img.size, page), stamp) is not None)
+
+    def _enhanced_key(self, path, size, page=0, window=None):
+        """ContrastEnhancer cache key of a displayed image of path (see get_view_image)"""
+        if not page and window is None:
+            return (path, size)
+        return (path, size, page, window)
+
+    def load_view_image(self, path, stamp, fit_size=None, histogram_eq=False):
+        """Load the image to show on the ImageLoader pool and show a placeholder until it arrives"""
+        # Redraws while the same load is in flight (resize, relabel) do not queue another one
+        page, window = self.get_view_variant(path)
+        source_size = self._cached_source_size(path, page, stamp)[1]
+        reduction = choose_decode_reduction(source_size, fit_size) if source_size else fit_size
+        load_key = (path, stamp, reduction, histogram_eq, (page, window))
+        if self._view_load is None or self._view_load[:5] != load_key:
+            def load():
+                img, source_size = self.get_decoded_image(path, fit_size, page, window)
+                if histogram_eq:
+                    img = self.apply_histogram_equalization(img, cache_key=self._enhanced_key(path, img.size, page, window),
+                                                            stamp=stamp)
+                return img, source_size
+
+            def loaded(request_id, result, error):
+                self.root.after(0, self._on_view_image_loaded, request_id, load_key, fit_size, result, error)
+
+            self._view_load = load_key + (self.image_loader.request(load, loaded),)
+        
+        self.render_placeholder_view(f"Loading {os.path.basename(path)}...")
+        # Label, checkboxes and comment of the image stay usable while it loads
+        self.update_image_details(path, source_size)
+
+    def _on_view_image_loaded(self, request_id, load_key, fit_size, result, error):
+        """Tk side of load_view_image: hold the pixels and render, unless the user moved on"""
+        if not self.image_loader.is_current(request_id) or self._view_load is None \
+                or self._view_load[5] != request_id:
+            return
+        self._view_load = None
+        path, stamp, _, histogram_eq, (page, window) = load_key
+        if not self.image_paths or self.image_paths[self.current_index] != path:
+            return
+        if error is not None:
+            print(f"Could not load {path}: {error}")
+            self.render_placeholder_view(f"Cannot load {os.path.basename(path)}:\n{error}")
+            return
+        img, source_size = result
+        self._hold_view_image(path, stamp, fit_size, histogram_eq, img, source_size, page, window)
+        self._display_image_direct()
+
+    def _hold_view_image(self, path, stamp, fit_size, histogram_eq, img, source_size, page=0, window=None):
+        """Keep img as the shown image's buffer for (fit_size, histogram_eq, window) (see get_view_image)"""
+        held = self._view_source
+        if held is None or (held['path'], held['stamp'], held['page']) != (path, stamp, page):
+            held = self._view_source = {'path': path, 'stamp': stamp, 'page': page, 'source_size': None, 'images': {}}
+        held['source_size'] = source_size
+        held['images'][(choose_decode_reduction(source_size, fit_size), histogram_eq, window)] = img
+
+    def get_view_image(self, path, fit_size=None, histogram_eq=False):
+        """Return (image, source_size) for displaying path, enhanced when histogram_eq is set.
+        
+        The decoded and enhanced buffers of the shown image are held until another image
+        is shown, so zoom, resize and relabel never decode it again even if the shared
+        LRU cache has evicted it in the meantime.
+        """
+        stamp = get_file_stamp(path)
+        page, window = self.get_view_variant(path)
+        held = self._view_source
+        if held is not None and (held['path'], held['stamp'], held['page']) == (path, stamp, page) \
+                and held['source_size']:
+            key = (choose_decode_reduction(held['source_size'], fit_size), histogram_eq, window)
+            if key in held['images']:
+                return held['images'][key], held['source_size']
+        
+        img, source_size = self.get_decoded_image(path, fit_size, page, window)
+        if histogram_eq:
+            # Memoized per path and decoded size, so in fitted mode it runs on the reduced decode
+            img = self.apply_histogram_equalization(img, cache_key=self._enhanced_key(path, img.size, page, window),
+                                                    stamp=stamp)
+        self._hold_view_image(path, stamp, fit_size, histogram_eq, img, source_size, page, window)
+        return img, source_size
+
+    def get_current_source_size(self):
+        """Full-resolution size of the current image, without decoding it again"""
+        path = self.image_paths[self.current_index]
+        held = self._view_source
+        if held is not None and held['path'] == path and held['source_size'] is not None:
+            return held['source_size']
+        if self._tile_pyramid is not None and self._tile_pyramid_key[0] == path:
+            return self._tile_pyramid.size
+        source_size = self._cached_source_size(path, 0, get_file_stamp(path))[1]
+        if source_size is not None:
+            return source_size
+        # Opening only reads the header
+        with open_image_file(path) as img:
+            return img.size
+
+    def _load_for_prefetch(self, cache, path, fit_size):
+        """Prefetcher load function: same lookup order as the display (cache, thumbnails, decode)"""
+        if path.lower().endswith(HIGH_BIT_DEPTH_EXTENSIONS):
+            # Prefetch the 16-bit pixels, so the display only applies its window
+            return load_windowed_image(cache, path, fit_size, thumbnails=self.thumbnail_store)
+        return load_display_image(cache, path, fit_size, self.thumbnail_store)
+
+    def open_thumbnail_store(self, folder):
+        """Open the sidecar thumbnail store of folder and start indexing its images"""
+        self.close_thumbnail_store()
+        if is_archive_file(folder):
+            store = ThumbnailStore(archive_sidecar_folder(folder), root=folder)
+        elif self.workspace is not None:
+            store = ThumbnailStore(folder, root=folder)
+        else:
+            store = ThumbnailStore(folder)
+        if not store.enabled:
+            return
+        self.thumbnail_store = store
+        self.start_thumbnail_indexer()
+
+    def start_thumbnail_indexer(self):
+        """(Re)start background thumbnail generation for all images of the folder"""
+        if self.thumbnail_indexer is not None:
+            self.thumbnail_indexer.stop()
+            self.thumbnail_indexer = None
+        if self.thumbnail_store is None:
+            return
+        paths = list(getattr(self, 'all_image_paths', None) or [])
+        # Images following the current one are likely visited first
+        if self.image_paths and self.current_index < len(self.image_paths):
+            current = self.image_paths[self.current_index]
+            if current in paths:
+                start = paths.index(current)
+                paths = paths[start:] + paths[:start]
+        self.thumbnail_indexer = ThumbnailIndexer(self.thumbnail_store, paths)
+
+    def fingerprint_images(self, index, paths):
+        """Queue images of index for the background fingerprint pass, starting one for this folder if needed"""
+        if index is None:
+            return
+        if self.content_fingerprinter is None:
+            token = self._folder_load_token
+            self.content_fingerprinter = ContentFingerprinter(
+                on_report=lambda *report: self.root.after(0, self._on_fingerprints, token, *report))
+        if index not in self.content_fingerprinter.indexes:
+            # Files found corrupted by an earlier pass are listed at once; unchanged ones are not read again
+            known = index.corrupted_paths()
+            if known:
+                self.corrupted_files.update(known)
+                self.status_var.set(f"⚠ {len(self.corrupted_files)} corrupted images - "
+                                    f"see the 'Corrupted files only' filter")
+        self.content_fingerprinter.add(index, paths)
+
+    def stop_fingerprinter(self):
+        if self.content_fingerprinter is not None:
+            self.content_fingerprinter.stop()
+            self.content_fingerprinter = None
+
+    def _on_fingerprints(self, token, changed, restamped, corrupted):
+        """Tk side of the fingerprint pass: drop caches of rewritten images and list corrupted ones"""
+        if token != self._folder_load_token:
+            return
+        for path, old_stamp, new_stamp in restamped:
+            # Same content under a new mtime (copied again, touched): the thumbnails stay good
+            if self.thumbnail_store is not None:
+                self.thumbnail_store.restamp(path, old_stamp, new_stamp)
+        for path in changed:
+            self.image_cache.discard_path(path)
+            self.grid_cache.discard_path(path)
+            self.contrast_enhancer.cache.discard_path(path)
+            if self.thumbnail_store is not None:
+                self.thumbnail_store.discard(path)
+        self.corrupted_files.difference_update(changed)
+        self.corrupted_files.update(corrupted)
+        
+        relabel = [path for path in changed if self.labels.get(path, LABELS[0]) != LABELS[0]]
+        if relabel:
+            self.logger.warning(f"{len(relabel)} labeled images changed on disk: "
+                                f"{', '.join(os.path.basename(path) for path in relabel[:10])}")
+            self.status_var.set(f"⚠ {len(relabel)} labeled images changed on disk since they were fingerprinted")
+        if corrupted:
+            self.status_var.set(f"⚠ {len(self.corrupted_files)} corrupted images - "
+                                f"see the 'Corrupted files only' filter")
+        if self.filter_var.get() == "Corrupted files only" and (changed or corrupted):
+            self.refresh_filter_view()
+        elif self.image_paths and self.image_paths[self.current_index] in changed:
+            self._rendered_view = None
+            self.show_image()
+
+    def close_thumbnail_store(self):
+        """Stop indexing and persist the thumbnail index of the current folder"""
+        if self.thumbnail_indexer is not None:
+            self.thumbnail_indexer.stop()
+            self.thumbnail_indexer.wait(timeout=2.0)
+            self.thumbnail_indexer = None
+        if self.thumbnail_store is not None:
+            self.thumbnail_store.close()
+            self.thumbnail_store = None
+
+    def get_fit_size(self):
+        """Return the canvas box used for fitted display (same defaults as _display_image_direct)"""
+        canvas_width = max(350, self.canvas.winfo_width())
+        canvas_height = max(250, self.canvas.winfo_height())
+        return (canvas_width, canvas_height)
+
+    def get_session_siblings(self, image_path):
+        """Return all images of the folder that belong to the same session as image_path"""
+        all_paths = getattr(self, 'all_image_paths', None) or []
+        source = (id(all_paths), len(all_paths))
+        if self._session_members_source != source:
+            # Folder contents changed (new folder, new files) - rebuild the session map
+            members = {}
+            for path in all_paths:
+                members.setdefault(self.get_session_number(path), []).append(path)
+            self._session_members = members
+            self._session_members_source = source
+        return self._session_members.get(self.get_session_number(image_path), [])
+
+    def get_prefetch_candidates(self):
+        """List the images worth decoding in the background, most likely next view first"""
+        if not self.image_paths or self.current_index >= len(self.image_paths):
+            return []
+        
+        candidates = []
+        # Alternate ahead/behind so forward navigation is served first
+        for offset in range(1, self.prefetch_radius + 1):
+            for index in (self.current_index + offset, self.current_index - offset):
+                if 0 <= index < len(self.image_paths):
+                    candidates.append(self.image_paths[index])
+        
+        # Other images of the current session (e.g. the sibling camera views)
+        current_path = self.image_paths[self.current_index]
+        for path in self.get_session_siblings(current_path):
+            if path != current_path and path not in candidates:
+                candidates.append(path)
+        return candidates
+
+    def schedule_prefetch(self):
+        """Queue the neighbours of the current image for background decoding"""
+        # The list is rebuilt from the current image_paths every time, so a filter
+        # change automatically drops requests that belonged to the old list
+        # Navigation always lands in fitted mode, so prefetch at the fitted resolution
+        self.prefetcher.schedule(self.get_prefetch_candidates(), self.get_fit_size())
+
+    def get_compare_paths(self, path):
+        """Images of path's session to blink through, in folder order (at most COMPARE_MAX_FRAMES around path)"""
+        siblings = self.get_session_siblings(path)
+        if path not in siblings:
+            return [path]
+        i = siblings.index(path)
+        start = max(0, min(i - COMPARE_MAX_FRAMES // 2, len(siblings) - COMPARE_MAX_FRAMES))
+        return siblings[start:start + COMPARE_MAX_FRAMES]
+
+    def get_compare_key(self, path):
+        """What compare frames of path depend on: image, resolution, enhancement and view variant"""
+        histogram_eq = hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get()
+        fit_size = None if self.scale_1to1 else self.get_fit_size()
+        return (path, get_file_stamp(path), fit_size, histogram_eq, self.get_view_variant(path))
+
+    def get_compare_interval(self):
+        """Blink interval in ms from the toolbar entry (default COMPARE_BLINK_MS)"""
+        try:
+            return max(COMPARE_MIN_BLINK_MS, int(float(self.compare_interval_var.get())))
+        except (ValueError, tk.TclError):
+            return COMPARE_BLINK_MS
+
+    def toggle_compare_mode(self):
+        """Start or stop blinking between the images of the current session"""
+        if self._compare_key is not None:
+            self.stop_compare()
+            # Back to the current image (the canvas may show a sibling frame)
+            self._rendered_view = None
+            if self.image_paths:
+                self.show_image()
+            return
+        self.start_compare()
+
+    def start_compare(self):
+        """Decode the images of the current session in the background, aligned to the shown image"""
+        if not self.image_paths or self.grid_mode:
+            return
+        path = self.image_paths[self.current_index]
+        paths = self.get_compare_paths(path)
+        if len(paths) < 2:
+            self.status_var.set(f"{os.path.basename(path)} - no other images of this session to compare")
+            return
+
+        key = self.get_compare_key(path)
+        _, _, fit_size, histogram_eq, _ = key
+        variants = {member: self.get_view_variant(member) for member in paths}
+
+        def load():
+            # Same decode and enhancement as the normal view, so the anchor frame looks identical
+            source_sizes = {}
+
+            def decode(member):
+                page, member_window = variants[member]
+                img, source_sizes[member] = self.get_decoded_image(member, fit_size, page, member_window)
+                if histogram_eq:
+                    img = self.apply_histogram_equalization(
+                        img, cache_key=self._enhanced_key(member, img.size, page, member_window),
+                        stamp=get_file_stamp(member))
+                return img
+
+            # 1:1 frames of a large session do not all fit: keep the ones nearest to the shown image
+            kept, images, anchor = decode_compare_frames(paths, paths.index(path), decode)
+            return CompareFrames(kept, images, anchor, full_resolution=fit_size is None,
+                                 source_size=source_sizes[path], session_size=len(paths))
+
+        def loaded(request_id, result, error):
+            self.root.after(0, self._on_compare_loaded, request_id, key, result, error)
+
+        self.stop_compare()
+        self._compare_key = key
+        self._compare_request = self.compare_loader.request(load, loaded)
+        self.btn_compare.config(text="Stop Compare", bg="#4DB6AC")
+        self.status_var.set(f"Compare: decoding {len(paths)} images of this session...")
+
+    def _on_compare_loaded(self, request_id, key, result, error):
+        """Tk side of start_compare: start blinking unless the view changed meanwhile"""
+        if request_id != self._compare_request or key != self._compare_key:
+            return
+        self._compare_request = None
+        if error is not None:
+            print(f"Could not decode the session for comparison: {error}")
+            self.stop_compare()
+            self.status_var.set(f"Compare failed: {error}")
+            return
+        self.compare_frames = result
+        self.render_compare_frame()
+        self._compare_job = self.root.after(self.get_compare_interval(), self._compare_flip)
+
+    def stop_compare(self):
+        """Leave compare mode and drop its frames (the caller redraws the current image if needed)"""
+        self.compare_loader.cancel()
+        if self._compare_job is not None:
+            self.root.after_cancel(self._compare_job)
+            self._compare_job = None
+        self.compare_frames = None
+        self._compare_key = None
+        self._compare_request = None
+        if hasattr(self, 'btn_compare'):
+            self.btn_compare.config(text="Compare", bg="#80CBC4")
+
+    def refresh_compare(self):
+        """After a full render: show the blinked frame again, or rebuild the frames for the new view"""
+        path = self.image_paths[self.current_index]
+        key = self.get_compare_key(path)
+        if key == self._compare_key:
+            self.render_compare_frame()
+        elif key[:2] == self._compare_key[:2] and key[3:] == self._compare_key[3:] and not self.scale_1to1 \
+                and self.compare_frames is not None:
+            # Only the fitted canvas size changed - the frames are resampled, not decoded again
+            self._compare_key = key
+            self.render_compare_frame()
+        else:
+            self.start_compare()
+
+    def _compare_flip(self):
+        self._compare_job = None
+        if self.compare_frames is None:
+            return
+        self.compare_frames.step(1)
+        self.render_compare_frame()
+        self._compare_job = self.root.after(self.get_compare_interval(), self._compare_flip)
+
+    def render_compare_frame(self):
+        """Paint the current compare frame into the existing view (fitted photo or drawn zoom tiles)"""
+        frames = self.compare_frames
+        if frames is None:
+            return
+        if self.scale_1to1:
+            view = self._tiled_view
+            if not view:
+                return
+            # The viewport stays where it is; only the drawn tiles are repainted
+            for index in list(view['tiles']):
+                tile = self._render_view_tile(view['zoom'], index)
+                if tile is not None:
+                    self._repaint_tile(index, tile, RESAMPLE_SHARP)
+        else:
+            display_img = frames.fitted(fit_display_size(frames.size, self.get_fit_size()))
+            self.tk_img = self.display_photo.show(display_img)
+            if self._fit_item is not None:
+                self.canvas.itemconfig(self._fit_item, image=self.tk_img)
+        budget_note = ""
+        if frames.session_size > len(frames):
+            budget_note = f", {len(frames)} of {frames.session_size} fit in memory"
+        self.status_var.set(f"Compare {frames.index + 1}/{len(frames)}: {os.path.basename(frames.path)}"
+                            f" (Shift+C to stop{budget_note})")
+
+    def toggle_grid_view(self):
+        """Switch between the single image view and the session contact sheet"""
+        self.grid_mode = not self.grid_mode
+        if self.grid_mode:
+            self.btn_grid.config(text="Single View", bg="#4DB6AC")
+        else:
+            self.btn_grid.config(text="Grid View", bg="#80CBC4")
+            self._grid_view = None
+            self._grid_request_id = None
+        if hasattr(self, 'image_paths') and self.image_paths:
+            self.show_image()
+
+    def get_grid_range(self, index=None):
+        """Return the (start, end) slice of image_paths shown in the grid around index.
+        
+        Images of one session are adjacent in the sorted list, so the session is found by
+        scanning outwards from index. Single-image sessions show a page of images instead.
+        """
+        if index is None:
+            index = self.current_index
+        session = self.get_session_number(self.image_paths[index])
+        start = index
+        while start > 0 and index - start < GRID_MAX_CELLS - 1 and \
+                self.get_session_number(self.image_paths[start - 1]) == session:
+            start -= 1
+        end = index + 1
+        while end < len(self.image_paths) and end - start < GRID_MAX_CELLS and \
+                self.get_session_number(self.image_paths[end]) == session:
+            end += 1
+        if end - start > 1:
+            return start, end
+        page_start = (index // GRID_PAGE_SIZE) * GRID_PAGE_SIZE
+        return page_start, min(len(self.image_paths), page_start + GRID_PAGE_SIZE)
+
+    def render_contact_sheet(self):
+        """Draw the current session (or page) as a grid of labelled thumbnails"""
+        start, end = self.get_grid_range()
+        paths = self.image_paths[start:end]
+        canvas_width, canvas_height = self.get_fit_size()
+        columns, rows = contact_sheet_layout(len(paths), (canvas_width, canvas_height))
+        cell_width = canvas_width // columns
+        cell_height = canvas_height // rows
+        box = (max(16, cell_width - 2 * GRID_CELL_PADDING),
+               max(16, cell_height - GRID_LABEL_HEIGHT - 2 * GRID_CELL_PADDING))
+        
+        self._release_tiled_view()
+        self.canvas.configure(bg="black", scrollregion=(0, 0, canvas_width, canvas_height))
+        self.canvas.delete("all")
+        self.h_scrollbar.grid_remove()
+        self.v_scrollbar.grid_remove()
+        self._grid_view = {
+            'start': start,
+            'paths': paths,
+            'columns': columns,
+            'cell': (cell_width, cell_height),
+            'box': box,
+            'photos': {},  # cell index -> PhotoImage (kept alive while drawn)
+        }
+        
+        missing = False
+        for i, path in enumerate(paths):
+            img = self.grid_cache.get((path, box), get_file_stamp(path))
+            missing = missing or img is None
+            self._draw_grid_cell(i, img)
+        self.scale_info_var.set(f"Grid: {len(paths)} images\nClick to select")
+        
+        if missing:
+            # One batched request for the whole grid, decoded in parallel worker processes
+            self._grid_request_id = self.contact_sheet_loader.request(
+                paths, box, callback=self._on_contact_sheet_loaded, thumbnails=self.thumbnail_store)
+        else:
+            self._grid_request_id = None
+            self.prefetch_next_grid()
+
+    def _draw_grid_cell(self, i, img):
+        """Draw (or redraw) one grid cell: thumbnail or placeholder, label border and caption"""
+        view = self._grid_view
+        path = view['paths'][i]
+        cell_width, cell_height = view['cell']
+        left = (i % view['columns']) * cell_width
+        top = (i // view['columns']) * cell_height
+        tag = f"cell{i}"
+        self.canvas.delete(tag)
+        
+        label = self.labels.get(path, LABELS[0])
+        color = GRID_LABEL_COLORS.get(label, GRID_LABEL_COLORS[LABELS[0]])
+        selected = view['start'] + i == self.current_index
+        self.canvas.create_rectangle(left + 1, top + 1, left + cell_width - 1, top + cell_height - 1,
+                                     outline="#FFFFFF" if selected else color, width=4 if selected else 2,
+                                     tags=(tag, f"border{i}"))
+        
+        image_center = (left + cell_width // 2, top + GRID_CELL_PADDING + view['box'][1] // 2)
+        if img is not None:
+            if hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get():
+                img = self.apply_histogram_equalization(img, cache_key=(path, img.size), stamp=get_file_stamp(path))
+            photo = ImageTk.PhotoImage(img)
+            view['photos'][i] = photo
+            self.canvas.create_image(*image_center, anchor="center", image=photo, tags=(tag,))
+        else:
+            self.canvas.create_text(*image_center, text="Loading...", fill="#757575",
+                                    font=("Arial", 10), tags=(tag,))
+        
+        caption = f"{view['start'] + i + 1}. {label}"
+        self.canvas.create_text(left + cell_width // 2, top + cell_height - GRID_CELL_PADDING - GRID_LABEL_HEIGHT // 2,
+                                text=caption, fill=color, font=("Arial", 9, "bold"), tags=(tag, f"caption{i}"))
+
+    def _on_contact_sheet_loaded(self, request_id, results):
+        """Loader-thread callback: hand the batch to the Tk thread"""
+        self.root.after(0, lambda: self._apply_contact_sheet(request_id, results))
+
+    def _apply_contact_sheet(self, request_id, results):
+        """Fill the placeholders of the grid the batch was requested for (stale batches only stay cached)"""
+        if not self.grid_mode or self._grid_view is None or request_id != self._grid_request_id:
+            return
+        self._grid_request_id = None
+        for i, path in enumerate(self._grid_view['paths']):
+            if path in results:
+                self._draw_grid_cell(i, results[path])
+        self.prefetch_next_grid()
+
+    def prefetch_next_grid(self):
+        """Ask for the following session's thumbnails in the background"""
+        view = self._grid_view
+        end = view['start'] + len(view['paths'])
+        if end >= len(self.image_paths):
+            return
+        next_start, next_end = self.get_grid_range(end)
+        self.contact_sheet_loader.request(self.image_paths[next_start:next_end], view['box'],
+                                          thumbnails=self.thumbnail_store, prefetch=True)
+
+    def select_grid_cell(self, x, y):
+        """Make the image under canvas position (x, y) the current image"""
+        view = self._grid_view
+        if not view:
+            return
+        cell_width, cell_height = view['cell']
+        column = int(x // cell_width)
+        row = int(y // cell_height)
+        if column >= view['columns']:
+            return
+        i = row * view['columns'] + column
+        if 0 <= i < len(view['paths']):
+            self.current_index = view['start'] + i
+            self.show_image()
+
+    def update_grid_cell(self, path):
+        """Recolor the border and caption of path's cell after it was labeled"""
+        view = self._grid_view
+        if not view or path not in view['paths']:
+            return
+        i = view['paths'].index(path)
+        label = self.labels.get(path, LABELS[0])
+        color = GRID_LABEL_COLORS.get(label, GRID_LABEL_COLORS[LABELS[0]])
+        if view['start'] + i != self.current_index:
+            self.canvas.itemconfig(f"border{i}", outline=color)
+        self.canvas.itemconfig(f"caption{i}", text=f"{view['start'] + i + 1}. {label}", fill=color)
 
     def blink_status_text(self):
         """Create a subtle blink effect on the status text (normal -> bold -> normal)"""
@@ -1261,12 +5408,7 @@ class ImageLabelTool:
 
     def prev_image(self):
         if self.current_index > 0:
-            self.current_index -= 1
-            # Reset to fit mode when navigating to new image
-            self.reset_to_fit_mode()
-            self.show_image()
-            # Add subtle text blink for navigation feedback
-            self.blink_status_text()
+            self.navigate_to(self.current_index - 1)
 
     def go_to_first_image(self):
         """Jump to the first image in the list."""
@@ -1280,12 +5422,80 @@ class ImageLabelTool:
 
     def next_image(self):
         if self.current_index < len(self.image_paths) - 1:
-            self.current_index += 1
+            self.navigate_to(self.current_index + 1)
+
+    def navigate_to(self, index):
+        """Step to image index, rendering only where a burst of steps comes to rest.
+        
+        A single step renders right away. Steps arriving within NAVIGATION_REPEAT_MS of
+        the previous one (a held O/P key) only move current_index and refresh the
+        filename/label widgets; cached thumbnails are drawn for the images passed over and
+        the full render runs once the steps stop (see finish_navigation).
+        """
+        if not self.image_paths or not 0 <= index < len(self.image_paths):
+            return
+        self.current_index = index
+        since_last_ms = (time.monotonic() - self._last_navigation_time) * 1000.0
+        if self.navigation_scheduler.pending or since_last_ms < NAVIGATION_REPEAT_MS:
             # Reset to fit mode when navigating to new image
             self.reset_to_fit_mode()
-            self.show_image()
-            # Add subtle text blink for navigation feedback
-            self.blink_status_text()
+            self.update_image_fields(self.image_paths[index])
+            self.navigation_scheduler.request()
+        else:
+            self.finish_navigation()
+
+    def finish_navigation(self):
+        """Full render of the image navigation stopped on"""
+        self.navigation_scheduler.cancel()
+        # Reset to fit mode when navigating to new image
+        self.reset_to_fit_mode()
+        self.show_image()
+        # Add subtle text blink for navigation feedback
+        self.blink_status_text()
+        # Measured after rendering, so key events queued meanwhile count as auto-repeat
+        self._last_navigation_time = time.monotonic()
+
+    def render_navigation_preview(self):
+        """Draw the image passed over during a navigation burst from cached pixels only"""
+        if not self.image_paths or self.grid_mode:
+            return
+        self.render_placeholder_view()
+
+    def render_placeholder_view(self, message=None):
+        """Stand-in for the current image until its full render is possible.
+        
+        Uses a decode already in the image cache or the small stored thumbnail, scaled
+        with the fast resampler; never decodes the image itself. Without either, message
+        (default: the file name) is shown on a blank canvas.
+        """
+        path = self.image_paths[self.current_index]
+        canvas_width, canvas_height = self.get_fit_size()
+        stamp = get_file_stamp(path)
+        
+        source = None
+        source_size = self.image_cache.get_source_size(path, stamp)
+        if source_size is not None:
+            zoom = min(canvas_width / source_size[0], canvas_height / source_size[1])
+            source = self.get_preview_source(path, zoom)
+        if source is None and self.thumbnail_store is not None and self.get_view_variant(path) == (0, None):
+            source = self.thumbnail_store.get(path, "small", stamp)
+        
+        self._release_tiled_view()
+        self.canvas.delete("all")
+        self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
+        self.h_scrollbar.grid_remove()
+        self.v_scrollbar.grid_remove()
+        if source is None:
+            self.canvas.create_text(canvas_width // 2, canvas_height // 2, text=message or os.path.basename(path),
+                                    fill="#9E9E9E", font=("Arial", 12), justify="center")
+        else:
+            img, source_size = source
+            preview = resample_image(img, fit_display_size(source_size, (canvas_width, canvas_height)),
+                                     mode=RESAMPLE_FAST)
+            self.tk_img = self.display_photo.show(preview)
+            self.canvas.create_image(canvas_width // 2, canvas_height // 2, anchor="center", image=self.tk_img)
+        # Only a placeholder - the render when navigation stops must not be skipped
+        self._rendered_view = None
 
     def jump_to_next_unclassified(self):
         """Jump to the next unclassified image after the current index."""
@@ -1343,33 +5553,19 @@ class ImageLabelTool:
         
         # Search for the first image with the matching trigger ID
         for i, path in enumerate(self.image_paths):
-            filename = os.path.basename(path)
-            filename_without_ext = os.path.splitext(filename)[0]
-            parts = filename_without_ext.split('_')
-            if len(parts) >= 1:
-                # Extract trigger ID (first part before underscore)
-                file_trigger_id_str = parts[0]
-                # Normalize the file trigger ID (remove leading zeros if numeric)
-                try:
-                    if file_trigger_id_str.isdigit():
-                        file_trigger_id = str(int(file_trigger_id_str))
-                    else:
-                        file_trigger_id = file_trigger_id_str
-                except ValueError:
-                    file_trigger_id = file_trigger_id_str
-                # Check if this trigger ID matches
-                if file_trigger_id == normalized_trigger_id:
-                    self.current_index = i
-                    self.show_image()
-                    # Clear the input field after successful jump
-                    self.jump_trigger_var.set("")
-                    comment_text = self.comments.get(self.image_paths[self.current_index], "")
-                    self.comment_text.delete("1.0", tk.END)
-                    self.comment_text.insert("1.0", comment_text)
-                    # Re-bind comment change events
-                    self.comment_text.bind('<KeyRelease>', self.on_comment_change)
-                    self.comment_text.bind('<FocusOut>', self.on_comment_change)
-                    return
+            # Trigger ID: first part of the filename, without leading zeros
+            if self.get_filename_info(path).trigger == normalized_trigger_id:
+                self.current_index = i
+                self.show_image()
+                # Clear the input field after successful jump
+                self.jump_trigger_var.set("")
+                comment_text = self.comments.get(self.image_paths[self.current_index], "")
+                self.comment_text.delete("1.0", tk.END)
+                self.comment_text.insert("1.0", comment_text)
+                # Re-bind comment change events
+                self.comment_text.bind('<KeyRelease>', self.on_comment_change)
+                self.comment_text.bind('<FocusOut>', self.on_comment_change)
+                return
         if normalized_trigger_id is None:
             normalized_trigger_id = trigger_id_input
         messagebox.showinfo("Jump to Trigger ID", 
@@ -1380,7 +5576,7 @@ class ImageLabelTool:
             return
         path = self.image_paths[self.current_index]
         self.labels[path] = value
-        self.save_csv()
+        self.save_label_edit(path)
         self.update_counts()
         
         # Set image to fit-to-window mode after classification
@@ -1397,13 +5593,17 @@ class ImageLabelTool:
         path = self.image_paths[self.current_index]
         
         self.labels[path] = self.label_var.get()
-        self.save_csv()
+        self.save_label_edit(path)
         self.update_counts()
         self.update_session_stats()
         self.update_total_stats()
         self.update_progress_display()
         self.update_current_label_status()
         
+        # Recolor the labeled cell when the session grid is shown
+        if self.grid_mode:
+            self.update_grid_cell(path)
+        
         # Update False NoRead checkbox state based on new classification
         self.update_false_noread_checkbox_state()
         
@@ -1463,7 +5663,7 @@ class ImageLabelTool:
             self.false_noread[path] = False
         
         self.ocr_readable[path] = self.ocr_readable_var.get()
-        self.save_csv()
+        self.save_label_edit(path)
         self.update_counts()
         self.update_session_stats()
         self.update_total_stats()
@@ -1482,7 +5682,7 @@ class ImageLabelTool:
             self.ocr_readable[path] = False
         
         self.false_noread[path] = self.false_noread_var.get()
-        self.save_csv()
+        self.save_label_edit(path)
         self.update_counts()
         self.update_session_stats()
         self.update_total_stats()
@@ -1508,7 +5708,73 @@ class ImageLabelTool:
                 # Also update the stored value
                 self.false_noread[current_path] = False
                 # Save the change
-                self.save_csv()
+                self.save_label_edit(current_path)
+
+    def on_display_window_changed(self, event=None):
+        """Apply the window typed into the toolbar ("auto" or "low-high") to 12/16-bit images"""
+        text = self.display_window_var.get().strip().lower()
+        if text in ("", "auto"):
+            window = None
+        else:
+            match = re.fullmatch(r"(\d+)\s*[-:,]\s*(\d+)", text)
+            if not match or int(match.group(1)) >= int(match.group(2)) or int(match.group(2)) > 65535:
+                messagebox.showerror("Window", "Enter the window as low-high (e.g. 200-3800) or 'auto'.")
+                return
+            window = (int(match.group(1)), int(match.group(2)))
+        self.display_window_var.set("auto" if window is None else f"{window[0]}-{window[1]}")
+        self.root.focus_set()  # Give the keyboard shortcuts back
+        if window != self.display_window:
+            self.display_window = window
+            # The 16-bit pixels stay cached, so this is only a lookup-table pass
+            if hasattr(self, 'image_paths') and self.image_paths:
+                self.show_image()
+
+    def get_view_variant(self, path):
+        """(page, window) the image at path is shown with"""
+        page = self._image_page[1] if self._image_page and self._image_page[0] == path else 0
+        window = self.display_window if path.lower().endswith(HIGH_BIT_DEPTH_EXTENSIONS) else None
+        return page, window
+
+    def get_page_count(self, path):
+        """Number of pages of a multi-page TIFF (1 for everything else); reads only the headers"""
+        stamp = get_file_stamp(path)
+        known = self._page_counts.get(path)
+        if known is not None and known[0] == stamp:
+            return known[1]
+        try:
+            with open_image_file(path) as img:
+                count = getattr(img, 'n_frames', 1)
+        except Exception:
+            count = 1
+        self._page_counts[path] = (stamp, count)
+        return count
+
+    def show_page(self, step):
+        """Show the next (step=1) or previous (step=-1) page of the current multi-page TIFF"""
+        if not self.image_paths or self.grid_mode:
+            return
+        path = self.image_paths[self.current_index]
+        if not path.lower().endswith((".tif", ".tiff")):
+            return
+        page, _ = self.get_view_variant(path)
+        new_page = page + step
+        if not 0 <= new_page < self.get_page_count(path):
+            return
+        # Only the requested page is decoded
+        self._image_page = (path, new_page) if new_page else None
+        self.show_image()
+
+    def next_page_shortcut(self, event=None):
+        """Keyboard shortcut: Page Down for the next page of a multi-page TIFF"""
+        if self.should_ignore_keyboard_shortcuts():
+            return
+        self.show_page(1)
+
+    def prev_page_shortcut(self, event=None):
+        """Keyboard shortcut: Page Up for the previous page of a multi-page TIFF"""
+        if self.should_ignore_keyboard_shortcuts():
+            return
+        self.show_page(-1)
 
     def on_histogram_eq_changed(self):
         """Handle histogram equalization checkbox changes"""
@@ -1675,6 +5941,18 @@ class ImageLabelTool:
             if hasattr(self, 'image_paths') and self.image_paths:
                 self.show_image()
 
+    def grid_view_shortcut(self, event=None):
+        """Keyboard shortcut: Shift+G for the session grid view toggle"""
+        if self.should_ignore_keyboard_shortcuts():
+            return
+        self.toggle_grid_view()
+
+    def compare_mode_shortcut(self, event=None):
+        """Keyboard shortcut: Shift+C to blink through the images of the current session"""
+        if self.should_ignore_keyboard_shortcuts():
+            return
+        self.toggle_compare_mode()
+
     def histogram_eq_shortcut(self, event=None):
         """Keyboard shortcut: Shift+H for histogram equalization toggle"""
         if self.should_ignore_keyboard_shortcuts():
@@ -1764,6 +6042,8 @@ class ImageLabelTool:
             current_path = self.image_paths[self.current_index]
             # Get text from Text widget instead of StringVar
             comment_text = self.comment_text.get("1.0", tk.END).strip()
+            if comment_text == self.comments.get(current_path, ""):
+                return  # Key released without editing (navigation, modifiers) or focus left
             
             # Store comment for current image
             if comment_text:
@@ -1773,8 +6053,8 @@ class ImageLabelTool:
                 if current_path in self.comments:
                     del self.comments[current_path]
             
-            # Save CSV immediately when comment changes
-            self.save_csv()
+            # Journal the comment right away; the CSV is rewritten later
+            self.save_label_edit(current_path)
 
     def on_comment_focus_in(self, event=None):
         """Called when comment text widget gains focus"""
@@ -2074,7 +6354,7 @@ class ImageLabelTool:
         
         # Determine initial directory - use the selected folder if available
         if hasattr(self, 'folder_path') and self.folder_path:
-            initial_dir = self.folder_path
+            initial_dir = self.get_output_folder()
         else:
             initial_dir = os.path.dirname(os.path.abspath(__file__))
         
@@ -2177,8 +6457,7 @@ class ImageLabelTool:
         if hasattr(self, 'folder_path') and self.folder_path:
             try:
                 # Get all image files and extract trigger IDs from filenames
-                image_files = [f for f in os.listdir(self.folder_path)
-                             if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))]
+                image_files = [os.path.basename(path) for path in self.get_folder_image_paths(refresh=False)]
                 
                 # Extract trigger IDs from filenames (format: XXXXXXXXXX_XXXX_XXX_timestamp.jpg)
                 # The trigger ID is the first part before the first underscore, with leading zeros removed
@@ -2554,74 +6833,7 @@ class ImageLabelTool:
     
     def extract_date_from_filename(self, filename):
         """Extract date from a single filename"""
-        try:
-            import re
-            
-            # Method 1: Extract timestamp from filename parts
-            parts = filename.split('_')
-            if len(parts) >= 4:
-                timestamp_part = parts[-1].split('.')[0]  # Remove extension
-                
-                # Case 1: YYYYMMDD format (exactly 8 digits)
-                if len(timestamp_part) == 8 and timestamp_part.isdigit():
-                    year = timestamp_part[:4]
-                    month = timestamp_part[4:6]
-                    day = timestamp_part[6:8]
-                    return f"{day}-{month}-{year}"
-                
-                # Case 2: YYYYMMDD_HHMMSS or YYYYMMDDHHMMSS format
-                if len(timestamp_part) >= 8:
-                    date_part = timestamp_part[:8]
-                    if date_part.isdigit() and len(date_part) == 8:
-                        year = date_part[:4]
-                        month = date_part[4:6]
-                        day = date_part[6:8]
-                        return f"{day}-{month}-{year}"
-                        
-                # Case 3: Check other parts for date
-                for part in parts:
-                    if len(part) >= 8 and part[:8].isdigit():
-                        date_part = part[:8]
-                        year = date_part[:4]
-                        month = date_part[4:6]
-                        day = date_part[6:8]
-                        # Validate date ranges
-                        if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-                            return f"{day}-{month}-{year}"
-            
-            # Method 2: Find YYYYMMDD pattern anywhere in filename using regex
-            date_pattern = re.search(r'(20\d{2})(\d{2})(\d{2})', filename)
-            if date_pattern:
-                year = date_pattern.group(1)
-                month = date_pattern.group(2)
-                day = date_pattern.group(3)
-                # Validate date ranges
-                if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-                    return f"{day}-{month}-{year}"
-            
-            # Method 3: Look for different date patterns
-            other_patterns = [
-                r'(\d{2})-(\d{2})-(\d{4})',  # DD-MM-YYYY
-                r'(\d{2})/(\d{2})/(\d{4})',  # DD/MM/YYYY
-                r'(\d{4})-(\d{2})-(\d{2})',  # YYYY-MM-DD
-            ]
-            
-            for pattern in other_patterns:
-                match = re.search(pattern, filename)
-                if match:
-                    if pattern.startswith(r'(\d{4})'):  # YYYY-MM-DD format
-                        year, month, day = match.groups()
-                    else:  # DD-MM-YYYY or DD/MM/YYYY format
-                        day, month, year = match.groups()
-                    
-                    # Validate date ranges
-                    if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-                        return f"{day}-{month}-{year}"
-                        
-        except Exception as e:
-            print(f"DEBUG: Error extracting date from filename {filename}: {e}")
-            
-        return None
+        return self.get_filename_info(filename).date
     
     def extract_log_date_range(self):
         """Extract start and end dates from log file based on smallest and largest ID entries"""
@@ -2845,7 +7057,7 @@ class ImageLabelTool:
             
             # Use the same directory as the selected folder if available
             if hasattr(self, 'folder_path') and self.folder_path:
-                report_path = os.path.join(self.folder_path, f"FIS_Analytics_Report_{timestamp}.txt")
+                report_path = os.path.join(self.get_output_folder(), f"FIS_Analytics_Report_{timestamp}.txt")
             else:
                 report_path = f"FIS_Analytics_Report_{timestamp}.txt"
             
@@ -2949,7 +7161,7 @@ class ImageLabelTool:
         
         # Use the same directory as the selected folder if available, otherwise use current directory
         if hasattr(self, 'folder_path') and self.folder_path:
-            csv_path = os.path.join(self.folder_path, f"FIS_Analytics_Report_{timestamp}.csv")
+            csv_path = os.path.join(self.get_output_folder(), f"FIS_Analytics_Report_{timestamp}.csv")
         else:
             csv_path = f"FIS_Analytics_Report_{timestamp}.csv"
         
@@ -3000,67 +7212,36 @@ class ImageLabelTool:
         else:
             self.btn_gen_filter_folder.config(state='normal', bg="#9C27B0")
 
-    def apply_filter(self):
-        """Apply the current filter to show appropriate images"""
-        if not hasattr(self, 'all_image_paths'):
-            return
-            
+    def get_filter_predicate(self):
+        """Test telling whether an image belongs to the current filter view, or None when every image does"""
         filter_value = self.filter_var.get()
         
         if filter_value == "All images":
-            self.image_paths = self.all_image_paths.copy()
+            return None
         elif filter_value == "OCR recovered only":
             # Special filter for OCR recovered images
-            self.image_paths = [path for path in self.all_image_paths
-                               if self.ocr_readable.get(path, False)]
+            return lambda path: self.ocr_readable.get(path, False)
         elif filter_value == "False NoRead only":
             # Special filter for False NoRead images
-            self.image_paths = [path for path in self.all_image_paths
-                               if self.false_noread.get(path, False)]
+            return lambda path: self.false_noread.get(path, False)
+        elif filter_value == "Corrupted files only":
+            return lambda path: path in self.corrupted_files
         elif filter_value == "Session #":
             session_input = self.session_filter_var.get().strip() if hasattr(self, 'session_filter_var') else ""
-            if not session_input:
-                # No value entered; treat as no results rather than falling back to all images
-                self.image_paths = []
-            else:
-                # Validate that the input only contains digits or underscores
-                if any(ch not in "0123456789_" for ch in session_input):
-                    self.image_paths = []
-                else:
-                    def normalize_numeric(text):
-                        """Return numeric strings without leading zeros for consistent comparison."""
-                        if text.isdigit():
-                            # Preserve "0" specifically, but drop other leading zeros
-                            return str(int(text))
-                        return text
-
-                    def split_session_parts(value):
-                        """Split a session identifier into (base, suffix) parts with normalized base."""
-                        if '_' in value:
-                            base, suffix = value.split('_', 1)
-                        else:
-                            base, suffix = value, ""
-                        return normalize_numeric(base), suffix
-
-                    input_base, input_suffix = split_session_parts(session_input)
-
-                    matching_paths = []
-                    for path in self.all_image_paths:
-                        session_id = self.get_session_number(path)
-                        if not session_id:
-                            continue
-
-                        session_base, session_suffix = split_session_parts(session_id)
-
-                        base_matches = session_base == input_base
-                        if '_' in session_input:
-                            if base_matches and session_suffix == input_suffix:
-                                matching_paths.append(path)
-                        else:
-                            if base_matches:
-                                matching_paths.append(path)
-
-                    self.image_paths = matching_paths
+            # No value entered (or not only digits and underscores): no results rather than all images
+            if not session_input or any(ch not in "0123456789_" for ch in session_input):
+                return lambda path: False
+            # Numeric bases are compared without leading zeros; the timestamp
+            # suffix only has to match when one was entered
+            input_base, input_suffix = split_session_key(session_input)
+            match_suffix = '_' in session_input
+
+            def in_session(path):
+                info = self.get_filename_info(path)
+                if not info.session or info.session_base != input_base:
+                    return False
+                return not match_suffix or info.session_suffix == input_suffix
+            return in_session
         else:
             # Map filter names to label values
             filter_map = {
@@ -3072,10 +7253,19 @@ class ImageLabelTool:
             }
             target_label = filter_map.get(filter_value)
             if target_label:
-                self.image_paths = [path for path in self.all_image_paths
-                                   if self.labels.get(path, LABELS[0]) == target_label]
-            else:
-                self.image_paths = self.all_image_paths.copy()
+                return lambda path: self.labels.get(path, LABELS[0]) == target_label
+            return None
+
+    def apply_filter(self):
+        """Apply the current filter to show appropriate images"""
+        if not hasattr(self, 'all_image_paths'):
+            return
+            
+        predicate = self.get_filter_predicate()
+        if predicate is None:
+            self.image_paths = self.all_image_paths.copy()
+        else:
+            self.image_paths = [path for path in self.all_image_paths if predicate(path)]
         
         # Reset to first image and update display
         self.current_index = 0
@@ -3088,6 +7278,185 @@ class ImageLabelTool:
         # Update navigation buttons
         self.update_navigation_buttons()
 
+    def merge_new_images(self, new_paths):
+        """Insert newly arrived images at their sorted position in the folder list and the filtered view.
+        
+        Unlike apply_filter, the image being viewed and its position stay the same.
+        new_paths must not be in all_image_paths yet.
+        """
+        if not new_paths:
+            return
+        key = self.get_image_sort_key
+        for path in new_paths:
+            self.filename_catalog.get(path)
+        insert_sorted(self.all_image_paths, new_paths, key)
+        
+        predicate = self.get_filter_predicate()
+        shown = sorted(new_paths if predicate is None else [path for path in new_paths if predicate(path)], key=key)
+        if shown:
+            if not self.image_paths:
+                insert_sorted(self.image_paths, shown, key)
+                self.current_index = 0
+                self.show_image()
+            else:
+                self.current_index = min(self.current_index, len(self.image_paths) - 1)
+                current = self.image_paths[self.current_index]
+                insert_sorted(self.image_paths, shown, key)
+                # Arrivals sorting before the current image push it back by as many places
+                # (arrivals with an equal key go after it)
+                self.current_index += bisect.bisect_left([key(path) for path in shown], key(current))
+                if self.image_paths[self.current_index] != current:
+                    self.current_index = self.image_paths.index(current)  # The view was not in key order
+        
+        self.update_counts()
+        self.update_session_stats()
+        self.update_total_stats()
+        self.update_progress_display()
+        self.update_navigation_buttons()
+
+    def drop_missing_images(self, present):
+        """Remove images no longer in the folder (present: set of current paths), keeping the current image"""
+        current = self.image_paths[self.current_index] if self.image_paths and \
+            self.current_index < len(self.image_paths) else None
+        self.all_image_paths = [path for path in self.all_image_paths if path in present]
+        self.image_paths = [path for path in self.image_paths if path in present]
+        self.previously_seen_files &= present
+        if current in present:
+            self.current_index = self.image_paths.index(current)
+        else:
+            # The viewed image is gone: show its successor
+            self.current_index = min(self.current_index, max(0, len(self.image_paths) - 1))
+            self.show_image()
+
+    def clear_folder_caches(self):
+        """Drop decoded images and views of the previous folder"""
+        self.stop_compare()
+        self.prefetcher.cancel()
+        self.image_loader.cancel()
+        self._view_load = None
+        self.image_cache.clear()
+        self.contrast_enhancer.clear()
+        self.grid_cache.clear()
+        self._view_source = None
+        self._rendered_view = None
+        self.stop_fingerprinter()
+        self.corrupted_files = set()
+
+    def open_workspace(self, root):
+        """Open the image folders of a directory tree as one set.
+        
+        Folders are found and indexed in the background and merged into the view
+        (with their labels) one by one, in tree order; the first images can be
+        labeled while the rest of the tree is still being scanned.
+        """
+        self.close_label_journals()
+        self.close_workspace()
+        self._folder_load_token += 1  # A folder still loading in the background is abandoned
+        self._folder_loading = False
+        self.folder_path = root
+        self.workspace = Workspace(root)
+        self.folder_path_text = f"Current workspace: {root}"
+        self.folder_path_var.set(self.folder_path_text)
+        self.show_folder_progress("scanning...")
+        
+        # Labels go to a revision CSV in each folder; the merged stats CSV is written at the root
+        self._workspace_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.csv_filename = os.path.join(root, f"revision_{self._workspace_timestamp}.csv")
+        
+        self.folder_index = None
+        self.all_image_paths = []
+        self.image_paths = []
+        self.filename_catalog = FilenameCatalog()
+        self.current_index = 0
+        self.labels = {}
+        self.false_noread = {}
+        self.comments = {}
+        self.parcel_indices = {}
+        self.next_parcel_index = 1
+        self.previously_seen_files = set()
+        self.clear_folder_caches()
+        
+        # One thumbnail store at the root, keyed by path relative to it
+        self.open_thumbnail_store(root)
+        self.minimap_cache = MinimapCache(os.path.join(root, THUMBNAIL_CACHE_DIR, MINIMAP_CACHE_DIR))
+        
+        self.apply_filter()
+        self.update_warning_message()
+        self.update_log_file_button_state()
+        
+        workspace = self.workspace
+        # The scan thread only queues folders; they are merged in batches on the Tk thread
+        workspace.start(lambda: self.root.after(0, self._schedule_workspace_drain, workspace),
+                        lambda: self.root.after(0, self._on_workspace_complete, workspace))
+
+    def _schedule_workspace_drain(self, workspace):
+        if self._workspace_drain_job is None and workspace is self.workspace:
+            self._workspace_drain_job = self.root.after(WORKSPACE_BATCH_MS, self.drain_workspace_folders)
+
+    def drain_workspace_folders(self):
+        """Tk side of the workspace scan: merge the folders indexed since the last batch, with their labels"""
+        self._workspace_drain_job = None
+        workspace = self.workspace
+        if workspace is None:
+            return
+        arrived = []
+        while True:
+            try:
+                folder, index, loaded, replayed = workspace.delivered.get_nowait()
+            except queue.Empty:
+                break
+            workspace.add(folder, index, os.path.join(folder, f"revision_{self._workspace_timestamp}.csv"))
+            labels, ocr_readable, false_noread, comments = loaded
+            self.labels.update(labels)
+            self.ocr_readable.update(ocr_readable)
+            self.false_noread.update(false_noread)
+            self.comments.update(comments)
+            if replayed:
+                self._open_label_journal(folder, folder)
+                self.schedule_label_compaction()
+            arrived.append((index, index.paths()))
+        if not arrived:
+            return
+        
+        # Folders arrive in tree order, so the merge appends; the image being labeled stays.
+        # Stats and session groups are recomputed once per batch, not once per folder
+        first = not self.all_image_paths
+        new_paths = [path for _, paths in arrived for path in paths]
+        self.previously_seen_files.update(new_paths)
+        self.merge_new_images(new_paths)
+        self.auto_detect_total_groups()
+        if first:
+            self.start_thumbnail_indexer()
+        for index, paths in arrived:
+            self.fingerprint_images(index, paths)
+        if not workspace.complete:
+            self.show_folder_progress(f"{len(workspace.folders)} folders, {len(self.all_image_paths)} images, "
+                                      f"scanning...")
+
+    def _on_workspace_complete(self, workspace):
+        if workspace is not self.workspace:
+            return
+        workspace.complete = True
+        if self._workspace_drain_job is not None:
+            self.root.after_cancel(self._workspace_drain_job)
+        self.drain_workspace_folders()
+        self.hide_folder_progress()
+        self.folder_path_var.set(f"Current workspace: {workspace.root} ({len(workspace.folders)} folders, "
+                                 f"{len(self.all_image_paths)} images)")
+        self.start_thumbnail_indexer()
+        self.update_warning_message()
+        self.update_navigation_buttons()
+        self.root.after_idle(self.update_jump_button_state)
+
+    def close_workspace(self):
+        """Stop scanning the open workspace (its labels are already saved per folder)"""
+        if self.workspace is not None:
+            self.workspace.stop()
+            self.workspace = None
+        if self._workspace_drain_job is not None:
+            self.root.after_cancel(self._workspace_drain_job)
+            self._workspace_drain_job = None
+
     def load_csv(self):
         # Reset parcel indices when loading
         self.parcel_indices = {}
@@ -3096,150 +7465,50 @@ class ImageLabelTool:
         if not self.csv_filename or not os.path.exists(self.csv_filename):
             # Try to find existing revision CSV files in the folder
             if self.folder_path:
-                existing_csvs = [f for f in os.listdir(self.folder_path) 
-                               if f.startswith("revision_") and f.endswith(".csv")]
-                if existing_csvs:
-                    # Parse timestamps and find the most recent one
-                    most_recent_file = None
-                    most_recent_time = None
-                    
-                    for csv_file in existing_csvs:
-                        try:
-                            # Extract timestamp from filename: revision_YYYYMMDD_HHMMSS.csv
-                            timestamp_str = csv_file[9:-4]  # Remove "revision_" and ".csv"
-                            timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                            if most_recent_time is None or timestamp > most_recent_time:
-                                most_recent_time = timestamp
-                                most_recent_file = csv_file
-                        except ValueError:
-                            # Skip files that don't match the expected format
-                            continue
-                    
-                    if most_recent_file:
-                        existing_csv = os.path.join(self.folder_path, most_recent_file)
-                        self._load_csv_file(existing_csv)
+                existing_csv = find_latest_revision_csv(self.get_output_folder())
+                if existing_csv:
+                    self._load_csv_file(existing_csv)
             return
         self._load_csv_file(self.csv_filename)
 
-    def _load_csv_file(self, filepath):
-        """Helper method to load CSV file"""
-        # max_session_index = 0  # Session index tracking removed
-        
-        with open(filepath, newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader, None)  # Read header
-            
-            for row in reader:
-                if len(row) >= 2:  # At minimum need image_path and image_label
-                    stored_path = row[0]  # This might be relative or absolute
-                    image_label = row[1]
-                    
-                    # Read OCR Readable status if available (3rd column, index 2)
-                    ocr_readable = False
-                    if len(row) >= 3:
-                        try:
-                            # Handle both boolean and string representations
-                            ocr_value = row[2]
-                            if isinstance(ocr_value, str):
-                                ocr_readable = ocr_value.lower() in ('true', 't', '1', 'yes')
-                            else:
-                                ocr_readable = bool(ocr_value)
-                        except (ValueError, TypeError):
-                            ocr_readable = False  # Default to False if parsing fails
-                    
-                    # Read False NoRead status if available (4th column, index 3)
-                    false_noread = False
-                    if len(row) >= 4:
-                        try:
-                            # Handle both boolean and string representations
-                            false_noread_value = row[3]
-                            if isinstance(false_noread_value, str):
-                                false_noread = false_noread_value.lower() in ('true', 't', '1', 'yes')
-                            else:
-                                false_noread = bool(false_noread_value)
-                        except (ValueError, TypeError):
-                            false_noread = False  # Default to False if parsing fails
-                    
-                    # Read Comment if available (5th column, index 4)
-                    comment = ""
-                    if len(row) >= 5:
-                        comment = row[4].strip()
-                    
-                    # Convert relative path back to absolute path if needed
-                    if hasattr(self, 'folder_path') and self.folder_path:
-                        if os.path.isabs(stored_path):
-                            # Already absolute path (backward compatibility)
-                            image_path = stored_path
-                        else:
-                            # Relative path - convert to absolute
-                            image_path = os.path.join(self.folder_path, stored_path)
-                            # Normalize the path to handle any inconsistencies
-                            image_path = os.path.normpath(image_path)
-                    else:
-                        # No folder_path available, use as-is
-                        image_path = stored_path
-                    
-                    self.labels[image_path] = image_label
-                    self.ocr_readable[image_path] = ocr_readable
-                    self.false_noread[image_path] = false_noread
-                    self.comments[image_path] = comment
-                    
-                    # Session index loading logic removed - no longer used
-                    # if len(row) >= 8 and row[7]:  # session_index is now 8th column (index 7)
-                    #     try:
-                    #         session_index = int(row[7])
-                    #         session_id = self.get_session_number(image_path)
-                    #         if session_id:
-                    #             self.session_indices[session_id] = session_index
-                    #             max_session_index = max(max_session_index, session_index)
-                    #     except (ValueError, TypeError):
-                    #         pass  # Skip invalid session index values
-        
-        # Session index tracking removed
-        # self.next_session_index = max_session_index + 1
+    def _load_csv_file(self, filepath, base_folder=None):
+        """Helper method to load CSV file (relative paths are relative to base_folder, default folder_path)"""
+        labels, ocr_readable, false_noread, comments = read_revision_csv(
+            filepath, base_folder or getattr(self, 'folder_path', None))
+        self.labels.update(labels)
+        self.ocr_readable.update(ocr_readable)
+        self.false_noread.update(false_noread)
+        self.comments.update(comments)
 
     def save_csv(self):
-        if not self.csv_filename:
-            return
+        if not self.csv_filename or self._folder_loading:
+            return  # While loading, labels are saved once the stored ones are merged (_on_folder_labels)
             
         try:
-            with open(self.csv_filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                # Write header
-                writer.writerow(['image_path', 'image_label', 'OCR_Readable', 'False_NoRead', 'Comment', 'session_number', 'session_label', 'session_OCR_readable', 'session_index'])
-                
-                # Calculate current session labels
-                session_labels_dict = self.calculate_session_labels()
-                
-                # Calculate session OCR readable status
-                session_ocr_readable_dict = self.calculate_session_ocr_readable_status()
-                
-                for path, label in self.labels.items():
-                    # Convert absolute path to relative path from the selected folder
-                    if hasattr(self, 'folder_path') and self.folder_path:
-                        try:
-                            # Normalize both paths before calculating relative path
-                            normalized_path = os.path.normpath(path)
-                            normalized_folder = os.path.normpath(self.folder_path)
-                            relative_path = os.path.relpath(normalized_path, normalized_folder)
-                        except ValueError:
-                            # If relpath fails (e.g., different drives), use just the filename
-                            relative_path = os.path.basename(path)
-                    else:
-                        relative_path = os.path.basename(path)
-                    
-                    session_id = self.get_session_number(path)
-                    session_label = session_labels_dict.get(session_id, "no label") if session_id else "no label"
-                    session_ocr_readable = session_ocr_readable_dict.get(session_id, False) if session_id else False
-                    # session_index functionality removed
-                    ocr_readable = self.ocr_readable.get(path, False)
-                    false_noread = self.false_noread.get(path, False)
-                    comment = self.comments.get(path, "")
-                    writer.writerow([relative_path, label, ocr_readable, false_noread, comment, session_id or "", session_label, session_ocr_readable, ""])
+            # Calculate current session labels
+            session_labels_dict = self.calculate_session_labels()
+            
+            # Calculate session OCR readable status
+            session_ocr_readable_dict = self.calculate_session_ocr_readable_status()
+            
+            if self.workspace is not None:
+                # Each folder of the workspace keeps its own revision CSV
+                self.save_workspace_csvs(session_labels_dict, session_ocr_readable_dict)
+            else:
+                rows = self._revision_csv_rows(self.labels, self.folder_path, session_labels_dict,
+                                               session_ocr_readable_dict)
+                self._write_revision_csv(self.csv_filename, rows)
             
             # Also generate statistics CSV file
             self.save_stats_csv()
             
+            # The CSVs now hold every journaled edit
+            if self._journal_compact_job is not None:
+                self.root.after_cancel(self._journal_compact_job)
+                self._journal_compact_job = None
+            for journal in self.label_journals.values():
+                journal.reset()
+            
         except PermissionError as e:
             print(f"ERROR: Permission denied when saving CSV: {self.csv_filename}")
             print("Possible solutions:")
@@ -3265,6 +7534,111 @@ class ImageLabelTool:
             except:
                 pass
 
+    def get_label_journal(self, path):
+        """LabelJournal of the folder path is labeled in (the open folder or a workspace folder), or None"""
+        if self.workspace is None:
+            return self._open_label_journal(self.get_output_folder(), self.folder_path)
+        folder = os.path.dirname(path)
+        if folder not in self.workspace.csv_files:
+            return None
+        return self._open_label_journal(folder, folder)
+
+    def _open_label_journal(self, folder, base_folder):
+        journal = self.label_journals.get(folder)
+        if journal is None:
+            journal = LabelJournal(os.path.join(folder, LABEL_JOURNAL_NAME), base_folder)
+            self.label_journals[folder] = journal
+        return journal
+
+    def save_label_edit(self, path):
+        """Save the labels of one image: journaled at once, written to the revision CSV when compacted.
+        
+        Rewriting the revision CSV and the stats CSV takes seconds for large folders,
+        so single edits only append a journal line; compact_label_journal rewrites the
+        CSVs once LABEL_JOURNAL_COMPACT_MS have passed or LABEL_JOURNAL_COMPACT_EDITS
+        edits piled up. Bulk changes keep calling save_csv directly.
+        """
+        if self._folder_loading:
+            self._edited_while_loading.add(path)  # Wins over the stored labels once they are merged
+        if not self.csv_filename:
+            return
+        journal = self.get_label_journal(path)
+        if journal is None:
+            self.save_csv()
+            return
+        try:
+            journal.append(path, self.labels.get(path), self.ocr_readable.get(path, False),
+                           self.false_noread.get(path, False), self.comments.get(path, ""))
+        except OSError as e:
+            print(f"Could not journal the label edit, saving the CSV instead: {e}")
+            self.save_csv()
+            return
+        self.schedule_label_compaction(0 if journal.edits >= LABEL_JOURNAL_COMPACT_EDITS else LABEL_JOURNAL_COMPACT_MS)
+
+    def schedule_label_compaction(self, delay_ms=LABEL_JOURNAL_COMPACT_MS):
+        """Rewrite the CSVs delay_ms from now, unless a rewrite is already due"""
+        if self._journal_compact_job is not None:
+            if delay_ms:
+                return
+            self.root.after_cancel(self._journal_compact_job)
+        self._journal_compact_job = self.root.after(delay_ms, self.compact_label_journal)
+
+    def compact_label_journal(self):
+        """Write the journaled edits into the revision CSV(s) and stats CSV, then empty the journals"""
+        self._journal_compact_job = None
+        self.save_csv()
+
+    def close_label_journals(self):
+        """Compact pending edits of the open folder and close its journals (before switching folders)"""
+        if self._journal_compact_job is not None:
+            self.root.after_cancel(self._journal_compact_job)
+            self._journal_compact_job = None
+            self.save_csv()
+        for journal in self.label_journals.values():
+            journal.close()
+        self.label_journals = {}
+
+    def _revision_csv_rows(self, paths, base_folder, session_labels_dict, session_ocr_readable_dict):
+        """Revision CSV rows of the labeled paths, with paths relative to base_folder"""
+        rows = []
+        for path in paths:
+            label = self.labels[path]
+            # Convert absolute path to relative path from the selected folder
+            relative_path = relative_image_path(path, base_folder)
+            
+            session_id = self.get_session_number(path)
+            session_label = session_labels_dict.get(session_id, "no label") if session_id else "no label"
+            session_ocr_readable = session_ocr_readable_dict.get(session_id, False) if session_id else False
+            # session_index functionality removed
+            ocr_readable = self.ocr_readable.get(path, False)
+            false_noread = self.false_noread.get(path, False)
+            comment = self.comments.get(path, "")
+            rows.append([relative_path, label, ocr_readable, false_noread, comment, session_id or "", session_label, session_ocr_readable, ""])
+        return rows
+
+    def _write_revision_csv(self, filename, rows):
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            # Write header
+            writer.writerow(['image_path', 'image_label', 'OCR_Readable', 'False_NoRead', 'Comment', 'session_number', 'session_label', 'session_OCR_readable', 'session_index'])
+            writer.writerows(rows)
+
+    def save_workspace_csvs(self, session_labels_dict, session_ocr_readable_dict):
+        """Write each workspace folder's labels to its own revision CSV, skipping folders whose rows did not change"""
+        workspace = self.workspace
+        paths_by_folder = {}
+        for path in self.labels:
+            paths_by_folder.setdefault(os.path.dirname(path), []).append(path)
+        for folder, paths in paths_by_folder.items():
+            csv_filename = workspace.csv_files.get(folder)
+            if csv_filename is None:
+                continue  # Not an image folder of the workspace
+            rows = self._revision_csv_rows(paths, folder, session_labels_dict, session_ocr_readable_dict)
+            signature = hash(tuple(tuple(row) for row in rows))
+            if workspace.saved.get(folder) != signature:
+                self._write_revision_csv(csv_filename, rows)
+                workspace.saved[folder] = signature
+
     def save_stats_csv(self):
         """Generate a statistics CSV file with all counting and parcel information"""
         if not self.csv_filename:
@@ -4168,24 +8542,7 @@ class ImageLabelTool:
 
     def get_session_number(self, image_path):
         """Extract the group ID from filename using ID (first part) + Timestamp (last part)"""
-        filename = os.path.basename(image_path)
-        filename_without_ext = os.path.splitext(filename)[0]
-        
-        # Split by underscore to get parts
-        parts = filename_without_ext.split('_')
-        if len(parts) >= 2:
-            # Get ID (first part) and timestamp (last part)
-            id_part = parts[0]
-            timestamp_part = parts[-1]
-            # Return concatenated ID + timestamp as unique group identifier
-            group_id = f"{id_part}_{timestamp_part}"
-            return group_id
-        elif len(parts) == 1:
-            # If only one part, use it as both ID and timestamp
-            return parts[0]
-        else:
-            # If no underscore, use the entire filename as identifier
-            return filename_without_ext
+        return self.get_filename_info(image_path).session
 
     def calculate_session_labels(self):
         """Calculate session labels based on the labeling rules and return a dict"""
@@ -4506,22 +8863,12 @@ class ImageLabelTool:
         valid_ids_found = False
         
         for path in self.all_image_paths:
-            filename = os.path.basename(path)
-            filename_without_ext = os.path.splitext(filename)[0]
-            
-            # Split by underscore to get parts
-            parts = filename_without_ext.split('_')
-            if len(parts) >= 1:
-                try:
-                    # Get ID (first part before first underscore) and convert to number
-                    id_part = parts[0]
-                    id_number = int(id_part)
-                    max_id = max(max_id, id_number)
-                    min_id = min(min_id, id_number)
-                    valid_ids_found = True
-                except ValueError:
-                    # Skip files where the first part is not a number
-                    continue
+            # ID: first part of the filename; files where it is not a number are skipped
+            id_number = self.get_filename_info(path).trigger_number
+            if id_number is not None:
+                max_id = max(max_id, id_number)
+                min_id = min(min_id, id_number)
+                valid_ids_found = True
         
         if valid_ids_found and max_id >= min_id:
             # Calculate total sessions as the range: max_id - min_id + 1
@@ -4537,57 +8884,18 @@ class ImageLabelTool:
         """Handle window resize events to update image display"""
         # Only respond to resize events from the main window
         if event.widget == self.root:
-            # Update image display if images are loaded
-            if hasattr(self, 'image_paths') and self.image_paths:
-                # Use after_idle to ensure the window has finished resizing
-                self.root.after_idle(self.show_image)
+            # Coalesce the burst of Configure events of a drag into one preview per
+            # frame and a single full render once the window stops changing
+            self.request_render()
 
-    def apply_histogram_equalization(self, img):
-        """Apply histogram equalization to enhance image contrast"""
+    def apply_histogram_equalization(self, img, cache_key=None, stamp=None):
+        """Apply CLAHE contrast enhancement to the luminance plane of the image.
+        
+        When cache_key is given the result is memoized (and invalidated by stamp),
+        so re-displaying or re-toggling an image does not recompute it.
+        """
         try:
-            # Convert PIL image to numpy array for OpenCV processing
-            import numpy as np
-            
-            # Convert to RGB if not already (PIL images are RGB by default)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Convert PIL image to numpy array
-            img_array = np.array(img)
-            
-            # Convert RGB to BGR for OpenCV (OpenCV uses BGR)
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            
-            # Convert to grayscale for histogram equalization
-            gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-            
-            # Apply histogram equalization
-            equalized = cv2.equalizeHist(gray)
-            
-            # Convert back to BGR color by replicating the equalized grayscale to all channels
-            # This creates a grayscale image with better contrast
-            equalized_bgr = cv2.cvtColor(equalized, cv2.COLOR_GRAY2BGR)
-            
-            # For color images, apply CLAHE (Contrast Limited Adaptive Histogram Equalization) to each channel
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-            
-            # Split BGR channels and apply CLAHE to each
-            b, g, r = cv2.split(img_bgr)
-            b_eq = clahe.apply(b)
-            g_eq = clahe.apply(g)
-            r_eq = clahe.apply(r)
-            
-            # Merge channels back
-            equalized_color = cv2.merge([b_eq, g_eq, r_eq])
-            
-            # Convert back to RGB for PIL
-            equalized_rgb = cv2.cvtColor(equalized_color, cv2.COLOR_BGR2RGB)
-            
-            # Convert numpy array back to PIL image
-            equalized_img = Image.fromarray(equalized_rgb)
-            
-            return equalized_img
-            
+            return self.contrast_enhancer.enhance(img, cache_key, stamp)
         except Exception as e:
             # If histogram equalization fails, return original image
             print(f"Histogram equalization failed: {e}")
@@ -4625,7 +8933,7 @@ class ImageLabelTool:
             # Start zoom from current fitted scale and increment it
             current_scale = getattr(self, 'current_scale_factor', 1.0)
             self.zoom_level = min(current_scale * 1.25, 5.0)  # Increment from current scale
-        self.show_image()  # No text blink for zoom operations
+        self.request_render()  # No text blink for zoom operations; wheel bursts are coalesced
 
     def zoom_out(self):
         """Decrease zoom level"""
@@ -4639,10 +8947,12 @@ class ImageLabelTool:
             # Start zoom from current fitted scale and decrement it
             current_scale = getattr(self, 'current_scale_factor', 1.0)
             self.zoom_level = max(current_scale / 1.25, 0.1)  # Decrement from current scale
-        self.show_image()  # No text blink for zoom operations
+        self.request_render()  # No text blink for zoom operations; wheel bursts are coalesced
 
     def mouse_wheel_zoom(self, event):
         """Handle mouse wheel zoom"""
+        if self.grid_mode:
+            return
         # Allow mouse wheel zoom in both fit and 1:1 modes
         if event.delta > 0:
             self.zoom_in()
@@ -4652,6 +8962,13 @@ class ImageLabelTool:
     def double_click_zoom_in(self, event):
         """Handle double-click zoom in (x2) centered at click location"""
         print(f"🖱️  DOUBLE CLICK ZOOM IN at ({event.x}, {event.y})")
+        if self.grid_mode:
+            # Double-click in the grid opens the clicked image on its own
+            self.select_grid_cell(event.x, event.y)
+            self.toggle_grid_view()
+            return "break"
+        if self._minimap_drag:
+            return "break"  # Double-clicks on the minimap only jump
         self._perform_centered_zoom(event, 2.0)
         return "break"
         
@@ -4700,21 +9017,13 @@ class ImageLabelTool:
             # Validate the coordinate conversion
             if abs_x < 0 or abs_y < 0:
                 # Clamp coordinates to valid image area if click is in padding
-                path = self.image_paths[self.current_index]
-                img = Image.open(path)
-                orig_width, orig_height = img.size
+                orig_width, orig_height = self.get_current_source_size()
                 abs_x = max(0, min(abs_x, orig_width))
                 abs_y = max(0, min(abs_y, orig_height))
         else:
             # In fitted mode: need to account for centering offset and current scale
-            path = self.image_paths[self.current_index]
-            img = Image.open(path)
-            
-            # Apply the same processing that will be used for display
-            if hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get():
-                img = self.apply_histogram_equalization(img)
-                
-            original_width, original_height = img.size
+            # (equalization does not change the size, so the held source size is enough)
+            original_width, original_height = self.get_current_source_size()
             # Debug: uncomment for troubleshooting
             # print(f"🔍 FITTED DEBUG: Using processed image size ({original_width}x{original_height})")
             
@@ -4780,7 +9089,8 @@ class ImageLabelTool:
                 new_zoom = max(current_scale * zoom_factor, 0.1)
             self.zoom_level = new_zoom
         
-        # Redisplay image with new zoom
+        # Redisplay image with new zoom, centered on the clicked point before any tile is drawn
+        self._pending_zoom_center = (abs_x, abs_y)
         self.show_image()  # No text blink for zoom operations
         
         # Center the clicked point in viewport after the image is redrawn
@@ -4805,11 +9115,7 @@ class ImageLabelTool:
             return
             
         # Get the actual current image dimensions to validate coordinates
-        path = self.image_paths[self.current_index]
-        img = Image.open(path)
-        if hasattr(self, 'histogram_eq_enabled') and self.histogram_eq_enabled.get():
-            img = self.apply_histogram_equalization(img)
-        orig_width, orig_height = img.size
+        orig_width, orig_height = self.get_current_source_size()
         
         # Clamp coordinates to valid range
         image_x = max(0, min(image_x, orig_width))
@@ -4961,16 +9267,34 @@ class ImageLabelTool:
         """Handle Ctrl+double-click zoom out (x0.5) centered at click location"""
         # Debug: uncomment for troubleshooting
         # print(f"🖱️  CTRL+DOUBLE CLICK ZOOM OUT at ({event.x}, {event.y})")
+        if self._minimap_drag:
+            return "break"
         self._perform_centered_zoom(event, 0.5)
         return "break"
 
     def start_pan(self, event):
         """Start panning with mouse"""
+        if self.grid_mode:
+            # In the grid a click selects the image under the mouse
+            self.select_grid_cell(event.x, event.y)
+            return
+        # A click on the minimap jumps there; dragging on it keeps following the mouse
+        self._minimap_drag = self.minimap_jump(event.x, event.y)
+        if self._minimap_drag:
+            return
         self.canvas.scan_mark(event.x, event.y)
 
     def do_pan(self, event):
         """Perform panning with mouse drag"""
+        if self.grid_mode:
+            return
+        if self._minimap_drag:
+            self.minimap_jump(event.x, event.y, clamp=True)
+            return
         self.canvas.scan_dragto(event.x, event.y, gain=1)
+        # Draw only the tiles the drag has just exposed, fast now and sharp once the drag pauses
+        self.render_visible_tiles(RESAMPLE_FAST)
+        self._schedule_tile_refine()
 
     def detect_barcode_count(self, image_path):
         """Detect barcode in an image and return the count of detected barcodes"""
@@ -4979,19 +9303,28 @@ class ImageLabelTool:
             filename = os.path.basename(image_path)
             self.logger.info(f"Starting barcode detection for: {filename}")
             
-            # Read the image using OpenCV
-            image = cv2.imread(image_path)
-            if image is None:
+            # Read straight into a single-channel array: the detectors only use gray
+            # levels, and for JPEGs libjpeg skips the color conversion entirely
+            if image_path.lower().endswith(HIGH_BIT_DEPTH_EXTENSIONS):
+                # 12/16-bit frames: OpenCV would just drop the low byte, so use the auto window
+                try:
+                    gray = np.asarray(decode_image_file(image_path)[0].convert("L"))
+                except Exception:
+                    gray = None
+            elif split_archive_member(image_path) is not None:
+                # Archive members are decoded from memory, without extracting them
+                buffer = np.frombuffer(read_file_bytes(image_path), dtype=np.uint8)
+                gray = cv2.imdecode(buffer, cv2.IMREAD_GRAYSCALE)
+            else:
+                gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+            if gray is None:
                 self.logger.warning(f"Could not read image: {filename}")
                 return 0
             
             # Log image properties
-            height, width = image.shape[:2]
+            height, width = gray.shape[:2]
             self.logger.info(f"Image dimensions: {width}x{height} pixels")
             
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
             # Method 1: Look for barcode-like rectangular patterns
             barcode_count_method1 = self._detect_barcode_patterns(gray)
             self.logger.info(f"Method 1 (Pattern Detection) found: {barcode_count_method1} barcodes")
@@ -5126,32 +9459,44 @@ class ImageLabelTool:
         """Auto-detect function that detects barcodes in an image"""
         return self.detect_barcode_count(image_path)
 
-    def check_for_new_files(self):
-        """Check for new image files in the folder that weren't seen before"""
+    def check_for_new_files(self, arrived=None):
+        """Check for new image files in the folder that weren't seen before
+        
+        arrived: paths reported by the folder watcher; only these are checked and
+        the folder is not listed again.
+        """
         if not hasattr(self, 'folder_path') or not self.folder_path:
             return []
+        if self._folder_loading:
+            # Until the folder index and labels are loaded every image would look new and unlabeled
+            return []
         
         # Scan current folder for all image files
         try:
-            all_files = [f for f in os.listdir(self.folder_path)
-                        if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))]
-            
-            current_image_paths = []
-            for f in all_files:
-                current_image_paths.append(os.path.join(self.folder_path, f))
+            if arrived is None:
+                current_image_paths = self.get_folder_image_paths()
+            else:
+                self.get_folder_image_paths(refresh=False)
+                current_image_paths = self.folder_index.add(arrived)
             
             current_image_paths_set = set(current_image_paths)
             
             # Find new files (not in previously seen files)
             new_files = current_image_paths_set - self.previously_seen_files
             
+            # Files deleted from the folder leave the lists (only a full listing can tell)
+            if arrived is None and len(current_image_paths_set) != len(self.all_image_paths) + len(new_files):
+                self.drop_missing_images(current_image_paths_set)
+            
             # Update our records
             if new_files:
                 self.previously_seen_files.update(new_files)
-                # Also update all_image_paths to include new files
-                self.all_image_paths = sorted(current_image_paths)
-                # Refresh the display if needed
-                self.apply_filter()
+                # Merge the new files in sorted position; the current image stays on screen
+                self.merge_new_images(list(new_files))
+                # Thumbnail the new arrivals (already indexed images are skipped)
+                self.start_thumbnail_indexer()
+                # Aborted camera writes show up as corrupted before anyone navigates to them
+                self.fingerprint_images(self.folder_index, new_files)
             
             return list(new_files)
             
@@ -5159,9 +9504,9 @@ class ImageLabelTool:
             self.logger.error(f"Error scanning folder for new files: {e}")
             return []
 
-    def get_new_unlabeled_files(self):
-        """Get list of newly added files that are unlabeled"""
-        new_files = self.check_for_new_files()
+    def get_new_unlabeled_files(self, arrived=None):
+        """Get list of newly added files that are unlabeled (arrived: see check_for_new_files)"""
+        new_files = self.check_for_new_files(arrived)
         
         # Filter to only unlabeled files
         new_unlabeled = []
@@ -5448,7 +9793,7 @@ class ImageLabelTool:
             # Create timestamped folder name
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             folder_name = f"{folder_prefix}_{timestamp}"
-            destination_folder = os.path.join(self.folder_path, folder_name)
+            destination_folder = os.path.join(self.get_output_folder(), folder_name)
             
             # Create the directory
             os.makedirs(destination_folder, exist_ok=True)
@@ -5463,7 +9808,7 @@ class ImageLabelTool:
                 
                 # Copy the file
                 destination_path = os.path.join(destination_folder, filename)
-                shutil.copy2(image_path, destination_path)
+                copy_image_file(image_path, destination_path)
                 
                 copied += 1
                 
@@ -5624,7 +9969,7 @@ class ImageLabelTool:
                     # Create category-specific filename
                     safe_category = category.replace(' ', '_').replace('/', '_')
                     csv_filename = f"sessions_{safe_category}_{timestamp}.csv"
-                    csv_path = os.path.join(self.folder_path, csv_filename)
+                    csv_path = os.path.join(self.get_output_folder(), csv_filename)
                     
                     # Write CSV with detailed information
                     with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
@@ -5639,7 +9984,7 @@ class ImageLabelTool:
             
             # Also create a combined summary file
             summary_filename = f"sessions_summary_{timestamp}.csv"
-            summary_path = os.path.join(self.folder_path, summary_filename)
+            summary_path = os.path.join(self.get_output_folder(), summary_filename)
             
             with open(summary_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
@@ -5653,7 +9998,7 @@ class ImageLabelTool:
             diagnostic_info = ""
             if session_142_diagnostics:
                 diagnostic_filename = f"session_142_diagnostic_{timestamp}.txt"
-                diagnostic_path = os.path.join(self.folder_path, diagnostic_filename)
+                diagnostic_path = os.path.join(self.get_output_folder(), diagnostic_filename)
                 
                 with open(diagnostic_path, 'w', encoding='utf-8') as diag_file:
                     diag_file.write("=== SESSION 142 DIAGNOSTIC REPORT ===\n\n")
@@ -5753,34 +10098,12 @@ class ImageLabelTool:
             messagebox.showerror("CSV Error", f"Failed to generate sessions CSV:\n{str(e)}")
 
     def extract_session_id_from_filename(self, filename):
-        """Extract session ID from filename based on known patterns"""
-        # Remove file extension
-        name_without_ext = os.path.splitext(filename)[0]
-        
-        # Common patterns for session ID extraction
-        # Pattern 1: SessionID_TriggerID_... (e.g., "12345_001_image.jpg" -> session "12345")
-        # Pattern 2: Complex patterns like "12345_001_20240101_120000.jpg"
-        
-        parts = name_without_ext.split('_')
-        
-        if len(parts) >= 2:
-            # First part is typically the session ID
-            potential_session_id = parts[0]
-            
-            # Validate that it looks like a session ID (numeric or alphanumeric)
-            if potential_session_id and (potential_session_id.isdigit() or potential_session_id.isalnum()):
-                return potential_session_id
+        """Extract session ID from filename based on known patterns
         
-        # If standard pattern doesn't work, try other common patterns
-        # Some files might have format like "IMG_sessionID_triggerID.jpg"
-        if filename.upper().startswith('IMG_') and len(parts) >= 3:
-            return parts[1]  # Second part after IMG_
-        
-        # Fallback: return first part if it seems valid
-        if parts and parts[0] and (parts[0].isdigit() or parts[0].isalnum()):
-            return parts[0]
-        
-        return None
+        Pattern 1: SessionID_TriggerID_... (e.g., "12345_001_image.jpg" -> session "12345")
+        Pattern 2: IMG_sessionID_triggerID.jpg
+        """
+        return self.get_filename_info(filename).session_prefix
 
     def determine_session_classification(self, image_classifications, session_image_paths=None):
         """
@@ -5905,6 +10228,12 @@ class ImageLabelTool:
             messagebox.showerror("Invalid Interval", "Please enter a valid positive number for minutes.")
             return
         
+        if self._folder_loading:
+            # New files can only be told apart once the folder index and labels are loaded
+            self.auto_timer_status_var.set("Waiting for the folder to finish loading...")
+            self.root.after(FOLDER_LOADING_RETRY_MS, self.start_auto_timer)
+            return
+        
         self.stop_auto_timer()  # Stop any existing timer
         
         # Check for new images immediately when Start is clicked
@@ -5934,8 +10263,6 @@ class ImageLabelTool:
                     self.labels[file_path] = "(Unclassified)"
                 self.save_csv()
                 self.update_counts()
-                # Refresh the UI to show the new images
-                self.apply_filter()
         else:
             self.auto_timer_status_var.set(f"[{current_time}] No new unlabeled files found - monitoring started")
             self.logger.info("Start button: No new unlabeled files found")
@@ -5948,6 +10275,10 @@ class ImageLabelTool:
         # Disable only folder selection while monitoring (keep radio buttons and filter active)
         self.disable_ui_controls_for_monitoring()
         
+        # New images are picked up as soon as they are written; the periodic run only
+        # re-lists the folder in case the watcher missed something
+        self.start_folder_watcher()
+        
         interval_ms = int(interval_minutes * 60 * 1000)  # Convert minutes to milliseconds
         self.auto_timer_job = self.root.after(interval_ms, self.run_auto_detection_timer)
         
@@ -5963,6 +10294,8 @@ class ImageLabelTool:
         # Stop countdown
         self.stop_countdown()
         
+        self.stop_folder_watcher()
+        
         # Check for new images immediately when Stop is clicked
         if hasattr(self, 'auto_timer_enabled') and self.auto_timer_enabled.get():
             from datetime import datetime
@@ -5984,8 +10317,6 @@ class ImageLabelTool:
                     self.labels[file_path] = "(Unclassified)"
                 self.save_csv()
                 self.update_counts()
-                # Refresh the UI to show the new images
-                self.apply_filter()
             else:
                 self.auto_timer_status_var.set(f"[{current_time}] Final check: No new files found - monitoring stopped")
                 self.logger.info("Stop button: No new unlabeled files found")
@@ -6060,26 +10391,23 @@ class ImageLabelTool:
         
         # Get current files in folder
         try:
-            current_files = [f for f in os.listdir(self.folder_path)
-                           if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))]
-            
-            current_image_paths = []
-            for f in current_files:
-                current_image_paths.append(os.path.join(self.folder_path, f))
-            
-            current_image_paths.sort(key=self.get_image_sort_key)
+            current_image_paths = self.get_folder_image_paths()
             
             # Find new images (not in self.all_image_paths)
             new_images = []
             if hasattr(self, 'all_image_paths'):
-                new_images = [path for path in current_image_paths if path not in self.all_image_paths]
+                known = set(self.all_image_paths)
+                new_images = sorted((path for path in current_image_paths if path not in known),
+                                    key=self.get_image_sort_key)
                 
-                # Update the all_image_paths list with new images
+                # Merge the new images into all_image_paths (and the filtered view) in sorted position
                 if new_images:
-                    self.all_image_paths.extend(new_images)
-                    self.all_image_paths.sort(key=self.get_image_sort_key)
+                    self.merge_new_images(new_images)
+                    self.start_thumbnail_indexer()
+                    self.fingerprint_images(self.folder_index, new_images)
             else:
                 # If all_image_paths doesn't exist, all current images are "new"
+                current_image_paths.sort(key=self.get_image_sort_key)
                 new_images = current_image_paths
                 self.all_image_paths = current_image_paths
                 
@@ -6088,6 +10416,73 @@ class ImageLabelTool:
         except Exception as e:
             return []
 
+    def handle_new_unlabeled_files(self, new_unlabeled_files, source):
+        """Auto-detect or mark as unclassified the new files found while monitoring"""
+        self.auto_timer_status_var.set(f"Found {len(new_unlabeled_files)} new unlabeled files!")
+        
+        # Log the discovery of new files
+        self.logger.info(f"{source}: Found {len(new_unlabeled_files)} new unlabeled files")
+        for file_path in new_unlabeled_files:
+            self.logger.info(f"New file: {os.path.basename(file_path)}")
+        
+        # Check if auto-detection is enabled
+        if self.auto_detect_enabled.get():
+            self.auto_timer_status_var.set(f"Auto-detecting barcodes in {len(new_unlabeled_files)} new files...")
+            # Run auto-detection on new files only
+            self.process_auto_detection_on_new_files(new_unlabeled_files)
+        else:
+            self.auto_timer_status_var.set(f"Found {len(new_unlabeled_files)} new files")
+            # Update the CSV to mark these as unclassified
+            for file_path in new_unlabeled_files:
+                self.labels[file_path] = "(Unclassified)"
+            self.save_csv()
+            self.update_counts()
+
+    def start_folder_watcher(self):
+        """Watch the open folder so new images are handled as soon as they are completely written"""
+        self.stop_folder_watcher()
+        if not self.folder_path or is_archive_file(self.folder_path) or self.workspace is not None:
+            return  # Workspaces are re-listed by the periodic run
+        # The watcher thread only queues paths; they are handled in batches on the Tk thread
+        self.folder_watcher = FolderWatcher(self.folder_path,
+                                            notify=lambda: self.root.after(0, self._schedule_watch_drain))
+        self.logger.info(f"Watching {self.folder_path} for new images ({self.folder_watcher.backend})")
+
+    def stop_folder_watcher(self):
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+            self.folder_watcher = None
+        if self._watch_drain_job is not None:
+            self.root.after_cancel(self._watch_drain_job)
+            self._watch_drain_job = None
+
+    def _schedule_watch_drain(self):
+        if self._watch_drain_job is None and self.folder_watcher is not None:
+            self._watch_drain_job = self.root.after(WATCH_BATCH_MS, self.drain_watch_events)
+
+    def drain_watch_events(self):
+        """Handle the images the folder watcher reported since the last batch"""
+        self._watch_drain_job = None
+        if self.folder_watcher is None or not self.auto_timer_enabled.get():
+            return
+        if self._folder_loading:
+            self._schedule_watch_drain()  # Arrivals stay queued until the folder is loaded
+            return
+        arrived = []
+        relist = False
+        while True:
+            try:
+                event = self.folder_watcher.events.get_nowait()
+            except queue.Empty:
+                break
+            if event is None:
+                relist = True  # Events were lost
+            else:
+                arrived.append(event)
+        new_unlabeled_files = self.get_new_unlabeled_files(None if relist else arrived)
+        if new_unlabeled_files:
+            self.handle_new_unlabeled_files(new_unlabeled_files, "Folder watch")
+
     def run_auto_detection_timer(self):
         """Check for new unlabeled files every N minutes and optionally run auto-detection"""
         if not self.auto_timer_enabled.get():
@@ -6103,27 +10498,7 @@ class ImageLabelTool:
         new_unlabeled_files = self.get_new_unlabeled_files()
         
         if new_unlabeled_files:
-            self.auto_timer_status_var.set(f"Found {len(new_unlabeled_files)} new unlabeled files!")
-            
-            # Log the discovery of new files
-            self.logger.info(f"Timer check: Found {len(new_unlabeled_files)} new unlabeled files")
-            for file_path in new_unlabeled_files:
-                self.logger.info(f"New file: {os.path.basename(file_path)}")
-            
-            # Check if auto-detection is enabled
-            if self.auto_detect_enabled.get():
-                self.auto_timer_status_var.set(f"Auto-detecting barcodes in {len(new_unlabeled_files)} new files...")
-                # Run auto-detection on new files only
-                self.process_auto_detection_on_new_files(new_unlabeled_files)
-            else:
-                self.auto_timer_status_var.set(f"Found {len(new_unlabeled_files)} new files")
-                # Update the CSV to mark these as unclassified
-                for file_path in new_unlabeled_files:
-                    self.labels[file_path] = "(Unclassified)"
-                self.save_csv()
-                self.update_counts()
-                # Refresh the UI to show the new images
-                self.apply_filter()
+            self.handle_new_unlabeled_files(new_unlabeled_files, "Timer check")
         else:
             self.auto_timer_status_var.set(f"[{current_time}] No new unlabeled files found")
             self.logger.info("Timer check: No new unlabeled files found")
@@ -6175,6 +10550,7 @@ class ImageLabelTool:
         """Disable only folder selection during monitoring - keep radio buttons and filter active"""
         # Only disable folder selection
         self.btn_select.config(state='disabled')
+        self.btn_open_workspace.config(state='disabled')
         
         # Keep radio buttons, navigation, filter, and other controls enabled
         # This allows users to continue labeling while monitoring is active
@@ -6212,6 +10588,7 @@ class ImageLabelTool:
         """Re-enable folder selection after monitoring stops"""
         # Re-enable folder selection
         self.btn_select.config(state='normal')
+        self.btn_open_workspace.config(state='normal')
 
     def process_auto_detection_silent(self, unclassified_images):
         """Process auto classification silently without popup dialogs"""
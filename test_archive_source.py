@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test script for opening zip/tar archives as image folders (member index, random-access reads)
+"""
+
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import zipfile
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (ArchiveSource, DecodedImageCache, ThumbnailStore, archive_sidecar_folder,
+                              copy_image_file, decode_image_file, get_archive_source, get_file_stamp,
+                              list_image_paths, load_display_image, read_file_bytes, split_archive_member)
+
+
+def _jpeg_bytes(value, size=(320, 240)):
+    buffer = io.BytesIO()
+    Image.new("L", size, value).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _png_bytes(value, size=(64, 48)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (value, 0, 0)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _make_zip(path):
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(zipfile.ZipInfo("0000000001_0001_001_a.jpg", (2024, 5, 1, 12, 0, 0)), _jpeg_bytes(40))
+        archive.writestr(zipfile.ZipInfo("day2/0000000002_0001_001_b.png", (2024, 5, 2, 12, 0, 0)), _png_bytes(200),
+                         compress_type=zipfile.ZIP_DEFLATED)
+        archive.writestr("notes.txt", b"not an image")
+
+
+def _make_tar(path):
+    with tarfile.open(path, "w") as archive:
+        for name, data in (("0000000001_0001_001_a.jpg", _jpeg_bytes(90)), ("sub/c.png", _png_bytes(10))):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 1700000000
+            archive.addfile(info, io.BytesIO(data))
+
+
+def test_zip_members_are_read_in_place():
+    """Stored and deflated zip members are listed and read without extracting"""
+    with tempfile.TemporaryDirectory() as folder:
+        archive = os.path.join(folder, "line1.zip")
+        _make_zip(archive)
+        paths = list_image_paths(archive)
+        assert sorted(os.path.relpath(p, archive).replace(os.sep, "/") for p in paths) == [
+            "0000000001_0001_001_a.jpg", "day2/0000000002_0001_001_b.png"]
+        png = os.path.join(archive, "day2", "0000000002_0001_001_b.png")
+        assert split_archive_member(png) == (archive, "day2/0000000002_0001_001_b.png")
+        assert read_file_bytes(png) == _png_bytes(200)
+        img, reduction, source_size = decode_image_file(png)
+        assert source_size == (64, 48) and img.getpixel((0, 0))[0] == 200
+        assert split_archive_member(os.path.join(folder, "plain.jpg")) is None
+        # Nothing was extracted next to the archive
+        assert sorted(os.listdir(folder)) == ["line1.zip", "line1_labeltool"]
+    print("✓ Zip members are listed and decoded in place")
+
+
+def test_tar_members_are_read_in_place():
+    """Uncompressed tar members are read at their data offset"""
+    with tempfile.TemporaryDirectory() as folder:
+        archive = os.path.join(folder, "line1.tar")
+        _make_tar(archive)
+        source = ArchiveSource(archive)
+        assert sorted(source.names()) == ["0000000001_0001_001_a.jpg", "sub/c.png"]
+        assert source.read("sub/c.png") == _png_bytes(10)
+        assert source.member_stamp("sub/c.png") == (1700000000 * 10 ** 9, len(_png_bytes(10)))
+        source.close()
+
+        cache = DecodedImageCache(budget_bytes=20 * 1024 * 1024)
+        jpeg = os.path.join(archive, "0000000001_0001_001_a.jpg")
+        img, source_size = load_display_image(cache, jpeg, fit_size=(160, 120))
+        assert source_size == (320, 240) and abs(int(np.asarray(img).mean()) - 90) <= 2
+    print("✓ Tar members are read at their offset")
+
+
+def test_member_index_is_cached_next_to_archive():
+    """The member table is built once and reloaded until the archive changes"""
+    with tempfile.TemporaryDirectory() as folder:
+        archive = os.path.join(folder, "line1.zip")
+        _make_zip(archive)
+        first = ArchiveSource(archive)
+        assert os.path.isfile(first.index_path)
+        assert os.path.dirname(first.index_path) == archive_sidecar_folder(archive)
+
+        # A reopened source must not touch the zip directory
+        original = zipfile.ZipFile
+        zipfile.ZipFile = None
+        try:
+            second = ArchiveSource(archive)
+        finally:
+            zipfile.ZipFile = original
+        assert second.members == first.members
+
+        # Rewriting the archive invalidates the index and the shared source
+        before = get_archive_source(archive)
+        with zipfile.ZipFile(archive, "a") as appended:
+            appended.writestr("0000000003_0001_001_c.jpg", _jpeg_bytes(120))
+        os.utime(archive, ns=(1, 1))
+        after = get_archive_source(archive)
+        assert after is not before and len(after.names()) == len(first.names()) + 1
+        first.close()
+        second.close()
+    print("✓ Member index is cached and refreshed on change")
+
+
+def test_stamps_thumbnails_and_export():
+    """Members get stable stamps, their own thumbnails and can be exported one by one"""
+    with tempfile.TemporaryDirectory() as folder:
+        archive = os.path.join(folder, "line1.zip")
+        _make_zip(archive)
+        jpeg = os.path.join(archive, "0000000001_0001_001_a.jpg")
+        stamp = get_file_stamp(jpeg)
+        assert stamp is not None and stamp == get_file_stamp(jpeg)
+        assert get_file_stamp(os.path.join(archive, "missing.jpg")) is None
+
+        store = ThumbnailStore(archive_sidecar_folder(archive), root=archive)
+        img, _, source_size = decode_image_file(jpeg)
+        store.put(jpeg, "small", img, stamp, source_size)
+        assert store.get(jpeg, "small", stamp) is not None
+        assert "0000000001_0001_001_a.jpg" in store._entries
+        store.close()
+
+        destination = os.path.join(folder, "export.jpg")
+        copy_image_file(jpeg, destination)
+        with open(destination, "rb") as f:
+            assert f.read() == _jpeg_bytes(40)
+        assert os.stat(destination).st_mtime_ns == stamp[0]
+    print("✓ Archive members have stamps, thumbnails and exports")
+
+
+if __name__ == "__main__":
+    print("Testing archive sources...\n")
+    tests = [
+        test_zip_members_are_read_in_place,
+        test_tar_members_are_read_in_place,
+        test_member_index_is_cached_next_to_archive,
+        test_stamps_thumbnails_and_export,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All archive source tests passed!")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script for the session blink/compare mode (aligned frames, memoized flips, session selection)
+"""
+
+import sys
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (COMPARE_MAX_FRAMES, CompareFrames, FilenameCatalog, ImageLabelTool, ImagePyramid,
+                              PhotoPool, align_compare_frames, compare_frames_nbytes, decode_compare_frames)
+
+
+class _CompareOnly:
+    """Just the session lookup the compare mode uses, without any Tk widgets"""
+
+    get_filename_info = ImageLabelTool.get_filename_info
+    get_session_number = ImageLabelTool.get_session_number
+    get_session_siblings = ImageLabelTool.get_session_siblings
+    get_compare_paths = ImageLabelTool.get_compare_paths
+
+    def __init__(self, paths):
+        self.all_image_paths = paths
+        self.filename_catalog = FilenameCatalog(paths)
+        self._session_members = {}
+        self._session_members_source = None
+
+
+class _FakePhoto:
+    def __init__(self, img):
+        self.size = img.size
+
+    def paste(self, img):
+        pass
+
+
+def test_frames_are_aligned_to_anchor():
+    """Siblings of another size or mode are fitted and centered on the anchor's geometry"""
+    anchor = Image.new("L", (400, 300), 100)
+    wide = Image.new("RGB", (800, 300), (255, 0, 0))
+    small = Image.new("L", (200, 150), 50)
+    frames = align_compare_frames([anchor, wide, small], anchor.size)
+    assert all(frame.size == (400, 300) and frame.mode == "RGB" for frame in frames)
+    # The wide frame is letterboxed: black bands above and below the image
+    assert frames[1].getpixel((200, 10)) == (0, 0, 0) and frames[1].getpixel((200, 150)) == (255, 0, 0)
+    # The small frame is enlarged to cover the anchor
+    assert frames[2].getpixel((5, 5)) == (50, 50, 50)
+
+    gray = align_compare_frames([anchor, small], anchor.size)
+    assert all(frame.mode == "L" for frame in gray)
+    print("✓ Compare frames share the anchor's size and mode")
+
+
+def test_flips_are_memoized():
+    """Going back to a frame at the same view reuses its rendering"""
+    images = [Image.new("L", (1600, 1200), value) for value in (30, 120, 220)]
+    frames = CompareFrames(["a.jpg", "b.jpg", "c.jpg"], images, anchor_index=1)
+    assert frames.path == "b.jpg" and len(frames) == 3
+
+    first = frames.fitted((400, 300))
+    frames.step(1)
+    assert frames.path == "c.jpg"
+    other = frames.fitted((400, 300))
+    assert abs(int(np.asarray(other).mean()) - 220) <= 1
+    frames.step(-1)
+    assert frames.fitted((400, 300)) is first
+
+    tile = frames.tile(0.5, 1, 1)
+    assert tile is frames.tile(0.5, 1, 1)
+    expected = ImagePyramid(images[1]).render_tile(0.5, 1, 1)
+    assert tile.size == expected.size and np.array_equal(np.asarray(tile), np.asarray(expected))
+    assert frames.tile(0.5, 10, 10) is None  # Off-image
+    print("✓ Flips between frames reuse memoized renderings")
+
+
+def test_compare_paths_stay_in_session():
+    """Only images of the same ID + timestamp are compared, capped around the current one"""
+    paths = [f"/f/0000000001_{i:04d}_001_120000.jpg" for i in range(3)]
+    paths += ["/f/0000000002_0001_001_130000.jpg"]
+    view = _CompareOnly(paths)
+    assert view.get_compare_paths(paths[1]) == paths[:3]
+    assert view.get_compare_paths(paths[3]) == [paths[3]]
+
+    many = [f"/f/0000000003_{i:04d}_001_140000.jpg" for i in range(COMPARE_MAX_FRAMES + 10)]
+    view = _CompareOnly(many)
+    chosen = view.get_compare_paths(many[-1])
+    assert len(chosen) == COMPARE_MAX_FRAMES and chosen[-1] == many[-1]
+    print("✓ Compare mode picks the images of the current session")
+
+
+def test_frames_fit_the_budget():
+    """Large 1:1 frames are cut to the nearest ones that fit, and only the current frame keeps a pyramid"""
+    paths = [f"/f/{i}.png" for i in range(COMPARE_MAX_FRAMES)]
+    decoded = []
+
+    def decode(path):
+        decoded.append(path)
+        return Image.new("RGB", (1000, 800), (int(path[3:-4]) * 10, 0, 0))
+
+    budget = compare_frames_nbytes(5, (1000, 800), gray=False)
+    kept, images, anchor = decode_compare_frames(paths, 6, decode, budget_bytes=budget)
+    assert kept == paths[4:9] and kept[anchor] == paths[6]
+    assert [img.getpixel((0, 0))[0] for img in images] == [40, 50, 60, 70, 80]
+    assert len(decoded) == 6  # The first frame over the budget is dropped, nothing after it is decoded
+
+    # Gray frames take a third of the memory, so more of them fit
+    gray = decode_compare_frames(paths, 6, lambda path: Image.new("L", (1000, 800)), budget_bytes=budget)[0]
+    assert len(gray) > 5
+    # The anchor and one neighbour are always compared
+    assert len(decode_compare_frames(paths, 0, decode, budget_bytes=1)[0]) == 2
+
+    frames = CompareFrames(kept, images, anchor, session_size=len(paths))
+    assert frames.session_size == COMPARE_MAX_FRAMES and len(frames) == 5
+    frames.tile(0.25, 0, 0)
+    frames.step(1)
+    frames.tile(0.25, 0, 0)
+    assert list(frames._pyramids) == [frames.index]
+    print("✓ Compare frames stay within the memory budget")
+
+
+def test_pool_reports_matching_photos():
+    """Tile photos are pasted in place only when size and mode match"""
+    pool = PhotoPool(photo_factory=_FakePhoto)
+    photo = pool.acquire(Image.new("L", (256, 256)))
+    assert pool.fits(photo, Image.new("L", (256, 256)))
+    assert not pool.fits(photo, Image.new("RGB", (256, 256)))
+    assert not pool.fits(photo, Image.new("L", (100, 256)))
+    print("✓ Photo pool tells which tiles can be repainted in place")
+
+
+if __name__ == "__main__":
+    print("Testing compare mode...\n")
+    tests = [
+        test_frames_are_aligned_to_anchor,
+        test_flips_are_memoized,
+        test_compare_paths_stay_in_session,
+        test_frames_fit_the_budget,
+        test_pool_reports_matching_photos,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All compare mode tests passed!")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for the session contact sheet: grid layout and batched parallel thumbnailing
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+from PIL import Image
+
+from image_label_tool import (ContactSheetLoader, DecodedImageCache, ThumbnailStore, contact_sheet_layout,
+                              create_thumbnails, make_contact_sheet_thumbnail)
+
+
+def _make_session(folder, count, size=(1600, 1200)):
+    """Create the camera views of one session (same trigger ID and timestamp)"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"0000001234_{i + 1:04d}_001_20240101120000.jpg")
+        Image.new("RGB", size, (i * 40 % 255, 90, 30)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_layout_prefers_large_cells():
+    """Six 4:3 views on a landscape canvas are laid out 3x2"""
+    assert contact_sheet_layout(6, (900, 700)) == (3, 2)
+    assert contact_sheet_layout(1, (900, 700)) == (1, 1)
+    assert contact_sheet_layout(4, (900, 700)) == (2, 2)
+    assert contact_sheet_layout(0, (900, 700)) == (0, 0)
+    print("✓ Grid layout maximizes thumbnail size")
+
+
+def test_worker_thumbnail_fits_box():
+    """The worker entry point returns a thumbnail inside the box and survives bad files"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_session(folder, 1)[0]
+        _, img, source_size = make_contact_sheet_thumbnail(path, (280, 300))
+        assert source_size == (1600, 1200)
+        assert img.size == (280, 210)
+
+        broken = os.path.join(folder, "broken.jpg")
+        with open(broken, "wb") as f:
+            f.write(b"not a jpeg")
+        assert make_contact_sheet_thumbnail(broken, (280, 300)) == (broken, None, None)
+    print("✓ Worker thumbnails fit their cell")
+
+
+def test_session_is_one_batch():
+    """A whole session is thumbnailed by one request; the second request is served from cache"""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _make_session(folder, 6)
+        cache = DecodedImageCache(budget_bytes=50 * 1024 * 1024)
+        loader = ContactSheetLoader(cache, workers=2)
+        try:
+            done = threading.Event()
+            received = {}
+
+            def on_loaded(request_id, results):
+                received[request_id] = results
+                done.set()
+
+            request_id = loader.request(paths, (280, 300), callback=on_loaded)
+            assert done.wait(timeout=60)
+            assert set(received[request_id]) == set(paths)
+            assert loader.decoded_count == 6
+
+            # Same session again: nothing is decoded
+            done.clear()
+            request_id = loader.request(paths, (280, 300), callback=on_loaded)
+            assert done.wait(timeout=60)
+            assert len(received[request_id]) == 6
+            assert loader.decoded_count == 6
+        finally:
+            loader.stop()
+    print("✓ A session is thumbnailed in one batch")
+
+
+def test_stored_thumbnails_skip_decoding():
+    """Images already in the folder's thumbnail store are not sent to the workers"""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _make_session(folder, 3)
+        store = ThumbnailStore(folder)
+        create_thumbnails(store, paths[0])
+        loader = ContactSheetLoader(DecodedImageCache(budget_bytes=50 * 1024 * 1024), workers=1)
+        try:
+            results = loader.load_batch(paths, (200, 150), thumbnails=store)
+            assert len(results) == 3
+            assert loader.decoded_count == 2
+            assert all(img.width <= 200 and img.height <= 150 for img in results.values())
+        finally:
+            loader.stop()
+            store.close()
+    print("✓ Stored thumbnails are reused by the grid")
+
+
+if __name__ == "__main__":
+    print("Testing session contact sheet...\n")
+    tests = [
+        test_layout_prefers_large_cells,
+        test_worker_thumbnail_fits_box,
+        test_session_is_one_batch,
+        test_stored_thumbnails_skip_decoding,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All contact sheet tests passed!")
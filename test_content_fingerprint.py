@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test script for content fingerprints (digest and decode check per image, stored in the folder index)
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+import image_label_tool
+from image_label_tool import (ContentFingerprinter, DecodedImageCache, FolderIndex, ThumbnailStore,
+                              fingerprint_image, get_file_stamp)
+
+
+def _jpeg_bytes(value=128, size=(320, 240)):
+    buffer = io.BytesIO()
+    Image.new("L", size, value).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _write(path, data, mtime_offset_s=0):
+    with open(path, "wb") as f:
+        f.write(data)
+    if mtime_offset_s:
+        stamp = time.time_ns() + mtime_offset_s * 10 ** 9
+        os.utime(path, ns=(stamp, stamp))
+
+
+def _fingerprint(index, paths):
+    """Run one pass over paths; return the (changed, restamped, corrupted) it reported"""
+    reports = []
+    fingerprinter = ContentFingerprinter([(index, paths)], on_report=lambda *report: reports.append(report),
+                                         workers=2)
+    assert fingerprinter.wait(timeout=10)
+    fingerprinter.stop()
+    changed, restamped, corrupted = [], [], []
+    for report in reports:
+        changed += report[0]
+        restamped += report[1]
+        corrupted += report[2]
+    return fingerprinter, changed, restamped, corrupted
+
+
+def test_truncated_images_are_invalid():
+    """A JPEG cut off in the middle hashes fine but does not decode"""
+    with tempfile.TemporaryDirectory() as folder:
+        good = os.path.join(folder, "good.jpg")
+        cut = os.path.join(folder, "cut.jpg")
+        data = _jpeg_bytes()
+        _write(good, data)
+        _write(cut, data[:len(data) // 2])
+        stamp, digest, valid = fingerprint_image(good)
+        assert stamp == get_file_stamp(good) and valid and len(digest) == 32
+        assert fingerprint_image(cut)[2] is False
+        assert fingerprint_image(os.path.join(folder, "missing.jpg")) is None
+    print("✓ Truncated images are flagged as not decodable")
+
+
+def test_pass_fills_and_persists_the_index():
+    """Fingerprints land in the stored index; a reopened index is not read again"""
+    with tempfile.TemporaryDirectory() as folder:
+        data = _jpeg_bytes()
+        for i in range(6):
+            _write(os.path.join(folder, f"{i:04d}_001_a.jpg"), data)
+        _write(os.path.join(folder, "0006_001_a.jpg"), data[:100])
+        index_path = os.path.join(folder, ".labeltool_cache", "folder_index.json")
+        index = FolderIndex(folder, index_path)
+        index.refresh()
+        fingerprinter, changed, restamped, corrupted = _fingerprint(index, index.paths())
+        assert fingerprinter.fingerprinted == 7 and changed == [] and restamped == []
+        assert [os.path.basename(p) for p in corrupted] == ["0006_001_a.jpg"]
+
+        reopened = FolderIndex(folder, index_path)
+        assert [os.path.basename(p) for p in reopened.corrupted_paths()] == ["0006_001_a.jpg"]
+        fingerprinter, _, _, corrupted = _fingerprint(reopened, reopened.paths())
+        assert fingerprinter.fingerprinted == 0 and corrupted == []
+    print("✓ Fingerprints are stored in the folder index and reused")
+
+
+def test_rewrites_and_touches_are_told_apart():
+    """New content is reported as changed; a new mtime with the same content only as restamped"""
+    with tempfile.TemporaryDirectory() as folder:
+        rewritten = os.path.join(folder, "a.jpg")
+        touched = os.path.join(folder, "b.jpg")
+        _write(rewritten, _jpeg_bytes(100))
+        _write(touched, _jpeg_bytes(100))
+        index = FolderIndex(folder)
+        index.refresh()
+        _fingerprint(index, index.paths())
+
+        old_stamp = get_file_stamp(touched)
+        _write(rewritten, _jpeg_bytes(200), mtime_offset_s=5)
+        _write(touched, _jpeg_bytes(100), mtime_offset_s=5)
+        _, changed, restamped, corrupted = _fingerprint(index, index.paths())
+        assert changed == [os.path.normpath(rewritten)] and corrupted == []
+        assert restamped == [(os.path.normpath(touched), old_stamp, get_file_stamp(touched))]
+        assert index.fingerprint(touched)[0] == get_file_stamp(touched)
+    print("✓ Rewritten and merely touched images are told apart")
+
+
+def test_caches_are_invalidated_by_path():
+    """Every cache entry of a changed image goes; restamped thumbnails stay valid"""
+    cache = DecodedImageCache(10 * 1024 * 1024)
+    img = Image.new("L", (10, 10))
+    cache.put("/f/a.jpg", img, (1, 1))
+    cache.put(("/f/a.jpg", (5, 5)), img, (1, 1))
+    cache.put((("/f/a.jpg", (5, 5), 0), (2.0, (8, 8))), img, (1, 1))
+    cache.put("/f/b.jpg", img, (1, 1))
+    cache.discard_path("/f/a.jpg")
+    assert len(cache) == 1 and "/f/b.jpg" in cache
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "a.jpg")
+        store = ThumbnailStore(folder)
+        store.put(path, "small", img, (1, 10), (100, 100))
+        store.restamp(path, (1, 10), (2, 10))
+        assert store.get(path, "small", (2, 10)) is not None
+        store.discard(path)
+        assert store.get(path, "small", (2, 10)) is None
+        store.close()
+    print("✓ Caches drop changed images and keep restamped thumbnails")
+
+
+def test_add_during_save_is_safe():
+    """Files reported by the watcher may be added while the fingerprinter saves the index"""
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(5):
+            _write(os.path.join(folder, f"{i}.jpg"), b"x")
+        index = FolderIndex(folder, os.path.join(folder, ".labeltool_cache", "folder_index.json"))
+        index.refresh()
+        late = os.path.join(folder, "late.jpg")
+        _write(late, b"x")
+        real_dump = image_label_tool.json.dump
+
+        def dump_while_adding(data, f):
+            # The Tk thread adds an arrival while the entries are being written
+            for _ in data["entries"].items():
+                index.add([late])
+            real_dump(data, f)
+
+        image_label_tool.json.dump = dump_while_adding
+        try:
+            index.save()
+        finally:
+            image_label_tool.json.dump = real_dump
+        assert index.fingerprint(late) is None and os.path.normpath(late) in index.paths()
+        index.save()
+        assert "late.jpg" in FolderIndex(folder, index.index_path).names()
+    print("✓ Saving the index tolerates concurrent additions")
+
+
+if __name__ == "__main__":
+    print("Testing content fingerprints...\n")
+    tests = [
+        test_truncated_images_are_invalid,
+        test_pass_fills_and_persists_the_index,
+        test_rewrites_and_touches_are_told_apart,
+        test_caches_are_invalidated_by_path,
+        test_add_during_save_is_safe,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All content fingerprint tests passed!")
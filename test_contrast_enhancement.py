@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the memoized single-pass CLAHE contrast enhancement
+"""
+
+import sys
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import ContrastEnhancer
+
+
+def _low_contrast_image(mode):
+    """Image whose values sit in a narrow band so CLAHE visibly stretches them"""
+    rng = np.random.default_rng(0)
+    gray = (100 + rng.integers(0, 20, (120, 160))).astype(np.uint8)
+    img = Image.fromarray(gray)
+    return img if mode == "L" else img.convert(mode)
+
+
+def test_grayscale_stays_single_channel():
+    """Grayscale input is enhanced without converting to RGB"""
+    enhancer = ContrastEnhancer()
+    result = enhancer.enhance(_low_contrast_image("L"))
+    assert result.mode == "L"
+    assert np.asarray(result).std() > np.asarray(_low_contrast_image("L")).std()
+    print("✓ Grayscale images stay in mode L")
+
+
+def test_color_keeps_chroma():
+    """Color input is enhanced on luminance only, so a gray image stays gray"""
+    enhancer = ContrastEnhancer()
+    result = np.asarray(enhancer.enhance(_low_contrast_image("RGB")), dtype=np.int16)
+    assert result.shape[2] == 3
+    # Equal channels in, (almost) equal channels out
+    assert np.abs(result[:, :, 0] - result[:, :, 1]).max() <= 2
+    assert np.abs(result[:, :, 1] - result[:, :, 2]).max() <= 2
+    print("✓ Color images keep their chroma")
+
+
+def test_results_are_memoized():
+    """A second request for the same key returns the cached result"""
+    enhancer = ContrastEnhancer()
+    img = _low_contrast_image("RGB")
+    first = enhancer.enhance(img, cache_key=("a.jpg", img.size), stamp=(1, 10))
+    second = enhancer.enhance(img, cache_key=("a.jpg", img.size), stamp=(1, 10))
+    assert first is second
+
+    # A changed file stamp recomputes
+    third = enhancer.enhance(img, cache_key=("a.jpg", img.size), stamp=(2, 10))
+    assert third is not first
+    print("✓ Enhanced images are memoized per path and stamp")
+
+
+def test_parameters_are_part_of_the_key():
+    """Changing the enhancement parameters does not return stale results"""
+    enhancer = ContrastEnhancer()
+    img = _low_contrast_image("L")
+    first = enhancer.enhance(img, cache_key="a.jpg")
+    enhancer.clip_limit = 4.0
+    second = enhancer.enhance(img, cache_key="a.jpg")
+    assert first is not second
+    print("✓ Parameters are part of the cache key")
+
+
+def test_clahe_object_reused():
+    """The CLAHE object is created once and reused"""
+    enhancer = ContrastEnhancer()
+    clahe = enhancer._clahe()
+    enhancer.enhance(_low_contrast_image("L"))
+    assert enhancer._clahe() is clahe
+    print("✓ CLAHE object is reused")
+
+
+if __name__ == "__main__":
+    print("Testing contrast enhancement...\n")
+    tests = [
+        test_grayscale_stays_single_channel,
+        test_color_keeps_chroma,
+        test_results_are_memoized,
+        test_parameters_are_part_of_the_key,
+        test_clahe_object_reused,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All contrast enhancement tests passed!")
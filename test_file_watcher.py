@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for the monitoring-mode folder watcher (inotify and polling backends, settle check)
+"""
+
+import os
+import queue
+import sys
+import tempfile
+import time
+
+from image_label_tool import FolderIndex, FolderWatcher
+
+
+def _collect(watcher, count, timeout=5.0):
+    """Events of watcher until count arrived or timeout"""
+    events = []
+    deadline = time.monotonic() + timeout
+    while len(events) < count and time.monotonic() < deadline:
+        try:
+            events.append(watcher.events.get(timeout=0.05))
+        except queue.Empty:
+            pass
+    return events
+
+
+def _write_slowly(path, chunks, pause):
+    with open(path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            f.flush()
+            time.sleep(pause)
+
+
+def test_new_images_are_reported():
+    """Both backends report new images (only) and ignore files that were already there"""
+    for backend in ("inotify", "polling"):
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder, "old.jpg"), "wb") as f:
+                f.write(b"old")
+            watcher = FolderWatcher(folder, backend=backend, poll_interval=0.05, settle=0.1)
+            try:
+                with open(os.path.join(folder, "notes.txt"), "wb") as f:
+                    f.write(b"text")
+                os.mkdir(os.path.join(folder, "sub.jpg"))
+                with open(os.path.join(folder, "new.jpg"), "wb") as f:
+                    f.write(b"image")
+                events = _collect(watcher, 1)
+                time.sleep(0.3)
+                events += _collect(watcher, 1, timeout=0.1)
+            finally:
+                watcher.stop()
+            assert events == [os.path.join(folder, "new.jpg")], (watcher.backend, events)
+    print("✓ New image files are reported by both backends")
+
+
+def test_inotify_reports_within_milliseconds():
+    """With inotify a closed file is queued right away; renames into the folder count as arrivals"""
+    with tempfile.TemporaryDirectory() as folder, tempfile.TemporaryDirectory() as elsewhere:
+        watcher = FolderWatcher(folder)
+        try:
+            if watcher.backend != "inotify":
+                print("  (inotify not available here, skipped)")
+                return
+            start = time.monotonic()
+            with open(os.path.join(folder, "a.png"), "wb") as f:
+                f.write(b"png")
+            assert _collect(watcher, 1) == [os.path.join(folder, "a.png")]
+            assert time.monotonic() - start < 0.5
+
+            staged = os.path.join(elsewhere, "b.png")
+            with open(staged, "wb") as f:
+                f.write(b"png")
+            os.replace(staged, os.path.join(folder, "b.png"))
+            assert _collect(watcher, 1) == [os.path.join(folder, "b.png")]
+        finally:
+            watcher.stop()
+    print("✓ inotify reports written and moved-in files at once")
+
+
+def test_half_written_files_wait():
+    """A file still being written is reported once, after the writer is done"""
+    for backend in ("inotify", "polling"):
+        with tempfile.TemporaryDirectory() as folder:
+            watcher = FolderWatcher(folder, backend=backend, poll_interval=0.05, settle=0.3)
+            path = os.path.join(folder, "camera.jpg")
+            try:
+                start = time.monotonic()
+                _write_slowly(path, [b"x" * 1000] * 5, pause=0.15)
+                written = time.monotonic()
+                events = _collect(watcher, 1)
+                reported = time.monotonic()
+                time.sleep(0.3)
+                events += _collect(watcher, 1, timeout=0.1)
+            finally:
+                watcher.stop()
+            assert events == [path], (watcher.backend, events)
+            assert reported >= written, watcher.backend
+            assert os.path.getsize(path) == 5000 and reported - start >= 0.6
+    print("✓ Half-written files are only reported when complete")
+
+
+def test_index_records_watched_files():
+    """Watched arrivals enter the folder index without a directory listing"""
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, "a.jpg"), "wb") as f:
+            f.write(b"a")
+        index = FolderIndex(folder)
+        index.refresh()
+        with open(os.path.join(folder, "b.jpg"), "wb") as f:
+            f.write(b"bb")
+        new_path = os.path.join(folder, "b.jpg")
+        gone_path = os.path.join(folder, "gone.jpg")
+        assert index.add([new_path, gone_path, os.path.join(folder, "c.txt")]) == [new_path]
+        assert index.scans == 1 and index.stat(new_path)[1] == 2
+        assert index.add([new_path]) == [new_path]  # Already indexed
+    print("✓ Folder index takes watched files without listing")
+
+def test_stop_after_folder_removed():
+    """A watcher whose folder vanished ends on its own; stop() then closes its fds exactly once"""
+    with tempfile.TemporaryDirectory() as parent:
+        folder = os.path.join(parent, "line1")
+        os.mkdir(folder)
+        watcher = FolderWatcher(folder)
+        if watcher.backend != "inotify":
+            watcher.stop()
+            print("  (inotify not available here, skipped)")
+            return
+        fds = [watcher._fd, *watcher._wake]
+        os.rmdir(folder)
+        watcher._thread.join(timeout=5)
+        assert not watcher._thread.is_alive()
+        for fd in fds:
+            os.fstat(fd)  # Still open: the reader does not close them behind stop()'s back
+        watcher.stop()
+        watcher.stop()
+        for fd in fds:
+            try:
+                os.fstat(fd)
+            except OSError:
+                continue
+            raise AssertionError(f"fd {fd} left open")
+    print("✓ Stopping a watcher of a removed folder is safe")
+
+
+if __name__ == "__main__":
+    print("Testing folder watcher...\n")
+    tests = [
+        test_new_images_are_reported,
+        test_inotify_reports_within_milliseconds,
+        test_half_written_files_wait,
+        test_index_records_watched_files,
+        test_stop_after_folder_removed,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All folder watcher tests passed!")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the pre-parsed filename catalog (sort keys, sessions, trigger IDs, dates)
+"""
+
+import sys
+
+from image_label_tool import FilenameCatalog, FilenameInfo, ImageLabelTool
+
+
+class _CatalogOnly:
+    """The filename lookups of the tool, without any Tk widgets"""
+
+    get_filename_info = ImageLabelTool.get_filename_info
+    get_image_sort_key = ImageLabelTool.get_image_sort_key
+    get_session_number = ImageLabelTool.get_session_number
+    extract_session_id_from_filename = ImageLabelTool.extract_session_id_from_filename
+    extract_date_from_filename = ImageLabelTool.extract_date_from_filename
+
+    def __init__(self, paths=()):
+        self.filename_catalog = FilenameCatalog(paths)
+
+
+def test_standard_filename_parts():
+    """ID, sub-image, session and date of the camera naming scheme"""
+    info = FilenameInfo("0000012345_0003_001_20240315143000.jpg")
+    assert info.sort_key == (12345, 3)
+    assert info.trigger == "12345" and info.trigger_number == 12345
+    assert info.session == "0000012345_20240315143000"
+    assert (info.session_base, info.session_suffix) == ("12345", "20240315143000")
+    assert info.session_prefix == "0000012345"
+    assert info.date == "15-03-2024"
+    print("✓ Standard filenames are parsed into their parts")
+
+
+def test_irregular_filenames():
+    """Names outside the scheme keep the lookups' fallbacks"""
+    single = FilenameInfo("snapshot.png")
+    assert single.sort_key == (0, 0) and single.session == "snapshot" and single.trigger_number is None
+    assert single.session_prefix == "snapshot" and single.date is None
+    # The sort key splits the name with its extension, so "002.jpg" is not a sub-image number
+    assert FilenameInfo("0001_002.jpg").sort_key == (1, 0)
+    camera = FilenameInfo("IMG_4711_03.jpg")
+    assert camera.session_prefix == "IMG"
+    assert FilenameInfo("IMG-_4711_03.jpg").session_prefix is None
+    assert FilenameInfo("-12_0001_x.jpg").trigger_number == -12
+    print("✓ Irregular filenames fall back like before")
+
+
+def test_tool_lookups_read_the_catalog():
+    """Sort key, session and date lookups are served from one parsed entry per name"""
+    paths = [f"/data/{i:010d}_{j:04d}_001_120000.jpg" for i in range(3) for j in range(2)]
+    tool = _CatalogOnly(paths)
+    assert len(tool.filename_catalog) == 6
+    assert sorted(reversed(paths), key=tool.get_image_sort_key) == paths
+    assert tool.get_session_number(paths[1]) == "0000000000_120000"
+    assert tool.extract_session_id_from_filename("0000000002_0001_001_120000.jpg") == "0000000002"
+    assert tool.get_filename_info(paths[0]) is tool.get_filename_info("0000000000_0000_001_120000.jpg")
+    # Names that were not in the folder when it was opened are parsed on first use
+    assert tool.extract_date_from_filename("0000000009_0001_001_20231231.jpg") == "31-12-2023"
+    assert len(tool.filename_catalog) == 7
+    print("✓ Tool lookups share the folder's filename catalog")
+
+
+if __name__ == "__main__":
+    print("Testing filename catalog...\n")
+    tests = [
+        test_standard_filename_parts,
+        test_irregular_filenames,
+        test_tool_lookups_read_the_catalog,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All filename catalog tests passed!")
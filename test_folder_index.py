@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the scandir-based folder index (persisted snapshot, incremental refresh)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from image_label_tool import FolderIndex
+
+
+def _touch(path, data=b"x"):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _age_folder(folder):
+    """Give the folder an old mtime so the index may trust it (fresh mtimes are re-listed)"""
+    past = time.time_ns() - 3600 * 10 ** 9
+    os.utime(folder, ns=(past, past))
+
+
+def test_index_lists_images_with_stat():
+    """Only image files are indexed, with their size and mtime"""
+    with tempfile.TemporaryDirectory() as folder:
+        _touch(os.path.join(folder, "0001_001_a.jpg"), b"12345")
+        _touch(os.path.join(folder, "0002_001_b.PNG"))
+        _touch(os.path.join(folder, "revision_20240101_120000.csv"))
+        os.mkdir(os.path.join(folder, "export.jpg"))  # A directory with an image-like name
+        index = FolderIndex(folder)
+        added, removed = index.refresh()
+        assert sorted(os.path.basename(p) for p in added) == ["0001_001_a.jpg", "0002_001_b.PNG"]
+        assert removed == []
+        path = os.path.join(folder, "0001_001_a.jpg")
+        stat_result = os.stat(path)
+        assert index.stat(path) == (stat_result.st_mtime_ns, 5)
+    print("✓ Image files are indexed with size and mtime")
+
+
+def test_unchanged_folder_is_not_listed_again():
+    """A reopened index trusts its snapshot while the directory mtime is unchanged"""
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(5):
+            _touch(os.path.join(folder, f"{i:04d}_001_a.jpg"))
+        os.mkdir(os.path.join(folder, ".labeltool_cache"))  # Sidecar made when the folder was opened
+        _age_folder(folder)
+        index_path = os.path.join(folder, ".labeltool_cache", "folder_index.json")
+        first = FolderIndex(folder, index_path)
+        first.refresh()
+        assert first.scans == 1 and os.path.isfile(index_path)
+
+        reopened = FolderIndex(folder, index_path)
+        assert reopened.refresh() == ([], []) and reopened.scans == 0
+        assert sorted(reopened.paths()) == sorted(first.paths())
+    print("✓ Unchanged folders are served from the stored snapshot")
+
+
+def test_refresh_diffs_new_and_removed_files():
+    """Added and removed files are reported; unchanged known entries are kept as they are"""
+    with tempfile.TemporaryDirectory() as folder:
+        for name in ("a.jpg", "b.jpg"):
+            _touch(os.path.join(folder, name))
+        _age_folder(folder)
+        index_path = os.path.join(folder, ".labeltool_cache", "folder_index.json")
+        index = FolderIndex(folder, index_path)
+        index.refresh()
+
+        os.remove(os.path.join(folder, "a.jpg"))
+        _touch(os.path.join(folder, "c.jpg"), b"new")
+        _age_folder(folder)
+        added, removed = index.refresh()
+        assert [os.path.basename(p) for p in added] == ["c.jpg"]
+        assert [os.path.basename(p) for p in removed] == ["a.jpg"]
+        assert index.scans == 2
+
+        # The stored snapshot has the update as well
+        reopened = FolderIndex(folder, index_path)
+        assert sorted(reopened.names()) == ["b.jpg", "c.jpg"] and reopened.refresh() == ([], [])
+    print("✓ Refresh diffs the folder against the snapshot")
+
+
+def test_listing_refreshes_overwritten_files():
+    """A file overwritten in place gets its new size and mtime, and loses its fingerprint, at the next listing"""
+    with tempfile.TemporaryDirectory() as folder:
+        changed, same = os.path.join(folder, "a.jpg"), os.path.join(folder, "b.jpg")
+        _touch(changed, b"old")
+        _touch(same, b"same")
+        index_path = os.path.join(folder, ".labeltool_cache", "folder_index.json")
+        index = FolderIndex(folder, index_path)
+        index.refresh()
+        for path in (changed, same):
+            mtime_ns, size = index.stat(path)
+            index.set_fingerprint(path, (mtime_ns, size), "digest", True)
+
+        past = time.time_ns() - 7200 * 10 ** 9
+        _touch(changed, b"overwritten")
+        os.utime(changed, ns=(past, past))
+        _touch(os.path.join(folder, "c.jpg"))  # Lists the folder again
+        _age_folder(folder)
+        index.refresh()
+        assert index.stat(changed) == (past, len(b"overwritten"))
+        assert index.fingerprint(changed) is None
+        assert index.fingerprint(same)[1:] == ("digest", True)
+
+        reopened = FolderIndex(folder, index_path)
+        assert reopened.stat(changed) == (past, len(b"overwritten"))
+    print("✓ Listings refresh the stat of files overwritten in place")
+
+
+def test_recent_folder_mtime_is_not_trusted():
+    """Right after a change the folder is listed again, in case more files arrive in the same tick"""
+    with tempfile.TemporaryDirectory() as folder:
+        _touch(os.path.join(folder, "a.jpg"))
+        index = FolderIndex(folder)
+        index.refresh()
+        _touch(os.path.join(folder, "b.jpg"))
+        added, _ = index.refresh()
+        assert [os.path.basename(p) for p in added] == ["b.jpg"]
+    print("✓ Recently modified folders are re-listed")
+
+
+if __name__ == "__main__":
+    print("Testing folder index...\n")
+    tests = [
+        test_index_lists_images_with_stat,
+        test_unchanged_folder_is_not_listed_again,
+        test_refresh_diffs_new_and_removed_files,
+        test_listing_refreshes_overwritten_files,
+        test_recent_folder_mtime_is_not_trusted,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All folder index tests passed!")
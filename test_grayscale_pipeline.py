@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for the grayscale-native decode, enhancement and caching pipeline
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (ContrastEnhancer, DecodedImageCache, decode_image_file, load_display_image,
+                              normalize_monochrome, resample_image, RESAMPLE_FAST)
+
+
+def _gray_frame(width=640, height=480):
+    """Grayscale frame with some structure, like a scanner camera image"""
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    stripes = (np.arange(width) // 8 % 2 * 60)[None, :].repeat(height, axis=0)
+    return Image.fromarray(np.clip(x * 0.6 + stripes, 0, 255).astype(np.uint8))
+
+
+def test_monochrome_sources_become_l():
+    """Gray JPEGs and gray-palette BMPs decode as mode L"""
+    with tempfile.TemporaryDirectory() as folder:
+        gray = _gray_frame()
+        sources = {
+            "gray.jpg": gray,
+            "palette.bmp": gray.convert("P"),  # 8-bit BMP with a grayscale palette
+        }
+        for name, img in sources.items():
+            path = os.path.join(folder, name)
+            img.save(path)
+            decoded, _, _ = decode_image_file(path)
+            assert decoded.mode == "L", f"{name} decoded as {decoded.mode}"
+            reduced, reduction, _ = decode_image_file(path, fit_size=(160, 120))
+            assert reduction == 4 and reduced.mode == "L", name
+
+        # In-memory grayscale palette images are flattened too
+        assert normalize_monochrome(gray.convert("P")).mode == "L"
+    print("✓ Monochrome sources decode as single-channel images")
+
+
+def test_color_images_stay_color():
+    """RGB sources are never flattened, however little color they hold"""
+    rgb = _gray_frame(2736, 1824).convert("RGB")
+    assert normalize_monochrome(rgb).mode == "RGB"
+    pixels = np.asarray(rgb).copy()
+    pixels[900:903, 1300:1303] = (255, 0, 0)  # A red 3x3 dot
+    color = Image.fromarray(pixels)
+    assert normalize_monochrome(color).mode == "RGB"
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "dot.png")
+        color.save(path)
+        for fit_size in (None, (684, 456)):
+            assert decode_image_file(path, fit_size=fit_size)[0].mode == "RGB"
+
+    palette = Image.new("P", (64, 64))
+    palette.putpalette([0, 0, 0, 255, 0, 0] + [0] * 762)
+    palette.paste(1, (0, 0, 32, 32))
+    assert normalize_monochrome(palette).mode == "P"
+    print("✓ Color images keep their color")
+
+
+def test_color_palette_reduced_decode():
+    """Color GIFs can still be decoded at reduced resolution"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "color.gif")
+        Image.new("RGB", (640, 480), (200, 30, 30)).convert("P").save(path)
+        img, reduction, _ = decode_image_file(path, fit_size=(160, 120))
+        assert reduction == 4 and img.size == (160, 120)
+    print("✓ Color palette images are reduced after palette expansion")
+
+
+def test_gray_pipeline_stays_single_channel():
+    """Cache accounting, enhancement and resampling keep one byte per pixel"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "0000000001_0001_001_20240101120000.jpg")
+        _gray_frame().save(path)
+        cache = DecodedImageCache(budget_bytes=10 * 1024 * 1024)
+        img, _ = load_display_image(cache, path)
+        assert img.mode == "L"
+        assert cache.total_bytes == 640 * 480
+
+        enhanced = ContrastEnhancer().enhance(img)
+        assert enhanced.mode == "L"
+        assert resample_image(enhanced, (320, 240)).mode == "L"
+        assert resample_image(enhanced, (1280, 960), mode=RESAMPLE_FAST).mode == "L"
+    print("✓ Grayscale stays single-channel through the pipeline")
+
+
+if __name__ == "__main__":
+    print("Testing grayscale pipeline...\n")
+    tests = [
+        test_monochrome_sources_become_l,
+        test_color_images_stay_color,
+        test_color_palette_reduced_decode,
+        test_gray_pipeline_stays_single_channel,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All grayscale pipeline tests passed!")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for 12/16-bit TIFF/PGM decoding, window/level lookup and multi-page TIFFs
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (DecodedImageCache, apply_display_window, auto_window, decode_high_bit_depth,
+                              decode_image_file, get_file_stamp, is_image_file, load_display_image, load_windowed_image,
+                              read_uint16_pixels, window_lut)
+
+
+def _frame_12bit(width=640, height=480, seed=0):
+    """12-bit camera frame stored in 16-bit samples"""
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(200, 3800, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    return np.clip(ramp + rng.normal(0, 20, (height, width)), 0, 4095).astype(np.uint16)
+
+
+def test_formats_are_listed():
+    """TIFF and PGM files are picked up by the folder scans"""
+    for name in ("a.tif", "b.TIFF", "c.pgm", "d.jpg", "e.PNG"):
+        assert is_image_file(name), name
+    assert not is_image_file("notes.txt") and not is_image_file("revision_1.csv")
+    print("✓ TIFF and PGM files are listed")
+
+
+def test_raw_files_are_memory_mapped_exactly():
+    """Uncompressed 16-bit TIFF and PGM pixels come back bit-exact as uint16"""
+    pixels = _frame_12bit()
+    with tempfile.TemporaryDirectory() as folder:
+        for name in ("frame.tif", "frame.pgm", "frame.png"):
+            path = os.path.join(folder, name)
+            Image.fromarray(pixels).save(path)
+            with Image.open(path) as img:
+                read = read_uint16_pixels(img)
+            assert read.dtype == np.uint16 and np.array_equal(read, pixels), name
+            assert not isinstance(read, np.memmap), name  # Copied out, the file is not held open
+
+            with Image.open(path) as img:
+                reduced = read_uint16_pixels(img, 4)
+            assert reduced.shape == (120, 160) and reduced.dtype == np.uint16
+            assert abs(int(reduced.mean()) - int(pixels.mean())) < 8
+    print("✓ 16-bit pixels are read exactly and area-reduced")
+
+
+def test_auto_window_uses_full_display_range():
+    """12-bit data is stretched to 8 bits instead of showing up nearly black"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "frame.tif")
+        Image.fromarray(_frame_12bit()).save(path)
+        img, reduction, source_size = decode_image_file(path, fit_size=(320, 240))
+        assert img.mode == "L" and reduction == 2 and source_size == (640, 480)
+        values = np.asarray(img)
+        assert values.min() <= 5 and values.max() >= 250
+
+        low, high = auto_window(_frame_12bit())
+        assert 100 < low < 400 and 3600 < high < 4095
+    print("✓ Auto window maps 12-bit data to the full 8-bit range")
+
+
+def test_window_change_is_a_lookup_not_a_decode():
+    """The 16-bit pixels are cached, so a new window only re-applies the LUT"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "frame.pgm")
+        Image.fromarray(_frame_12bit()).save(path)
+        cache = DecodedImageCache(budget_bytes=20 * 1024 * 1024)
+        wide, source_size = load_windowed_image(cache, path, (320, 240), window=(0, 4095))
+        assert source_size == (640, 480)
+        misses = cache.misses
+        narrow, _ = load_windowed_image(cache, path, (320, 240), window=(1500, 2500))
+        assert cache.misses == misses  # Served from the cached 16-bit pixels
+        assert np.asarray(narrow).std() > np.asarray(wide).std()
+
+        lut = window_lut(1000, 2000)
+        assert lut[999] == 0 and lut[2000] == 255 and lut[1500] in (127, 128)
+        pixels = np.array([[0, 1000, 1500, 2000, 65535]], dtype=np.uint16)
+        assert list(np.asarray(apply_display_window(pixels, (1000, 2000)))[0]) == [0, 0, lut[1500], 255, 255]
+
+        # The auto window already caches the 16-bit pixels, so the first explicit window does not decode
+        auto_path = os.path.join(folder, "auto.pgm")
+        Image.fromarray(_frame_12bit()).save(auto_path)
+        auto, _ = load_windowed_image(cache, auto_path, (320, 240))
+        assert cache.get_source_size(("uint16", auto_path), get_file_stamp(auto_path)) == (640, 480)
+        assert np.array_equal(np.asarray(auto), np.asarray(decode_image_file(auto_path, (320, 240))[0]))
+        misses = cache.misses
+        load_windowed_image(cache, auto_path, (320, 240), window=(1500, 2500))
+        assert cache.misses == misses
+
+        # 8-bit images ignore the window
+        jpeg = os.path.join(folder, "frame.jpg")
+        Image.new("L", (64, 48), 77).save(jpeg)
+        img, _ = load_windowed_image(cache, jpeg, None, window=(0, 10))
+        assert abs(int(np.asarray(img).mean()) - 77) <= 1
+    print("✓ Window changes reuse the 16-bit pixels")
+
+
+def test_multipage_tiff_decodes_one_page():
+    """Each page of a multi-page TIFF is decoded and cached on its own"""
+    pages = [_frame_12bit(seed=i) // (i + 1) for i in range(3)]
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "stack.tif")
+        Image.fromarray(pages[0]).save(path, save_all=True, append_images=[Image.fromarray(p) for p in pages[1:]])
+        for index, expected in enumerate(pages):
+            pixels, reduction, source_size = decode_high_bit_depth(path, page=index)
+            assert reduction == 1 and np.array_equal(pixels, expected), index
+
+        cache = DecodedImageCache(budget_bytes=20 * 1024 * 1024)
+        first, _ = load_display_image(cache, path)
+        third, _ = load_display_image(cache, path, page=2)
+        assert first is not third
+        assert (path, 1) in cache and ((path, 2), 1) in cache
+    print("✓ Multi-page TIFFs decode one page at a time")
+
+
+if __name__ == "__main__":
+    print("Testing high bit depth images...\n")
+    tests = [
+        test_formats_are_listed,
+        test_raw_files_are_memory_mapped_exactly,
+        test_auto_window_uses_full_display_range,
+        test_window_change_is_a_lookup_not_a_decode,
+        test_multipage_tiff_decodes_one_page,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All high bit depth tests passed!")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test script for the decoded image cache, reduced decodes and neighbour prefetcher
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from image_label_tool import (DecodedImageCache, ImagePrefetcher, get_file_stamp,
+                              choose_decode_reduction, decode_image_file, load_display_image)
+
+
+def _make_images(folder, count, size=(64, 48)):
+    """Create a few small JPEGs named like camera output"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"{1000 + i:010d}_0001_001_20240101120000.jpg")
+        Image.new("RGB", size, (i * 20 % 255, 80, 160)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_lru_eviction_respects_budget():
+    """Oldest entries are evicted once the memory budget is exceeded"""
+    img = Image.new("RGB", (10, 10))  # 300 bytes
+    cache = DecodedImageCache(budget_bytes=1000)
+
+    for key in ("a", "b", "c"):
+        cache.put(key, img)
+    assert cache.total_bytes == 900
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert cache.get("a") is img
+    cache.put("d", img)
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache and "d" in cache
+    assert cache.total_bytes <= 1000
+    print("✓ LRU eviction keeps the cache within budget")
+
+
+def test_stale_stamp_is_a_miss():
+    """A changed file stamp invalidates the cached decode"""
+    img = Image.new("L", (4, 4))
+    cache = DecodedImageCache(budget_bytes=1024)
+    cache.put("x.jpg", img, stamp=(1, 100))
+
+    assert cache.get("x.jpg", stamp=(1, 100)) is img
+    assert cache.get("x.jpg", stamp=(2, 100)) is None
+    assert "x.jpg" not in cache
+    print("✓ Stale entries are dropped when the file changes")
+
+
+def test_oversized_image_not_cached():
+    """Images larger than the whole budget are never stored"""
+    cache = DecodedImageCache(budget_bytes=10)
+    cache.put("big", Image.new("RGB", (10, 10)))
+    assert len(cache) == 0
+    print("✓ Oversized images are skipped")
+
+
+def test_prefetcher_decodes_scheduled_paths():
+    """The background worker fills the cache with the scheduled images"""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _make_images(folder, 4)
+        cache = DecodedImageCache(budget_bytes=10 * 1024 * 1024)
+        prefetcher = ImagePrefetcher(cache)
+        try:
+            prefetcher.schedule(paths[1:3])
+            assert prefetcher.wait_idle(timeout=5.0)
+            for path in paths[1:3]:
+                assert cache.get((path, 1), get_file_stamp(path)) is not None
+            assert cache.get((paths[0], 1)) is None
+
+            # Rescheduling replaces the pending list instead of appending to it
+            prefetcher.schedule([paths[3]])
+            assert prefetcher.wait_idle(timeout=5.0)
+            assert (paths[3], 1) in cache
+        finally:
+            prefetcher.stop()
+    print("✓ Prefetcher decodes neighbours into the cache")
+
+
+def test_prefetched_entry_invalidated_after_rewrite():
+    """Rewriting a file after it was prefetched forces a fresh decode"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_images(folder, 1)[0]
+        cache = DecodedImageCache(budget_bytes=10 * 1024 * 1024)
+        prefetcher = ImagePrefetcher(cache)
+        try:
+            prefetcher.schedule([path])
+            assert prefetcher.wait_idle(timeout=5.0)
+            old_stamp = get_file_stamp(path)
+
+            time.sleep(0.01)
+            Image.new("RGB", (32, 32)).save(path)
+            os.utime(path, ns=(old_stamp[0] + 10**9, old_stamp[0] + 10**9))
+
+            assert cache.get((path, 1), get_file_stamp(path)) is None
+            assert cache.get_source_size(path, get_file_stamp(path)) is None
+        finally:
+            prefetcher.stop()
+    print("✓ Rewritten files are decoded again")
+
+
+def test_choose_decode_reduction():
+    """The reduction never shrinks the image below the fitted display size"""
+    assert choose_decode_reduction((4000, 3000), None) == 1
+    assert choose_decode_reduction((4000, 3000), (1000, 1000)) == 4
+    assert choose_decode_reduction((4000, 3000), (400, 300)) == 8
+    assert choose_decode_reduction((4000, 3000), (2100, 1600)) == 1
+    assert choose_decode_reduction((800, 600), (1200, 900)) == 1
+    print("✓ Decode reduction covers the canvas")
+
+
+def test_reduced_jpeg_decode():
+    """Fit-mode decodes of JPEGs come back at the DCT-scaled size and are cached separately"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_images(folder, 1, size=(1600, 1200))[0]
+
+        img, reduction, source_size = decode_image_file(path, fit_size=(400, 400))
+        assert source_size == (1600, 1200)
+        assert reduction == 4
+        assert img.size == (400, 300)
+
+        cache = DecodedImageCache(budget_bytes=50 * 1024 * 1024)
+        fitted, size = load_display_image(cache, path, fit_size=(400, 400))
+        full, _ = load_display_image(cache, path)
+        assert size == (1600, 1200)
+        assert fitted.size == (400, 300) and full.size == (1600, 1200)
+        assert (path, 4) in cache and (path, 1) in cache
+
+        # Second lookup is a cache hit returning the same object
+        again, _ = load_display_image(cache, path, fit_size=(400, 400))
+        assert again is fitted
+    print("✓ Reduced JPEG decode is used for fitted display")
+
+
+def test_reduced_png_decode():
+    """Non-JPEG formats fall back to a full decode followed by a box reduction"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "0000000001_0001_001_20240101120000.png")
+        Image.new("RGB", (1600, 1200), (10, 20, 30)).save(path)
+        img, reduction, _ = decode_image_file(path, fit_size=(400, 400))
+        assert reduction == 4 and img.size == (400, 300)
+    print("✓ PNG falls back to full decode + reduce")
+
+
+if __name__ == "__main__":
+    print("Testing decoded image cache and prefetcher...\n")
+    tests = [
+        test_lru_eviction_respects_budget,
+        test_stale_stamp_is_a_miss,
+        test_oversized_image_not_cached,
+        test_prefetcher_decodes_scheduled_paths,
+        test_prefetched_entry_invalidated_after_rewrite,
+        test_choose_decode_reduction,
+        test_reduced_jpeg_decode,
+        test_reduced_png_decode,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All image cache tests passed!")
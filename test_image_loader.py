@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the non-blocking image loader (request IDs, stale result dropping)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+from PIL import Image
+
+from image_label_tool import (ContrastEnhancer, DecodedImageCache, ImageLabelTool, ImageLoader, get_file_stamp,
+                              load_display_image)
+
+
+def test_latest_request_is_delivered():
+    """Results of superseded requests are dropped; the newest one arrives"""
+    loader = ImageLoader(workers=2)
+    release = threading.Event()
+    done = threading.Event()
+    delivered = []
+
+    def slow_load():
+        release.wait(5)  # A read stuck on a slow share
+        return "old"
+
+    def callback(request_id, result, error):
+        delivered.append((request_id, result, error))
+        done.set()
+
+    try:
+        stale_id = loader.request(slow_load, callback)
+        current_id = loader.request(lambda: "new", callback)
+        assert done.wait(5)
+        assert not loader.is_current(stale_id)
+        release.set()
+        loader._executor.shutdown(wait=True)
+        assert delivered == [(current_id, "new", None)]
+        assert loader.dropped == 1
+    finally:
+        loader.stop()
+    print("✓ Only the newest request is delivered, even when an older one is stuck")
+
+
+def test_errors_are_reported_and_cancel_drops_all():
+    """A failing load reports its error; cancel() makes pending requests stale"""
+    loader = ImageLoader(workers=1)
+    delivered = []
+    done = threading.Event()
+
+    def fail():
+        raise OSError("share unreachable")
+
+    try:
+        loader.request(fail, lambda request_id, result, error: (delivered.append(error), done.set()))
+        assert done.wait(5)
+        assert isinstance(delivered[0], OSError)
+
+        block = threading.Event()
+        loader.request(lambda: block.wait(5), lambda *args: delivered.append(args))
+        loader.request(lambda: "queued", lambda *args: delivered.append(args))
+        loader.cancel()
+        block.set()
+        loader._executor.shutdown(wait=True)
+        assert len(delivered) == 1
+    finally:
+        loader.stop()
+    print("✓ Errors are delivered and cancel() drops outstanding loads")
+
+
+class _ReadyOnly:
+    """Just the readiness check of ImageLabelTool"""
+
+    is_view_image_ready = ImageLabelTool.is_view_image_ready
+    get_view_variant = ImageLabelTool.get_view_variant
+    _enhanced_key = ImageLabelTool._enhanced_key
+    _cached_source_size = ImageLabelTool._cached_source_size
+
+    def __init__(self):
+        self._view_source = None
+        self.display_window = None
+        self._image_page = None
+        self.image_cache = DecodedImageCache(budget_bytes=50 * 1024 * 1024)
+        self.contrast_enhancer = ContrastEnhancer()
+
+
+def test_ready_only_when_pixels_are_in_memory():
+    """The display renders synchronously only when nothing has to be read from the file"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "0000000001_0001_001_20240101120000.jpg")
+        Image.new("RGB", (1600, 1200), (40, 80, 120)).save(path)
+        stamp = get_file_stamp(path)
+        view = _ReadyOnly()
+        assert not view.is_view_image_ready(path, stamp, (800, 600))
+
+        img, _ = load_display_image(view.image_cache, path, (800, 600))
+        assert view.is_view_image_ready(path, stamp, (800, 600))
+        assert not view.is_view_image_ready(path, stamp, None)  # 1:1 needs the full decode
+        assert not view.is_view_image_ready(path, stamp, (800, 600), histogram_eq=True)
+        view.contrast_enhancer.enhance(img, cache_key=(path, img.size), stamp=stamp)
+        assert view.is_view_image_ready(path, stamp, (800, 600), histogram_eq=True)
+    print("✓ Only in-memory images are rendered synchronously")
+
+
+if __name__ == "__main__":
+    print("Testing image loader...\n")
+    tests = [
+        test_latest_request_is_delivered,
+        test_errors_are_reported_and_cancel_drops_all,
+        test_ready_only_when_pixels_are_in_memory,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All image loader tests passed!")
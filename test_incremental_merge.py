@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script for merging newly arrived images into the sorted lists without moving the current image
+"""
+
+import sys
+
+from image_label_tool import FilenameCatalog, ImageLabelTool, insert_sorted
+
+
+class _ViewOnly:
+    """The folder list, filter and position of the tool, without any Tk widgets"""
+
+    get_filename_info = ImageLabelTool.get_filename_info
+    get_image_sort_key = ImageLabelTool.get_image_sort_key
+    get_filter_predicate = ImageLabelTool.get_filter_predicate
+    merge_new_images = ImageLabelTool.merge_new_images
+    drop_missing_images = ImageLabelTool.drop_missing_images
+
+    def __init__(self, paths, filter_value="All images"):
+        self.filename_catalog = FilenameCatalog(paths)
+        self.all_image_paths = sorted(paths, key=self.get_image_sort_key)
+        self.filter_var = _Var(filter_value)
+        self.labels = {}
+        self.ocr_readable = {}
+        self.false_noread = {}
+        self.previously_seen_files = set(paths)
+        predicate = self.get_filter_predicate()
+        self.image_paths = [p for p in self.all_image_paths if predicate is None or predicate(p)]
+        self.current_index = 0
+        self.shown = 0
+
+    def show_image(self):
+        self.shown += 1
+
+    def update_counts(self):
+        pass
+
+    update_session_stats = update_total_stats = update_progress_display = update_navigation_buttons = update_counts
+
+
+class _Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _name(trigger, sub=1):
+    return f"/f/{trigger:010d}_{sub:04d}_001_120000.jpg"
+
+
+def test_insert_sorted_by_bisection_and_merge():
+    """Few arrivals are bisected into place, many are merged; equal keys go after existing items"""
+    items = [1, 3, 5, 7, 9]
+    insert_sorted(items, [8, 2], key=lambda x: x)
+    assert items == [1, 2, 3, 5, 7, 8, 9]
+
+    big = list(range(0, 200, 2))
+    insert_sorted(big, [1], key=lambda x: x)
+    assert big[:3] == [0, 1, 2] and len(big) == 101
+
+    pairs = [(1, "old"), (2, "old")]
+    insert_sorted(pairs, [(1, "new")] * 5, key=lambda p: p[0])
+    assert pairs[0] == (1, "old") and pairs[-1] == (2, "old")
+    print("✓ insert_sorted keeps the key order")
+
+
+def test_current_image_stays_put():
+    """Arrivals before and after the viewed image keep it on screen, without a re-render"""
+    view = _ViewOnly([_name(i) for i in range(0, 100, 10)])
+    view.current_index = 5
+    current = view.image_paths[5]
+    view.merge_new_images([_name(5), _name(15), _name(95), _name(50, 2)])
+    assert view.image_paths[view.current_index] == current and view.current_index == 7
+    assert view.all_image_paths == sorted(view.all_image_paths, key=view.get_image_sort_key)
+    assert view.all_image_paths.index(_name(50, 2)) == view.current_index + 1
+    assert view.shown == 0
+    print("✓ The current image keeps its place while images arrive")
+
+
+def test_filtered_view_is_updated_incrementally():
+    """Only arrivals passing the filter enter the view, in sorted position"""
+    paths = [_name(i) for i in range(10)]
+    view = _ViewOnly(paths, "no label only")
+    view.labels = {p: "no label" for p in paths[::2]}
+    view.image_paths = [p for p in view.all_image_paths if view.labels.get(p) == "no label"]
+    view.current_index = 2
+    current = view.image_paths[2]
+    arrived = [_name(3, 2), _name(1, 5), _name(20)]
+    view.labels[_name(3, 2)] = "no label"
+    view.labels[_name(20)] = "no label"
+    view.merge_new_images(arrived)
+    assert view.image_paths == [paths[0], paths[2], _name(3, 2), paths[4], paths[6], paths[8], _name(20)]
+    assert view.image_paths[view.current_index] == current
+    assert len(view.all_image_paths) == 13
+    print("✓ The filtered view takes matching arrivals only")
+
+
+def test_removed_images_leave_the_lists():
+    """Deleted files are dropped while the viewed image stays current"""
+    paths = [_name(i) for i in range(6)]
+    view = _ViewOnly(paths)
+    view.current_index = 4
+    view.drop_missing_images(set(paths) - {paths[1], paths[5]})
+    assert view.image_paths == [paths[0], paths[2], paths[3], paths[4]]
+    assert view.image_paths[view.current_index] == paths[4] and view.shown == 0
+    print("✓ Removed images leave the lists")
+
+
+if __name__ == "__main__":
+    print("Testing incremental merge...\n")
+    tests = [
+        test_insert_sorted_by_bisection_and_merge,
+        test_current_image_stays_put,
+        test_filtered_view_is_updated_incrementally,
+        test_removed_images_leave_the_lists,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All incremental merge tests passed!")
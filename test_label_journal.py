@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test script for the label journal (appended edits, batched fsync, compaction into the revision CSV, replay)
+"""
+
+import os
+import sys
+import tempfile
+
+from image_label_tool import (LABEL_JOURNAL_COMPACT_EDITS, LABEL_JOURNAL_COMPACT_MS, LABEL_JOURNAL_NAME,
+                              FilenameCatalog, ImageLabelTool, LabelJournal, read_revision_csv,
+                              replay_label_journal)
+
+
+class _Root:
+    """Keeps root.after jobs so the test decides when they run"""
+
+    def __init__(self):
+        self.jobs = {}
+        self._next = 0
+
+    def after(self, delay, callback, *args):
+        self._next += 1
+        self.jobs[self._next] = (delay, callback, args)
+        return self._next
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run(self):
+        jobs, self.jobs = self.jobs, {}
+        for _, callback, args in jobs.values():
+            callback(*args)
+
+
+class _Labeling:
+    """The label saving of the tool for one folder, without any Tk widgets"""
+
+    save_csv = ImageLabelTool.save_csv
+    save_label_edit = ImageLabelTool.save_label_edit
+    get_label_journal = ImageLabelTool.get_label_journal
+    _open_label_journal = ImageLabelTool._open_label_journal
+    schedule_label_compaction = ImageLabelTool.schedule_label_compaction
+    compact_label_journal = ImageLabelTool.compact_label_journal
+    close_label_journals = ImageLabelTool.close_label_journals
+    _revision_csv_rows = ImageLabelTool._revision_csv_rows
+    _write_revision_csv = ImageLabelTool._write_revision_csv
+    get_output_folder = ImageLabelTool.get_output_folder
+    get_session_number = ImageLabelTool.get_session_number
+    get_filename_info = ImageLabelTool.get_filename_info
+
+    def __init__(self, folder):
+        self.root = _Root()
+        self.folder_path = folder
+        self.workspace = None
+        self.csv_filename = os.path.join(folder, "revision_20240101_120000.csv")
+        self.filename_catalog = FilenameCatalog()
+        self.labels, self.ocr_readable, self.false_noread, self.comments = {}, {}, {}, {}
+        self.label_journals = {}
+        self._journal_compact_job = None
+        self._folder_loading = False
+        self.stats_saves = 0
+
+    def calculate_session_labels(self):
+        return {}
+
+    def calculate_session_ocr_readable_status(self):
+        return {}
+
+    def save_stats_csv(self):
+        self.stats_saves += 1
+
+
+def test_replay_keeps_last_state_per_image():
+    """Replaying applies the last line per image and skips a torn final line"""
+    with tempfile.TemporaryDirectory() as folder:
+        journal_path = os.path.join(folder, LABEL_JOURNAL_NAME)
+        journal = LabelJournal(journal_path, folder)
+        a, b = os.path.join(folder, "a.jpg"), os.path.join(folder, "b.jpg")
+        journal.append(a, "no label", False, False, "")
+        journal.append(b, "read failure", False, True, "smudged")
+        journal.append(a, "incomplete", True, False, "")
+        journal.append(b, None, False, False, "")
+        journal.close()
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"path": "c.jpg", "lab')  # Crash in the middle of an append
+
+        labels = {b: "no label"}
+        ocr_readable, false_noread, comments = {}, {}, {b: "old"}
+        assert replay_label_journal(journal_path, folder, labels, ocr_readable, false_noread, comments) == 4
+        assert labels == {a: "incomplete"} and ocr_readable[a] and not false_noread[b] and comments == {}
+        assert replay_label_journal(os.path.join(folder, "missing.jsonl"), folder, {}, {}, {}, {}) == 0
+    print("✓ Replay restores the last state of every image")
+
+
+def test_appends_are_synced_in_batches():
+    """Appends reach the file at once; one fsync covers the edits of a sync interval"""
+    with tempfile.TemporaryDirectory() as folder:
+        journal_path = os.path.join(folder, LABEL_JOURNAL_NAME)
+        journal = LabelJournal(journal_path, folder, sync_interval=0.05)
+        for i in range(3):
+            journal.append(os.path.join(folder, f"{i}.jpg"), "no label", False, False, "")
+        timer = journal._sync_timer
+        assert timer is not None and journal.edits == 3
+        with open(journal_path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+        timer.join(1.0)
+        assert journal._sync_timer is None
+
+        journal.reset()
+        assert journal.edits == 0 and os.path.getsize(journal_path) == 0
+        journal.append(os.path.join(folder, "4.jpg"), "no label", False, False, "")
+        journal.close()
+        with open(journal_path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 1
+    print("✓ Journal appends are fsync'ed in batches and emptied on reset")
+
+
+def test_edits_are_compacted_into_the_revision_csv():
+    """Single edits only append; the delayed compaction writes the CSVs and empties the journal"""
+    with tempfile.TemporaryDirectory() as folder:
+        view = _Labeling(folder)
+        paths = [os.path.join(folder, f"000000000{i}_0001_001_120000.jpg") for i in range(3)]
+        for path in paths:
+            view.labels[path] = "no label"
+            view.save_label_edit(path)
+        view.comments[paths[1]] = "check"
+        view.save_label_edit(paths[1])
+        assert not os.path.exists(view.csv_filename) and view.stats_saves == 0
+        assert [delay for delay, _, _ in view.root.jobs.values()] == [LABEL_JOURNAL_COMPACT_MS]
+
+        view.root.run()
+        labels, _, _, comments = read_revision_csv(view.csv_filename, folder)
+        assert labels == view.labels and comments[paths[1]] == "check" and view.stats_saves == 1
+        assert os.path.getsize(os.path.join(folder, LABEL_JOURNAL_NAME)) == 0
+
+        # Enough edits compact right away
+        for i in range(LABEL_JOURNAL_COMPACT_EDITS):
+            view.labels[paths[0]] = "incomplete" if i % 2 else "unreadable"
+            view.save_label_edit(paths[0])
+        assert [delay for delay, _, _ in view.root.jobs.values()] == [0]
+        view.close_label_journals()
+        assert view.root.jobs == {} and view.stats_saves == 2
+        assert read_revision_csv(view.csv_filename, folder)[0][paths[0]] == "incomplete"
+    print("✓ Journaled edits are compacted into the revision CSV")
+
+
+def test_uncompacted_edits_survive_a_restart():
+    """Edits journaled after the last compaction are replayed on top of the revision CSV"""
+    with tempfile.TemporaryDirectory() as folder:
+        view = _Labeling(folder)
+        path = os.path.join(folder, "0000000001_0001_001_120000.jpg")
+        view.labels[path] = "no label"
+        view.save_csv()
+        view.labels[path] = "read failure"
+        view.false_noread[path] = True
+        view.save_label_edit(path)
+        view.label_journals[folder].close()  # The app dies before the compaction is due
+
+        loaded = read_revision_csv(view.csv_filename, folder)
+        assert loaded[0][path] == "no label"
+        assert replay_label_journal(os.path.join(folder, LABEL_JOURNAL_NAME), folder, *loaded) == 1
+        assert loaded[0][path] == "read failure" and loaded[2][path]
+    print("✓ Uncompacted edits are restored from the journal")
+
+
+if __name__ == "__main__":
+    print("Testing label journal...\n")
+    tests = [
+        test_replay_keeps_last_state_per_image,
+        test_appends_are_synced_in_batches,
+        test_edits_are_compacted_into_the_revision_csv,
+        test_uncompacted_edits_survive_a_restart,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All label journal tests passed!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the zoomed-view minimap (mmap'd overview cache, viewport rectangle, click-to-jump mapping)
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (MINIMAP_SIZE, ImagePyramid, MinimapCache, make_minimap, minimap_point_to_source,
+                              minimap_viewport_rect)
+
+
+def _parcel_image(width=4000, height=3000):
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    return Image.fromarray(x.astype(np.uint8))
+
+
+def test_minimap_fits_box():
+    """The minimap keeps the aspect ratio inside MINIMAP_SIZE"""
+    pixels = make_minimap(_parcel_image())
+    assert pixels.shape == (150, 200) and pixels.dtype == np.uint8
+    assert pixels[:, 0].mean() < 10 and pixels[:, -1].mean() > 245
+    print("✓ Minimap fits the overview box")
+
+
+def test_minimap_is_built_once_and_memory_mapped():
+    """Minimaps come from the pyramid once, then from the mmap'd cache file"""
+    pyramid = ImagePyramid(_parcel_image())
+    zoom = min(MINIMAP_SIZE[0] / pyramid.size[0], MINIMAP_SIZE[1] / pyramid.size[1])
+    calls = []
+
+    def source():
+        calls.append(1)
+        return pyramid.level_for_zoom(zoom)[0]
+
+    with tempfile.TemporaryDirectory() as folder:
+        cache = MinimapCache(os.path.join(folder, "minimaps"))
+        first = cache.get_or_build("/images/a.jpg", (1, 2), source)
+        again = cache.get_or_build("/images/a.jpg", (1, 2), source)
+        assert len(calls) == 1 and cache.builds == 1
+        assert np.array_equal(first, again)
+
+        # A new session (empty memory) maps the stored file instead of rebuilding
+        reopened = MinimapCache(os.path.join(folder, "minimaps"))
+        mapped = reopened.get_or_build("/images/a.jpg", (1, 2), source)
+        assert isinstance(mapped, np.memmap) and len(calls) == 1
+        assert np.array_equal(mapped, first)
+
+        # A changed file or another view variant is a different minimap
+        assert reopened.get("/images/a.jpg", (3, 2)) is None
+        assert reopened.get("/images/a.jpg", (1, 2), variant=(True, (0, None))) is None
+
+    memory_only = MinimapCache()
+    memory_only.get_or_build("/images/a.jpg", (1, 2), source)
+    assert memory_only.get("/images/a.jpg", (1, 2)) is not None
+    print("✓ Minimaps are built once and memory-mapped back")
+
+
+def test_viewport_rect_and_jump_mapping():
+    """The viewport rectangle and click-to-jump agree with the zoomed geometry"""
+    # 4000x3000 source at zoom 0.5 -> 2000x1500 display; minimap 200x150
+    rect = minimap_viewport_rect((500, 300, 1300, 900), (2000, 1500), (200, 150))
+    assert rect == (50, 30, 130, 90)
+
+    # Viewport partly outside the image (padding) is clipped to the minimap
+    rect = minimap_viewport_rect((-400, -200, 400, 400), (2000, 1500), (200, 150))
+    assert rect == (0, 0, 40, 40)
+
+    assert minimap_point_to_source(100, 75, (200, 150), (4000, 3000)) == (2000, 1500)
+    assert minimap_point_to_source(-5, 500, (200, 150), (4000, 3000)) == (0, 3000)
+    print("✓ Viewport rectangle and click-to-jump mapping are consistent")
+
+
+if __name__ == "__main__":
+    print("Testing minimap...\n")
+    tests = [
+        test_minimap_fits_box,
+        test_minimap_is_built_once_and_memory_mapped,
+        test_viewport_rect_and_jump_mapping,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All minimap tests passed!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for frame-skipping navigation while the O/P keys auto-repeat
+"""
+
+import sys
+
+from image_label_tool import ImageLabelTool, RenderScheduler, NAVIGATION_PREVIEW_MS, NAVIGATION_REPEAT_MS
+from test_render_scheduler import FakeTimers
+
+
+class _NavigationOnly:
+    """Just the navigation part of ImageLabelTool, with the rendering replaced by recorders"""
+
+    prev_image = ImageLabelTool.prev_image
+    next_image = ImageLabelTool.next_image
+    navigate_to = ImageLabelTool.navigate_to
+    finish_navigation = ImageLabelTool.finish_navigation
+
+    def __init__(self, count):
+        self.image_paths = [f"/images/{i:010d}_0001_001_20240101120000.jpg" for i in range(count)]
+        self.current_index = 0
+        self.timers = FakeTimers()
+        self.navigation_scheduler = RenderScheduler(self.timers.after, self.timers.after_cancel,
+                                                    self.render_navigation_preview, self.finish_navigation,
+                                                    frame_ms=NAVIGATION_PREVIEW_MS, settle_ms=NAVIGATION_REPEAT_MS)
+        self._last_navigation_time = 0.0
+        self.rendered = []  # current_index of every full render
+        self.previews = []
+        self.fields = []
+
+    def show_image(self):
+        self.rendered.append(self.current_index)
+
+    def render_navigation_preview(self):
+        self.previews.append(self.current_index)
+
+    def update_image_fields(self, path, source_size=None):
+        self.fields.append(path)
+
+    def reset_to_fit_mode(self):
+        pass
+
+    def blink_status_text(self):
+        pass
+
+    def key_released(self):
+        """Let the settle timer fire and forget the burst, like a pause before the next key press"""
+        self.timers.advance(1000)
+        self._last_navigation_time = 0.0
+
+
+def test_single_steps_render_immediately():
+    """Separate key presses render each image right away, like before"""
+    nav = _NavigationOnly(10)
+    for expected in (1, 2, 3):
+        nav.next_image()
+        assert nav.rendered[-1] == expected
+        nav.key_released()
+    nav.prev_image()
+    assert nav.rendered == [1, 2, 3, 2]
+    assert nav.previews == []
+    print("✓ Single steps render immediately")
+
+
+def test_held_key_renders_only_the_final_image():
+    """Holding P for ten seconds at 30 Hz in a 10k folder renders the start and the end only"""
+    nav = _NavigationOnly(10000)
+    for _ in range(300):
+        nav.next_image()
+        nav.timers.advance(33)
+    assert nav.current_index == 300
+    assert nav.rendered == [1]  # Only the first press so far
+
+    nav.timers.advance(NAVIGATION_REPEAT_MS)
+    assert nav.rendered == [1, 300]
+    # Every step gave immediate feedback; intermediate frames were at most one per repeat
+    assert len(nav.fields) == 299
+    assert nav.fields[-1] == nav.image_paths[300]
+    assert 0 < len(nav.previews) <= 299
+    print("✓ Held key renders only where it stops")
+
+
+def test_burst_stops_at_list_ends():
+    """Auto-repeat past the first or last image stays on it and renders it once"""
+    nav = _NavigationOnly(5)
+    for _ in range(20):
+        nav.next_image()
+        nav.timers.advance(33)
+    nav.timers.advance(1000)
+    assert nav.current_index == 4
+    assert nav.rendered == [1, 4]
+
+    nav._last_navigation_time = 0.0
+    for _ in range(20):
+        nav.prev_image()
+        nav.timers.advance(33)
+    nav.timers.advance(1000)
+    assert nav.current_index == 0
+    assert nav.rendered == [1, 4, 3, 0]
+    print("✓ Bursts stop at the ends of the list")
+
+
+if __name__ == "__main__":
+    print("Testing navigation under key repeat...\n")
+    tests = [
+        test_single_steps_render_immediately,
+        test_held_key_renders_only_the_final_image,
+        test_burst_stops_at_list_ends,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All navigation repeat tests passed!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the reusable Tk photo buffers (PhotoSlot and the tile PhotoPool)
+"""
+
+import sys
+
+from PIL import Image
+
+from image_label_tool import PhotoPool, PhotoSlot
+
+
+class _FakePhoto:
+    """Stands in for ImageTk.PhotoImage so the buffers can be tested without a display"""
+
+    def __init__(self, img):
+        self.size = img.size
+        self.mode = img.mode
+        self.pastes = 0
+
+    def paste(self, img):
+        assert img.size == self.size, "paste needs an image of the photo's size"
+        self.pastes += 1
+
+    def width(self):
+        return self.size[0]
+
+    def height(self):
+        return self.size[1]
+
+
+def test_slot_pastes_same_sized_frames():
+    """Stepping through same-sized frames reuses one photo"""
+    slot = PhotoSlot(photo_factory=_FakePhoto)
+    first = slot.show(Image.new("RGB", (1440, 1080)))
+    for _ in range(10):
+        assert slot.show(Image.new("RGB", (1440, 1080), (30, 60, 90))) is first
+    assert slot.allocations == 1
+    assert first.pastes == 10
+    print("✓ Same-sized frames are pasted into the existing photo")
+
+
+def test_slot_reallocates_on_size_or_mode_change():
+    """A different frame size or a grayscale frame gets a fresh photo"""
+    slot = PhotoSlot(photo_factory=_FakePhoto)
+    rgb = slot.show(Image.new("RGB", (1440, 1080)))
+    portrait = slot.show(Image.new("RGB", (810, 1080)))
+    assert portrait is not rgb
+    gray = slot.show(Image.new("L", (810, 1080)))
+    assert gray is not portrait and gray.mode == "L"
+    assert slot.allocations == 3
+
+    slot.release()
+    assert slot.photo is None
+    slot.show(Image.new("L", (810, 1080)))
+    assert slot.allocations == 4
+    print("✓ Size and mode changes allocate a new photo")
+
+
+def test_pool_recycles_released_tiles():
+    """Released tile photos are reused for new tiles of the same size and mode"""
+    pool = PhotoPool(photo_factory=_FakePhoto, limit=4)
+    tile = Image.new("RGB", (256, 256))
+    photos = [pool.acquire(tile) for _ in range(6)]
+    assert pool.allocations == 6
+    for photo in photos:
+        pool.release(photo)  # Only `limit` spares are kept
+
+    again = [pool.acquire(tile) for _ in range(6)]
+    assert pool.allocations == 8
+    assert sum(photo.pastes for photo in again) == 4
+
+    # Edge tiles have their own size and never receive a mismatched paste
+    edge = pool.acquire(Image.new("RGB", (100, 256)))
+    assert edge.size == (100, 256)
+    pool.release(again[0])
+    pool.release(again[0])  # Releasing twice is harmless
+    assert pool.acquire(Image.new("L", (256, 256))).mode == "L"
+    print("✓ Tile photos are recycled by size and mode")
+
+
+if __name__ == "__main__":
+    print("Testing photo buffers...\n")
+    tests = [
+        test_slot_pastes_same_sized_frames,
+        test_slot_reallocates_on_size_or_mode_change,
+        test_pool_recycles_released_tiles,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All photo buffer tests passed!")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test script for the staged folder open (first image at once, index/labels/sessions from a background worker)
+"""
+
+import csv
+import os
+import sys
+import tempfile
+
+from image_label_tool import FilenameCatalog, ImageLabelTool, first_image_in_folder
+
+
+class _Root:
+    """Collects root.after(0, ...) calls instead of running a Tk event loop"""
+
+    def __init__(self):
+        self.calls = []
+
+    def after(self, delay, callback, *args):
+        self.calls.append((callback, args))
+
+    def after_idle(self, callback):
+        pass
+
+
+class _Progress:
+    def __init__(self):
+        self.managed = ""
+
+    def winfo_manager(self):
+        return self.managed
+
+    def pack(self, **kwargs):
+        self.managed = "pack"
+
+    def pack_forget(self):
+        self.managed = ""
+
+    def start(self, interval):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _Var:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class _Opening:
+    """The staged-open handlers of the tool, without any Tk widgets"""
+
+    load_folder_in_background = ImageLabelTool.load_folder_in_background
+    _on_folder_first_image = ImageLabelTool._on_folder_first_image
+    _on_folder_indexed = ImageLabelTool._on_folder_indexed
+    _on_folder_labels = ImageLabelTool._on_folder_labels
+    show_folder_progress = ImageLabelTool.show_folder_progress
+    hide_folder_progress = ImageLabelTool.hide_folder_progress
+    refresh_filter_view = ImageLabelTool.refresh_filter_view
+    get_filter_predicate = ImageLabelTool.get_filter_predicate
+    get_filename_info = ImageLabelTool.get_filename_info
+    save_label_edit = ImageLabelTool.save_label_edit
+    check_for_new_files = ImageLabelTool.check_for_new_files
+
+    def __init__(self):
+        self.root = _Root()
+        self.folder_progress = _Progress()
+        self.folder_path_var = _Var()
+        self.folder_path_text = "Current folder: test"
+        self.filter_var = _Var("All images")
+        self.filename_catalog = FilenameCatalog()
+        self.all_image_paths = []
+        self.image_paths = []
+        self.current_index = 0
+        self.labels, self.ocr_readable, self.false_noread, self.comments = {}, {}, {}, {}
+        self._folder_load_token = 1
+        self._folder_loading = True
+        self._edited_while_loading = set()
+        self.folder_path = "test"
+        self.csv_filename = None  # Edits are only recorded, not journaled
+        self.shown = []
+        self.saves = 0
+
+    def show_image(self):
+        self.shown.append(self.image_paths[self.current_index] if self.image_paths else None)
+
+    def save_csv(self):
+        assert not self._folder_loading
+        self.saves += 1
+
+    def noop(self, *args):
+        pass
+
+    auto_detect_total_groups = start_thumbnail_indexer = fingerprint_images = noop
+    update_counts = update_session_stats = noop
+    update_total_stats = update_progress_display = update_navigation_buttons = update_warning_message = noop
+    update_jump_button_state = noop
+
+
+def _make_folder(folder, count=20):
+    for i in reversed(range(count)):
+        with open(os.path.join(folder, f"{i:010d}_{i % 3:04d}_001_120000.jpg"), "wb") as f:
+            f.write(b"x")
+    csv_path = os.path.join(folder, "revision_20240101_120000.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["image_path", "image_label"])
+        writer.writerow(["0000000001_0001_001_120000.jpg", "no label"])
+        writer.writerow(["0000000002_0002_001_120000.jpg", "read failure"])
+    return csv_path
+
+
+def test_first_image_from_names_only():
+    """The first image by trigger ID / sub-image is found from one listing"""
+    with tempfile.TemporaryDirectory() as folder:
+        assert first_image_in_folder(folder) is None
+        _make_folder(folder)
+        assert first_image_in_folder(folder) == os.path.join(folder, "0000000000_0000_001_120000.jpg")
+    print("✓ First image is picked from a names-only listing")
+
+
+def test_worker_delivers_stages_in_order():
+    """Worker results reach Tk as first image, sorted index with sessions, then labels"""
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = _make_folder(folder)
+        view = _Opening()
+        view.load_folder_in_background(1, folder, None, csv_path)
+        stages = [callback.__name__ for callback, _ in view.root.calls]
+        assert stages == ["_on_folder_first_image", "_on_folder_first_image", "_on_folder_indexed",
+                          "_on_folder_labels"], stages
+        _, _, catalog, paths, sessions = view.root.calls[2][1]
+        assert [catalog.get(p).trigger_id for p in paths] == list(range(20))
+        assert sum(len(members) for members in sessions.values()) == 20
+        labels = view.root.calls[3][1][1][0]
+        assert labels[os.path.join(folder, "0000000002_0002_001_120000.jpg")] == "read failure"
+    print("✓ Background worker streams the folder in stages")
+
+
+def test_stages_keep_the_view_and_early_labels():
+    """The first image stays current; labels set while loading win and are saved once"""
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = _make_folder(folder)
+        view = _Opening()
+        view.show_folder_progress("indexing...")
+        view.load_folder_in_background(1, folder, None, csv_path)
+        calls = view.root.calls
+        calls[0][0](*calls[0][1])  # First image
+        first = view.image_paths[0]
+        view.labels[first] = "incomplete"  # Labeled before the CSV arrived
+        view.save_label_edit(first)
+        for callback, args in calls[1:]:
+            callback(*args)
+        assert view.shown == [first] and view.image_paths[view.current_index] == first
+        assert len(view.image_paths) == 20 and view.labels[first] == "incomplete"
+        assert view.labels[os.path.join(folder, "0000000001_0001_001_120000.jpg")] == "no label"
+        assert view.saves == 1 and not view._folder_loading
+        assert view.folder_progress.managed == "" and view.folder_path_var.get() == "Current folder: test"
+    print("✓ Staged open keeps the first image and early labels")
+
+
+def test_only_user_edits_override_stored_labels():
+    """Bulk marks made while loading never replace stored labels, and no image counts as new meanwhile"""
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = _make_folder(folder)
+        view = _Opening()
+        view.folder_path = folder
+        assert view.check_for_new_files() == []
+        view.load_folder_in_background(1, folder, None, csv_path)
+        stored = os.path.join(folder, "0000000001_0001_001_120000.jpg")
+        edited = os.path.join(folder, "0000000002_0002_001_120000.jpg")
+        fresh = os.path.join(folder, "0000000003_0000_001_120000.jpg")
+        for path in (stored, edited, fresh):
+            view.labels[path] = "(Unclassified)"  # Monitoring / auto detection marks
+        view.labels[edited] = "incomplete"
+        view.save_label_edit(edited)
+        for callback, args in view.root.calls:
+            callback(*args)
+        assert view.labels[stored] == "no label" and view.labels[edited] == "incomplete"
+        assert view.labels[fresh] == "(Unclassified)" and view._edited_while_loading == set()
+    print("✓ Only explicit edits made while loading override stored labels")
+
+
+def test_stale_loads_are_ignored():
+    """Results of a folder that was replaced meanwhile are dropped"""
+    with tempfile.TemporaryDirectory() as folder:
+        _make_folder(folder)
+        view = _Opening()
+        view.load_folder_in_background(1, folder, None, None)
+        view._folder_load_token = 2
+        for callback, args in view.root.calls:
+            callback(*args)
+        assert view.all_image_paths == [] and view.shown == []
+    print("✓ Stale background loads are ignored")
+
+
+if __name__ == "__main__":
+    print("Testing progressive folder open...\n")
+    tests = [
+        test_first_image_from_names_only,
+        test_worker_delivers_stages_in_order,
+        test_stages_keep_the_view_and_early_labels,
+        test_only_user_edits_override_stored_labels,
+        test_stale_loads_are_ignored,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All progressive open tests passed!")
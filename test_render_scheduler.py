@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the coalescing resize/zoom render scheduler
+"""
+
+import sys
+
+from image_label_tool import RenderScheduler, viewport_source_box
+
+
+class FakeTimers:
+    """Minimal stand-in for root.after / root.after_cancel driven by a manual clock"""
+
+    def __init__(self):
+        self.now = 0
+        self.jobs = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.jobs[self.next_id] = (self.now + ms, func)
+        return self.next_id
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def advance(self, ms):
+        """Move the clock forward, firing due jobs in time order"""
+        end = self.now + ms
+        while True:
+            due = [(when, job_id) for job_id, (when, _) in self.jobs.items() if when <= end]
+            if not due:
+                break
+            when, job_id = min(due)
+            self.now = when
+            _, func = self.jobs.pop(job_id)
+            func()
+        self.now = end
+
+
+def _make_scheduler():
+    timers = FakeTimers()
+    calls = []
+    scheduler = RenderScheduler(timers.after, timers.after_cancel,
+                                lambda: calls.append(("fast", timers.now)),
+                                lambda: calls.append(("full", timers.now)),
+                                frame_ms=16, settle_ms=150)
+    return scheduler, timers, calls
+
+
+def test_burst_is_coalesced():
+    """A drag sending an event every 5 ms draws one preview per frame and one full render"""
+    scheduler, timers, calls = _make_scheduler()
+    for _ in range(40):  # 200 ms of Configure events
+        scheduler.request()
+        timers.advance(5)
+    timers.advance(500)
+
+    fast = [when for kind, when in calls if kind == "fast"]
+    full = [when for kind, when in calls if kind == "full"]
+    assert len(full) == 1, calls
+    assert full[0] >= 195 + 150 - 5  # Only after input went idle
+    assert 1 <= len(fast) <= 200 // 16 + 1
+    # Previews are at least one frame apart
+    assert all(later - earlier >= 16 for earlier, later in zip(fast, fast[1:]))
+    assert not scheduler.pending
+    print("✓ Resize bursts are coalesced into per-frame previews and one full render")
+
+
+def test_single_request_previews_then_refines():
+    """One request draws a fast preview first and the high-quality render later"""
+    scheduler, timers, calls = _make_scheduler()
+    scheduler.request()
+    timers.advance(20)
+    assert calls == [("fast", 16)]
+    timers.advance(200)
+    assert calls == [("fast", 16), ("full", 150)]
+    print("✓ Fast preview is replaced by the full render once idle")
+
+
+def test_cancel_drops_pending_renders():
+    """Cancelling forgets both the preview and the final render"""
+    scheduler, timers, calls = _make_scheduler()
+    scheduler.request()
+    scheduler.cancel()
+    timers.advance(500)
+    assert calls == []
+    assert not scheduler.pending
+    print("✓ Cancel drops pending renders")
+
+
+def test_viewport_source_box():
+    """The visible part of a zoomed image maps back to the right source pixels"""
+    # 2x zoom of a 1000x500 image, viewport partly over the top-left padding
+    display_box, source_box = viewport_source_box((-100, -50, 300, 150), (2000, 1000), (1000, 500))
+    assert display_box == (0, 0, 300, 150)
+    assert source_box == (0.0, 0.0, 150.0, 75.0)
+
+    # Source image may be a reduced decode: coordinates are scaled to its size
+    _, source_box = viewport_source_box((400, 200, 800, 600), (2000, 1000), (250, 125))
+    assert source_box == (50.0, 25.0, 100.0, 75.0)
+
+    # Viewport entirely in the padding
+    assert viewport_source_box((-500, -500, -10, -10), (2000, 1000), (1000, 500)) is None
+    print("✓ Viewport maps to the visible source region")
+
+
+if __name__ == "__main__":
+    print("Testing render scheduler...\n")
+    tests = [
+        test_burst_is_coalesced,
+        test_single_request_previews_then_refines,
+        test_cancel_drops_pending_renders,
+        test_viewport_source_box,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All render scheduler tests passed!")
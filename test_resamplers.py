@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the pluggable display resampling backends
+"""
+
+import sys
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import (RESAMPLERS, RESAMPLE_FAST, RESAMPLE_SHARP, ImagePyramid,
+                              fit_display_size, resample_image)
+
+
+def _gradient_image(width, height, mode="RGB"):
+    """Smooth gradient so all backends should agree closely"""
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None].repeat(width, axis=1)
+    if mode == "L":
+        return Image.fromarray(((x + y) / 2).astype(np.uint8))
+    return Image.fromarray(np.stack([x, y, (x + y) / 2], axis=2).astype(np.uint8))
+
+
+def _mean_difference(a, b):
+    return np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16)).mean()
+
+
+def test_all_backends_agree():
+    """Every backend produces the requested size and an image close to LANCZOS"""
+    for mode in ("RGB", "L"):
+        img = _gradient_image(1200, 900, mode)
+        reference = resample_image(img, (400, 300), mode="pil-lanczos")
+        for name in RESAMPLERS:
+            result = resample_image(img, (400, 300), mode=name)
+            assert result.size == (400, 300), name
+            assert result.mode == mode, name
+            assert _mean_difference(result, reference) < 2.0, name
+    print("✓ All backends produce equivalent downscales")
+
+
+def test_box_resampling_matches_pil():
+    """cv2 backends honour sub-pixel boxes like Pillow does (tiles line up)"""
+    img = _gradient_image(600, 400)
+    box = (100.5, 50.25, 228.5, 178.25)
+    reference = img.resize((256, 256), Image.Resampling.BILINEAR, box=box)
+    for name in ("cv2-linear", "cv2-area"):
+        result = resample_image(img, (256, 256), box=box, mode=name)
+        assert result.size == (256, 256), name
+        assert _mean_difference(result, reference) < 2.0, name
+    print("✓ Box resampling lines up across backends")
+
+
+def test_fast_tiles_match_sharp_tiles():
+    """Tiles rendered with the fast backend look like the sharp ones"""
+    pyramid = ImagePyramid(_gradient_image(800, 600))
+    for zoom in (0.3, 1.0, 2.5):
+        sharp = pyramid.render_tile(zoom, 0, 0, mode=RESAMPLE_SHARP)
+        fast = pyramid.render_tile(zoom, 0, 0, mode=RESAMPLE_FAST)
+        assert sharp.size == fast.size
+        assert _mean_difference(sharp, fast) < 2.0, zoom
+    print("✓ Fast and sharp tiles agree")
+
+
+def test_unsupported_mode_falls_back():
+    """Modes OpenCV cannot take directly still resample"""
+    img = _gradient_image(300, 200).convert("P")
+    result = resample_image(img, (150, 100), mode="cv2-area")
+    assert result.size == (150, 100)
+    print("✓ Palette images fall back to Pillow")
+
+
+def test_fit_display_size_matches_thumbnail():
+    """fit_display_size gives the size thumbnail() would produce"""
+    for source, box in (((4000, 3000), (900, 700)), ((5472, 3648), (1920, 1080)),
+                        ((800, 600), (1200, 900)), ((1000, 4000), (900, 700))):
+        img = Image.new("L", source)
+        img.thumbnail(box)
+        assert fit_display_size(source, box) == img.size, (source, box)
+    print("✓ Fitted size matches thumbnail()")
+
+
+if __name__ == "__main__":
+    print("Testing resampling backends...\n")
+    tests = [
+        test_all_backends_agree,
+        test_box_resampling_matches_pil,
+        test_fast_tiles_match_sharp_tiles,
+        test_unsupported_mode_falls_back,
+        test_fit_display_size_matches_thumbnail,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All resampler tests passed!")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent per-folder thumbnail store and background indexer
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+import image_label_tool
+from image_label_tool import (ThumbnailStore, ThumbnailIndexer, DecodedImageCache, create_thumbnails,
+                              get_file_stamp, load_display_image, THUMBNAIL_CACHE_DIR,
+                              THUMBNAIL_FIT_SIZE, THUMBNAIL_SMALL_SIZE)
+
+
+def _make_images(folder, count, size=(2400, 1800)):
+    """Create camera-sized JPEGs named like camera output"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"{1000 + i:010d}_0001_001_20240101120000.jpg")
+        Image.new("RGB", size, (i * 20 % 255, 80, 160)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_thumbnails_round_trip_and_persist():
+    """Stored thumbnails survive closing and reopening the store"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_images(folder, 1)[0]
+        stamp = get_file_stamp(path)
+
+        store = ThumbnailStore(folder)
+        assert store.enabled
+        create_thumbnails(store, path, stamp)
+        store.close()
+        assert os.path.isdir(os.path.join(folder, THUMBNAIL_CACHE_DIR))
+
+        store = ThumbnailStore(folder)
+        fit, source_size = store.get(path, "fit", stamp)
+        small, _ = store.get(path, "small", stamp)
+        store.close()
+        assert source_size == (2400, 1800)
+        assert fit.width <= THUMBNAIL_FIT_SIZE[0] and fit.height <= THUMBNAIL_FIT_SIZE[1]
+        assert fit.size == (1280, 960)
+        assert small.width <= THUMBNAIL_SMALL_SIZE[0] and small.height <= THUMBNAIL_SMALL_SIZE[1]
+    print("✓ Thumbnails persist across reopen")
+
+
+def test_stale_thumbnail_is_invalidated():
+    """Rewriting the source image makes its thumbnails a miss"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_images(folder, 1)[0]
+        store = ThumbnailStore(folder)
+        create_thumbnails(store, path)
+        old_stamp = get_file_stamp(path)
+
+        Image.new("RGB", (800, 600)).save(path)
+        os.utime(path, ns=(old_stamp[0] + 10**9, old_stamp[0] + 10**9))
+        new_stamp = get_file_stamp(path)
+        assert store.get(path, "fit", new_stamp) is None
+        # The stale entry is gone, not just skipped
+        assert store.get(path, "fit", old_stamp) is None
+        store.close()
+    print("✓ Stale thumbnails are invalidated")
+
+
+def test_indexer_fills_store():
+    """The background indexer thumbnails every image and skips ones already done"""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _make_images(folder, 3)
+        store = ThumbnailStore(folder)
+        indexer = ThumbnailIndexer(store, paths, pause=0)
+        assert indexer.wait(timeout=30)
+        assert indexer.indexed == 3
+        for path in paths:
+            assert store.info(path, "fit", get_file_stamp(path)) is not None
+
+        again = ThumbnailIndexer(store, paths, pause=0)
+        assert again.wait(timeout=30)
+        assert again.indexed == 0
+        store.close()
+    print("✓ Indexer fills the store once")
+
+
+def test_fit_display_served_from_thumbnail():
+    """Fit mode uses the stored thumbnail when it covers the canvas, 1:1 mode still decodes"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_images(folder, 1)[0]
+        store = ThumbnailStore(folder)
+        create_thumbnails(store, path)
+        thumb_size = store.info(path, "fit", get_file_stamp(path))[0]
+
+        cache = DecodedImageCache(budget_bytes=100 * 1024 * 1024)
+        img, source_size = load_display_image(cache, path, fit_size=(900, 700), thumbnails=store)
+        assert img.size == thumb_size
+        assert source_size == (2400, 1800)
+
+        # A canvas larger than the thumbnail needs a real decode
+        cache.clear()
+        img, _ = load_display_image(cache, path, fit_size=(2400, 1800), thumbnails=store)
+        assert img.size == (2400, 1800)
+
+        full, _ = load_display_image(cache, path, thumbnails=store)
+        assert full.size == (2400, 1800)
+        store.close()
+    print("✓ Fitted display reads the thumbnail instead of decoding")
+
+
+def _wasteful_store(folder):
+    """A closed store whose pack is mostly dropped blobs; returns (kept path, its stamp, pack size)"""
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(6):
+        path = os.path.join(folder, f"{2000 + i:010d}_0001_001_20240101120000.jpg")
+        Image.fromarray(rng.integers(0, 256, (900, 1200, 3), dtype=np.uint8)).save(path, quality=95)
+        paths.append(path)
+    store = ThumbnailStore(folder)
+    for path in paths:
+        create_thumbnails(store, path, get_file_stamp(path))
+    for path in paths[1:]:
+        assert store.get(path, "fit", None) is None  # Drops the entry, its blob stays in the pack
+    store.close()
+    pack_size = os.path.getsize(store.pack_path)
+    assert pack_size >= 1024 * 1024
+    return paths[0], get_file_stamp(paths[0]), pack_size
+
+
+def test_pack_compaction_is_transactional():
+    """Compaction keeps the live thumbnails readable, and a failed replace leaves the old pack in use"""
+    with tempfile.TemporaryDirectory() as folder:
+        path, stamp, pack_size = _wasteful_store(folder)
+        expected = ThumbnailStore(folder)
+        pack_path = expected.pack_path
+        fit, _ = expected.get(path, "fit", stamp)
+        expected.close()
+        assert os.path.getsize(pack_path) < pack_size
+
+    with tempfile.TemporaryDirectory() as folder:
+        path, stamp, pack_size = _wasteful_store(folder)
+        replace = image_label_tool.os.replace
+
+        def failing_replace(src, dst):
+            if dst.endswith(ThumbnailStore.PACK_NAME):
+                raise OSError("disk full")
+            return replace(src, dst)
+
+        image_label_tool.os.replace = failing_replace
+        try:
+            store = ThumbnailStore(folder)
+        finally:
+            image_label_tool.os.replace = replace
+        assert store.enabled and os.path.getsize(store.pack_path) == pack_size
+        assert not os.path.exists(store.pack_path + ".tmp")
+        kept, _ = store.get(path, "fit", stamp)
+        assert kept.size == fit.size
+        assert np.abs(np.asarray(kept, dtype=int) - np.asarray(fit, dtype=int)).max() <= 1
+        store.close()
+    print("✓ Pack compaction only swaps offsets once the new pack is in place")
+
+
+def test_unwritable_folder_disables_store():
+    """A folder where the sidecar cannot be created just runs without thumbnails"""
+    with tempfile.TemporaryDirectory() as folder:
+        # A file where the cache directory should go makes makedirs fail
+        open(os.path.join(folder, THUMBNAIL_CACHE_DIR), "w").close()
+        store = ThumbnailStore(folder)
+        assert not store.enabled
+        assert store.get(os.path.join(folder, "x.jpg"), "fit", (1, 1)) is None
+        store.close()
+    print("✓ Store disables itself when the folder is not writable")
+
+
+if __name__ == "__main__":
+    print("Testing thumbnail store...\n")
+    tests = [
+        test_thumbnails_round_trip_and_persist,
+        test_stale_thumbnail_is_invalidated,
+        test_indexer_fills_store,
+        test_fit_display_served_from_thumbnail,
+        test_pack_compaction_is_transactional,
+        test_unwritable_folder_disables_store,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All thumbnail store tests passed!")
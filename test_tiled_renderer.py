@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the viewport-tiled zoom renderer (resolution pyramid + tile selection)
+"""
+
+import sys
+
+import numpy as np
+from PIL import Image
+
+from image_label_tool import ImagePyramid, visible_tile_indices, TILE_SIZE
+
+
+def _gradient_image(width, height):
+    """Smooth RGB gradient so resampled tiles can be compared with a whole-image resize"""
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None].repeat(width, axis=1)
+    rgb = np.stack([x, y, (x + y) / 2], axis=2).astype(np.uint8)
+    return Image.fromarray(rgb)
+
+
+def test_visible_tiles_cover_viewport():
+    """Only tiles intersecting the viewport are selected"""
+    tiles = visible_tile_indices((0, 0, 300, 200), (2000, 1000), tile_size=256)
+    assert tiles == [(0, 0), (1, 0)]
+
+    tiles = visible_tile_indices((300, 300, 700, 520), (2000, 1000), tile_size=256)
+    assert tiles == [(1, 1), (2, 1), (1, 2), (2, 2)]
+
+    # Viewport partly outside the image is clamped to existing tiles
+    tiles = visible_tile_indices((-500, -500, 100, 100), (2000, 1000), tile_size=256)
+    assert tiles == [(0, 0)]
+    print("✓ Visible tiles match the viewport")
+
+
+def test_margin_adds_surrounding_ring():
+    """The prefetch margin adds one ring of neighbouring tiles"""
+    tiles = visible_tile_indices((512, 512, 768, 768), (2560, 2560), tile_size=256, margin=1)
+    assert len(tiles) == 9
+    assert (1, 1) in tiles and (3, 3) in tiles
+    print("✓ Margin adds a ring of tiles")
+
+
+def test_pyramid_level_selection():
+    """Zooming out uses a reduced level instead of the full frame"""
+    pyramid = ImagePyramid(Image.new("L", (4000, 3000)))
+    level, factor = pyramid.level_for_zoom(2.0)
+    assert factor == 1 and level.size == (4000, 3000)
+
+    level, factor = pyramid.level_for_zoom(0.3)
+    assert factor == 2 and level.size == (2000, 1500)
+
+    level, factor = pyramid.level_for_zoom(0.1)
+    assert factor == 8 and level.size == (500, 375)
+
+    # Levels are built once and reused
+    again, _ = pyramid.level_for_zoom(0.1)
+    assert again is level
+    print("✓ Pyramid picks the smallest sufficient level")
+
+
+def test_tiles_match_whole_image_resize():
+    """Stitched tiles look like the old whole-image LANCZOS resize"""
+    base = _gradient_image(600, 400)
+    pyramid = ImagePyramid(base)
+    zoom = 1.5
+    display_size = pyramid.display_size(zoom)
+    reference = np.asarray(base.resize(display_size, Image.Resampling.LANCZOS), dtype=np.int16)
+
+    for column, row in visible_tile_indices((0, 0) + display_size, display_size, tile_size=128):
+        tile = pyramid.render_tile(zoom, column, row, tile_size=128)
+        left, top = column * 128, row * 128
+        expected = reference[top:top + tile.height, left:left + tile.width]
+        difference = np.abs(np.asarray(tile, dtype=np.int16) - expected)
+        assert difference.mean() < 1.0, f"tile {column},{row} differs by {difference.mean():.2f}"
+    print("✓ Tiles reproduce the full-image resize")
+
+
+def test_tile_outside_image_is_none():
+    """Requests beyond the zoomed image return no tile"""
+    pyramid = ImagePyramid(Image.new("RGB", (100, 100)))
+    assert pyramid.render_tile(1.0, 5, 0) is None
+    edge = pyramid.render_tile(3.0, 1, 1)
+    assert edge.size == (300 - TILE_SIZE, 300 - TILE_SIZE)
+    print("✓ Edge tiles are clipped to the image")
+
+
+if __name__ == "__main__":
+    print("Testing tiled zoom renderer...\n")
+    tests = [
+        test_visible_tiles_cover_viewport,
+        test_margin_adds_surrounding_ring,
+        test_pyramid_level_selection,
+        test_tiles_match_whole_image_resize,
+        test_tile_outside_image_is_none,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All tiled renderer tests passed!")
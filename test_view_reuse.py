@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for reusing the shown image's decoded/enhanced buffer across zoom, resize and relabel
+"""
+
+import os
+import sys
+import tempfile
+
+from PIL import Image
+
+from image_label_tool import ImageLabelTool, ContrastEnhancer
+
+
+class _ViewOnly:
+    """Just the view-source part of ImageLabelTool, so it can be tested without a display"""
+
+    get_view_image = ImageLabelTool.get_view_image
+    _hold_view_image = ImageLabelTool._hold_view_image
+    get_view_variant = ImageLabelTool.get_view_variant
+    _enhanced_key = ImageLabelTool._enhanced_key
+    apply_histogram_equalization = ImageLabelTool.apply_histogram_equalization
+
+    def __init__(self):
+        self._view_source = None
+        self.display_window = None
+        self._image_page = None
+        self.contrast_enhancer = ContrastEnhancer()
+        self.decodes = 0
+
+    def get_decoded_image(self, path, fit_size=None, page=0, window=None):
+        self.decodes += 1
+        img = Image.open(path)
+        img.load()
+        if fit_size:
+            img = img.reduce(2)
+        return img, Image.open(path).size
+
+
+def _make_image(folder, name="0000000001_0001_001_20240101120000.jpg"):
+    path = os.path.join(folder, name)
+    Image.new("RGB", (1200, 900), (90, 100, 110)).save(path)
+    return path
+
+
+def test_held_buffer_is_reused():
+    """Repeated views of the same image at the same resolution do not decode again"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_image(folder)
+        view = _ViewOnly()
+        fitted, size = view.get_view_image(path, (500, 400))
+        again, _ = view.get_view_image(path, (520, 410))  # Window resized a little
+        assert again is fitted and size == (1200, 900)
+
+        full, _ = view.get_view_image(path, None)  # Zoom to 1:1
+        full_again, _ = view.get_view_image(path, None)
+        assert full_again is full
+        assert view.decodes == 2
+    print("✓ Held decode is reused for the shown image")
+
+
+def test_enhanced_buffer_is_held_separately():
+    """Hist EQ keeps its own held buffer next to the plain one"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = _make_image(folder)
+        view = _ViewOnly()
+        plain, _ = view.get_view_image(path, (500, 400))
+        enhanced, _ = view.get_view_image(path, (500, 400), histogram_eq=True)
+        assert enhanced is not plain
+        assert view.get_view_image(path, (500, 400), histogram_eq=True)[0] is enhanced
+        assert view.get_view_image(path, (500, 400))[0] is plain
+    print("✓ Enhanced buffer is held alongside the plain one")
+
+
+def test_other_image_or_rewrite_releases_buffer():
+    """Showing another image, or rewriting the file, drops the held buffers"""
+    with tempfile.TemporaryDirectory() as folder:
+        first = _make_image(folder)
+        second = _make_image(folder, "0000000002_0001_001_20240101120000.jpg")
+        view = _ViewOnly()
+        view.get_view_image(first, None)
+        view.get_view_image(second, None)
+        assert view._view_source['path'] == second
+
+        stamp_before = os.stat(second).st_mtime_ns
+        Image.new("RGB", (1200, 900), (0, 0, 0)).save(second)
+        os.utime(second, ns=(stamp_before + 10**9, stamp_before + 10**9))
+        decodes = view.decodes
+        view.get_view_image(second, None)
+        assert view.decodes == decodes + 1
+    print("✓ Held buffers follow the shown image")
+
+
+if __name__ == "__main__":
+    print("Testing view source reuse...\n")
+    tests = [
+        test_held_buffer_is_reused,
+        test_enhanced_buffer_is_held_separately,
+        test_other_image_or_rewrite_releases_buffer,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All view reuse tests passed!")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test script for workspaces (folder tree discovery, background indexing, per-folder label CSVs)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from image_label_tool import (LABEL_JOURNAL_NAME, FilenameCatalog, ImageLabelTool, Workspace,
+                              find_latest_revision_csv, iter_image_folders)
+
+
+def _touch(path, data=b"x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _make_tree(root):
+    """root/2024-03/{01,02}/line{1,2} with a few images each, plus non-image folders"""
+    for day in ("01", "02"):
+        for line in ("line1", "line2"):
+            for i in range(3):
+                _touch(os.path.join(root, "2024-03", day, line, f"{i:010d}_0001_001_120000.jpg"))
+    _touch(os.path.join(root, "2024-03", "notes", "readme.txt"))
+    _touch(os.path.join(root, ".labeltool_cache", "hidden.jpg"))
+
+
+def _scan(workspace):
+    """Run the background scan and register every folder, like the tool does on the Tk thread"""
+    done = threading.Event()
+    workspace.start(lambda: None, done.set)
+    assert done.wait(10), "workspace scan did not finish"
+    folders = []
+    while not workspace.delivered.empty():
+        folder, index, _, _ = workspace.delivered.get_nowait()
+        workspace.add(folder, index, os.path.join(folder, "revision_20240301_000000.csv"))
+        folders.append(folder)
+    return folders
+
+
+class _WorkspaceLabels:
+    """The label store of the tool, without any Tk widgets"""
+
+    get_filename_info = ImageLabelTool.get_filename_info
+    get_session_number = ImageLabelTool.get_session_number
+    get_image_sort_key = ImageLabelTool.get_image_sort_key
+    _revision_csv_rows = ImageLabelTool._revision_csv_rows
+    _write_revision_csv = ImageLabelTool._write_revision_csv
+    save_workspace_csvs = ImageLabelTool.save_workspace_csvs
+    _load_csv_file = ImageLabelTool._load_csv_file
+
+    def __init__(self, workspace):
+        self.workspace = workspace
+        self.folder_path = workspace.root
+        self.filename_catalog = FilenameCatalog()
+        self.labels = {}
+        self.ocr_readable = {}
+        self.false_noread = {}
+        self.comments = {}
+
+
+def test_tree_discovery_order():
+    """Only folders holding images are found, depth-first in name order, hidden folders skipped"""
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+        found = [os.path.relpath(folder, root) for folder in iter_image_folders(root)]
+        expected = [os.path.join("2024-03", day, line) for day in ("01", "02") for line in ("line1", "line2")]
+        assert found == expected, found
+        assert list(iter_image_folders(root, max_depth=2)) == []
+    print("✓ Image folders of the tree are discovered in order")
+
+
+def test_workspace_merges_folders_in_tree_order():
+    """Folder indexes are built in the background; the merged list is ordered folder by folder"""
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+        workspace = Workspace(root)
+        folders = _scan(workspace)
+        assert len(folders) == 4 and len(workspace.paths()) == 12 and workspace.image_count() == 12
+        # Each folder index is persisted in that folder's sidecar cache
+        assert all(os.path.isfile(os.path.join(f, ".labeltool_cache", "folder_index.json")) for f in folders)
+
+        view = _WorkspaceLabels(workspace)
+        shuffled = sorted(workspace.paths(), key=os.path.basename)
+        ordered = sorted(shuffled, key=view.get_image_sort_key)
+        assert [os.path.dirname(p) for p in ordered[::3]] == folders
+    print("✓ Workspace folders are merged in tree order")
+
+
+def test_labels_are_saved_per_folder():
+    """Each folder gets its own revision CSV, written only when its rows change, and reads back alone"""
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+        workspace = Workspace(root)
+        folders = _scan(workspace)
+        view = _WorkspaceLabels(workspace)
+        first, second = workspace.indexes[folders[0]].paths()[0], workspace.indexes[folders[2]].paths()[0]
+        view.labels = {first: "no label", second: "read failure"}
+        view.save_workspace_csvs({}, {})
+        written = [f for f in folders if find_latest_revision_csv(f)]
+        assert written == [folders[0], folders[2]], written
+
+        # Unchanged folders are not rewritten
+        os.remove(find_latest_revision_csv(folders[0]))
+        view.labels[second] = "incomplete"
+        view.save_workspace_csvs({}, {})
+        assert find_latest_revision_csv(folders[0]) is None
+
+        # A folder's CSV holds paths relative to that folder, as when it is opened on its own
+        reloaded = _WorkspaceLabels(workspace)
+        reloaded.folder_path = folders[2]
+        reloaded._load_csv_file(find_latest_revision_csv(folders[2]))
+        assert reloaded.labels == {second: "incomplete"}
+    print("✓ Labels are kept in one revision CSV per folder")
+
+
+def test_labels_are_read_by_the_scan():
+    """Each folder's revision CSV and journal are read in the scan thread and delivered with its index"""
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+        folder = os.path.join(root, "2024-03", "01", "line2")
+        image = os.path.join(folder, "0000000001_0001_001_120000.jpg")
+        other = os.path.join(folder, "0000000002_0001_001_120000.jpg")
+        with open(os.path.join(folder, "revision_20240301_000000.csv"), "w", encoding="utf-8") as f:
+            f.write("image_path,image_label\n0000000001_0001_001_120000.jpg,no label\n")
+        with open(os.path.join(folder, LABEL_JOURNAL_NAME), "w", encoding="utf-8") as f:
+            f.write('{"path": "0000000002_0001_001_120000.jpg", "label": "read failure"}\n')
+
+        workspace = Workspace(root)
+        notified = []
+        done = threading.Event()
+        workspace.start(lambda: notified.append(threading.current_thread().name), done.set)
+        assert done.wait(10), "workspace scan did not finish"
+        delivered = {}
+        while not workspace.delivered.empty():
+            item = workspace.delivered.get_nowait()
+            delivered[item[0]] = item[2:]
+        assert len(notified) == 4 and set(notified) == {"WorkspaceIndexer"}
+        (labels, _, _, _), replayed = delivered[folder]
+        assert labels == {image: "no label", other: "read failure"} and replayed == 1
+        assert delivered[os.path.join(root, "2024-03", "01", "line1")] == (({}, {}, {}, {}), 0)
+    print("✓ Stored labels are read by the scan thread")
+
+
+def test_stopped_scan_delivers_nothing_more():
+    """Closing a workspace stops the background scan"""
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+        workspace = Workspace(root)
+        workspace.stop()
+        delivered = []
+        workspace.start(lambda: delivered.append(True), lambda: delivered.append(None))
+        time.sleep(0.5)
+        assert delivered == [] and workspace.delivered.empty()
+    print("✓ Stopped workspaces do not deliver folders")
+
+
+if __name__ == "__main__":
+    print("Testing workspaces...\n")
+    tests = [
+        test_tree_discovery_order,
+        test_workspace_merges_folders_in_tree_order,
+        test_labels_are_saved_per_folder,
+        test_labels_are_read_by_the_scan,
+        test_stopped_scan_delivers_nothing_more,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} failed: {e}")
+    if failed:
+        print(f"\n{failed} test(s) failed")
+        sys.exit(1)
+    print("\n🎉 All workspace tests passed!")